@@ -0,0 +1 @@
+"""Performance benchmarks for REPL Space Miner. Run modules with ``python -m benchmarks.<name>``."""
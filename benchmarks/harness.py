@@ -0,0 +1,161 @@
+"""
+Timing, memory and reporting helpers shared by the benchmark suite.
+
+A benchmark case is a function run repeatedly on state built by a setup
+function, so that every timed run starts from the same state and the setup
+cost stays out of the timings. Each case is timed over a number of runs and
+then run once more under tracemalloc to record its peak memory, keeping the
+tracing overhead out of the timings.
+
+Results are plain dicts that can be written to and compared against a JSON
+baseline.
+"""
+
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+    ops_per_run: int = 1  # Operations one run performs, for ops/sec
+    repeat: Optional[int] = None  # Overrides the suite's repeat count
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Linearly interpolated percentile of values, e.g. fraction=0.95 for p95."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(case: BenchmarkCase, repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    """Time case over repeat runs after warmup untimed ones and measure its peak memory."""
+    repeat = case.repeat or repeat
+    for _ in range(warmup):
+        case.run(case.setup())
+
+    timings: List[float] = []
+    for _ in range(repeat):
+        state = case.setup()
+        start = time.perf_counter()
+        case.run(state)
+        timings.append(time.perf_counter() - start)
+
+    state = case.setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline_memory, _ = tracemalloc.get_traced_memory()
+        case.run(state)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    total = sum(timings)
+    return {
+        "name": case.name,
+        "runs": repeat,
+        "ops_per_run": case.ops_per_run,
+        "ops_per_sec": case.ops_per_run * repeat / total if total > 0 else math.inf,
+        "mean_ms": total / repeat * 1000,
+        "p50_ms": percentile(timings, 0.50) * 1000,
+        "p95_ms": percentile(timings, 0.95) * 1000,
+        "min_ms": min(timings) * 1000,
+        "peak_memory_kb": (peak_memory - baseline_memory) / 1024,
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def write_results(path: str, results: List[Dict[str, Any]], meta: Dict[str, Any]) -> None:
+    with open(path, "w") as results_file:
+        json.dump({"meta": meta, "results": results}, results_file, indent=2)
+        results_file.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read a results file written by write_results, keyed by case name."""
+    with open(path) as results_file:
+        data = json.load(results_file)
+    return {result["name"]: result for result in data["results"]}
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """
+    Compare results to a baseline by p50 time.
+
+    A case counts as a regression when its p50 is more than threshold (a
+    fraction) slower than the baseline's, and as an improvement when it is
+    more than threshold faster. Cases missing from the baseline are skipped.
+    """
+    rows = []
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None or previous["p50_ms"] <= 0:
+            continue
+        ratio = result["p50_ms"] / previous["p50_ms"]
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append({
+            "name": result["name"],
+            "baseline_p50_ms": previous["p50_ms"],
+            "p50_ms": result["p50_ms"],
+            "ratio": ratio,
+            "memory_ratio": (
+                result["peak_memory_kb"] / previous["peak_memory_kb"]
+                if previous.get("peak_memory_kb") else None
+            ),
+            "verdict": verdict,
+        })
+    return rows
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    lines = [
+        f"{'case':<32} {'ops/sec':>12} {'p50 ms':>10} {'p95 ms':>10} {'peak KiB':>10}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['name']:<32} {result['ops_per_sec']:>12.1f} "
+            f"{result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} "
+            f"{result['peak_memory_kb']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'case':<32} {'base p50':>10} {'p50':>10} {'ratio':>7}  verdict"]
+    for row in rows:
+        lines.append(
+            f"{row['name']:<32} {row['baseline_p50_ms']:>10.3f} {row['p50_ms']:>10.3f} "
+            f"{row['ratio']:>7.2f}  {row['verdict']}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,81 @@
+"""
+Benchmark region generation at increasing sizes.
+
+By default systems are kept as lazy stubs so the timings measure placement,
+naming and template selection rather than the generation of each system's
+contents. With --workers the systems are generated eagerly on that many
+processes instead.
+
+Usage:
+    python -m benchmarks.region_generation [--sizes 1000 10000 100000] [--min-distance 2.0] [--workers N]
+"""
+
+import argparse
+import time
+from typing import List, Optional, Sequence
+
+from src.classes.region import Region
+from src.helpers import seed_rng
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def time_region_generation(
+    num_systems: int,
+    min_distance: float = 2.0,
+    seed: int = 0,
+    workers: Optional[int] = None,
+) -> float:
+    """
+    Generate a region with num_systems systems and return the elapsed seconds.
+
+    The region is lazy unless workers is given, in which case every system is
+    generated up front on that many processes.
+    """
+    seed_rng(seed)
+    start = time.perf_counter()
+    region = Region.generate_random_region(
+        "Benchmark Sector",
+        num_systems,
+        min_distance,
+        lazy=workers is None,
+        seed=seed,
+        workers=workers or 1,
+    )
+    elapsed = time.perf_counter() - start
+    assert len(region.solar_systems) == num_systems
+    return elapsed
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Region generation benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+        help="Region sizes (number of systems) to generate",
+    )
+    parser.add_argument(
+        "--min-distance", type=float, default=2.0,
+        help="Minimum distance between systems in light years",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Generate systems eagerly on this many processes",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> List[float]:
+    args = parse_arguments(argv)
+    results = []
+    for size in args.sizes:
+        elapsed = time_region_generation(
+            size, args.min_distance, args.seed, args.workers
+        )
+        results.append(elapsed)
+        print(f"{size:>8} systems: {elapsed:8.3f}s ({elapsed / size * 1e6:8.1f} us/system)")
+    return results
+
+
+if __name__ == "__main__":
+    main()
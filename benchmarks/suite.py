@@ -0,0 +1,411 @@
+"""
+Benchmark the game's hot paths on a seeded, headless game.
+
+The game is built the way --skipc starts it, without reading stdin or
+loading pygame, and everything the benchmarked code prints is discarded.
+Covers region generation, mining, cargo hold updates, trade route search,
+saving and loading, market network updates and trades, ore refining and
+skipping a year of game time.
+
+Results are printed as a table and can be written as JSON with --output.
+Given a --baseline written that way, cases whose p50 time got more than
+--threshold slower are reported as regressions and the exit status is 1.
+
+Usage:
+    python -m benchmarks.suite [--only mine cargo] [--repeat 20] [--seed 0]
+                               [--output results.json] [--baseline baseline.json]
+                               [--threshold 0.2] [--list]
+"""
+
+import argparse
+import contextlib
+import dataclasses
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from benchmarks.harness import (
+    BenchmarkCase,
+    compare,
+    environment,
+    format_comparison,
+    format_results,
+    load_results,
+    measure,
+    write_results,
+)
+from src.classes.asteroid import AsteroidField
+from src.classes.cargo_hold import CargoHold
+from src.classes.game import Game
+from src.classes.market_data import StationMarket
+from src.classes.market_network import MarketEventType, MarketNetwork
+from src.classes.market_simulator import MarketOrder, MarketSimulator
+from src.classes.ore import ORES, Ore
+from src.classes.refining_stage import RefiningStage
+from src.classes.region import Region
+from src.commands.price_compare import find_best_trade_routes
+from src.commands.wait import wait_command
+from src.events.character_creation import quick_start
+from src.helpers import Vector2, derive_rng, seed_rng
+
+MINING_TIMES = [60, 3_600, 100_000]
+CARGO_STACKS = [10, 100, 1_000]
+CARGO_OPERATIONS = 1_000
+SAVE_NAME = "benchmark.json"
+YEAR_SECONDS = 365 * 86400
+LARGE_NETWORK_STATIONS = 1_000
+LARGE_NETWORK_EVENTS = 100
+LARGE_NETWORK_ITEMS = 50
+REPORT_MARKETS = 20
+REPORT_ITEMS = 250
+BASKET_ORDERS = 500
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Discard everything printed inside the block."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+@contextlib.contextmanager
+def working_directory(path: str) -> Iterator[None]:
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def build_game(seed: int) -> Game:
+    """A seeded game with the quick start character, docked at its start station."""
+    with quiet():
+        game = Game(mute_flag=True, skip_customization=True, seed=seed)
+        quick_start(game)
+        ship = game.player_ship
+        if game.rnd_station is not None:
+            ship.space_object.position = game.rnd_station.position.copy()
+            ship.dock_into_station(game.rnd_station)
+    return game
+
+
+def region_cases(seed: int) -> List[BenchmarkCase]:
+    def generate(num_systems: int, lazy: bool):
+        def run(_: Any) -> None:
+            Region.generate_random_region(
+                "Benchmark Sector", num_systems, lazy=lazy, seed=seed
+            )
+        return run
+
+    return [
+        BenchmarkCase("region_generation_lazy_1000", generate(1_000, True), repeat=5),
+        BenchmarkCase("region_generation_eager_50", generate(50, False), repeat=3),
+    ]
+
+
+def mining_cases(game: Game, seed: int) -> List[BenchmarkCase]:
+    ship = game.player_ship
+    ores = list(ORES.values())[:4]
+
+    def setup() -> AsteroidField:
+        ship.cargo_hold = CargoHold(1e9)
+        return AsteroidField(200, ores, 0.1, Vector2(0, 0), rng=derive_rng(seed, "benchmark", "field"))
+
+    def mine(time_to_mine: int):
+        def run(field: AsteroidField) -> None:
+            with quiet():
+                ship.mine_belt(game, field, time_to_mine, False, None)
+        return run
+
+    cases = [
+        BenchmarkCase(f"mine_belt_{time_to_mine}s", mine(time_to_mine), setup)
+        for time_to_mine in MINING_TIMES
+    ]
+
+    def run_until_full(field: AsteroidField) -> None:
+        ship.cargo_hold = CargoHold(10_000.0)
+        with quiet():
+            ship.mine_belt(game, field, 0, True, None)
+
+    cases.append(BenchmarkCase("mine_belt_until_full_10000m3", run_until_full, setup))
+    return cases
+
+
+def cargo_items(count: int) -> List[Ore]:
+    """count ores with distinct commodity ids, so that each gets a stack of its own."""
+    templates = list(ORES.values())
+    items = []
+    for index in range(count):
+        template = templates[index % len(templates)]
+        commodity = dataclasses.replace(
+            template.commodity,
+            commodity_id=100_000 + index,
+            name=f"{template.commodity.name} {index}",
+        )
+        items.append(dataclasses.replace(template, commodity=commodity))
+    return items
+
+
+def cargo_cases() -> List[BenchmarkCase]:
+    cases = []
+    for stacks in CARGO_STACKS:
+        items = cargo_items(stacks)
+        item_ids = [str(item.commodity.commodity_id) for item in items]
+
+        def setup(items: List[Ore] = items) -> CargoHold:
+            hold = CargoHold(1e9)
+            for item in items:
+                hold.add_item(item, 10)
+            return hold
+
+        def run(hold: CargoHold, items: List[Ore] = items, item_ids: List[str] = item_ids) -> None:
+            for operation in range(CARGO_OPERATIONS):
+                index = operation % len(items)
+                hold.add_item(items[index], 1, 1.0, 1.0)
+                hold.remove_item(item_ids[index], 1)
+
+        cases.append(BenchmarkCase(
+            f"cargo_add_remove_{stacks}_stacks", run, setup,
+            ops_per_run=2 * CARGO_OPERATIONS,
+        ))
+    return cases
+
+
+def trade_route_cases(game: Game) -> List[BenchmarkCase]:
+    def run(_: Any) -> None:
+        with quiet():
+            find_best_trade_routes(game, 10, True)
+
+    return [BenchmarkCase("find_best_trade_routes", run)]
+
+
+def save_load_cases(game: Game, directory: str) -> List[BenchmarkCase]:
+    def save(_: Any) -> None:
+        with working_directory(directory), quiet():
+            game.save_game(SAVE_NAME)
+
+    def load(_: Any) -> None:
+        with working_directory(directory), quiet():
+            loaded = Game.load_game(game.ui, SAVE_NAME)
+        assert loaded is not None
+
+    return [
+        BenchmarkCase("save_game", save, repeat=5),
+        BenchmarkCase("load_game", load, repeat=3),
+    ]
+
+
+def build_market_network(seed: int, markets: int = 20, items: int = 30) -> MarketNetwork:
+    seed_rng(seed)
+    network = MarketNetwork()
+    for market_index in range(markets):
+        market = StationMarket(f"station_{market_index}", market_size=random.uniform(0.5, 3.0))
+        for item_index in range(items):
+            market.add_market_item(f"item_{item_index}", random.uniform(10.0, 500.0))
+        network.add_market(market)
+    for market_index in range(markets):
+        for offset in (1, 3):
+            network.add_connection(
+                f"station_{market_index}",
+                f"station_{(market_index + offset) % markets}",
+                random.uniform(0.2, 1.0),
+                random.uniform(1.0, 30.0),
+            )
+    return network
+
+
+def build_large_market_network(seed: int) -> MarketNetwork:
+    """A LARGE_NETWORK_STATIONS station network with a few events spreading through it."""
+    network = build_market_network(seed, LARGE_NETWORK_STATIONS, items=2)
+    for event_index in range(LARGE_NETWORK_EVENTS):
+        network.create_market_event(
+            MarketEventType.DEMAND_SURGE,
+            f"station_{event_index * LARGE_NETWORK_STATIONS // LARGE_NETWORK_EVENTS}",
+            ["item_0"],
+            0.8,
+        )
+    return network
+
+
+def market_cases(seed: int) -> List[BenchmarkCase]:
+    def run(network: MarketNetwork) -> None:
+        network.update_network(3_600.0)
+
+    def tick(network: MarketNetwork) -> None:
+        # A one second tick leaves little for the per-market simulation to
+        # do, so this mostly times event propagation
+        network.update_network(1.0)
+
+    def advance_year(network: MarketNetwork) -> None:
+        network.advance_time(YEAR_SECONDS)
+
+    def dock_after_hour(network: MarketNetwork) -> None:
+        # Only the market docked at is simulated; the rest just keep time
+        network.sync(network.current_time + 3_600.0)
+        network.get_market("station_0")
+
+    return [
+        BenchmarkCase(
+            "market_network_update", run, lambda: build_market_network(seed), repeat=50
+        ),
+        BenchmarkCase(
+            "market_network_advance_1y", advance_year, lambda: build_market_network(seed),
+            repeat=10,
+        ),
+        BenchmarkCase(
+            f"market_network_tick_{LARGE_NETWORK_STATIONS}_stations", tick,
+            lambda: build_large_market_network(seed), repeat=10,
+        ),
+        BenchmarkCase(
+            f"market_network_tick_{LARGE_NETWORK_STATIONS}x{LARGE_NETWORK_ITEMS}_items", tick,
+            lambda: build_market_network(seed, LARGE_NETWORK_STATIONS, LARGE_NETWORK_ITEMS),
+            repeat=10,
+        ),
+        BenchmarkCase(
+            f"market_network_dock_{LARGE_NETWORK_STATIONS}x{LARGE_NETWORK_ITEMS}_items",
+            dock_after_hour,
+            lambda: build_market_network(seed, LARGE_NETWORK_STATIONS, LARGE_NETWORK_ITEMS),
+            repeat=10,
+        ),
+    ]
+
+
+def market_report_cases(seed: int) -> List[BenchmarkCase]:
+    def setup() -> MarketNetwork:
+        network = build_market_network(seed, markets=REPORT_MARKETS, items=REPORT_ITEMS)
+        for _ in range(3):
+            network.update_network(3_600.0)
+        return network
+
+    def run(network: MarketNetwork) -> None:
+        for station_id, market in network.markets.items():
+            market.get_market_summary()
+            network.simulators[station_id].get_market_health()
+
+    return [BenchmarkCase(
+        f"market_reports_{REPORT_MARKETS * REPORT_ITEMS}_items", run, setup, repeat=10
+    )]
+
+
+def market_order_cases(seed: int) -> List[BenchmarkCase]:
+    def setup() -> MarketSimulator:
+        network = build_market_network(seed, markets=1, items=REPORT_ITEMS)
+        return network.simulators["station_0"]
+
+    # A cargo hold's worth of sales: mostly small stacks, which were priced
+    # one unit at a time, and a few bulk ones
+    rng = random.Random(seed)
+    orders = [
+        MarketOrder(
+            f"item_{rng.randrange(REPORT_ITEMS)}",
+            rng.choice([rng.uniform(1.0, 9.9), rng.uniform(10.0, 5_000.0)]),
+            is_buy=False,
+        )
+        for _ in range(BASKET_ORDERS)
+    ]
+
+    def run(simulator: MarketSimulator) -> None:
+        simulator.process_orders(orders)
+
+    return [BenchmarkCase(f"market_sell_basket_{BASKET_ORDERS}_orders", run, setup, repeat=20)]
+
+
+def time_skip_cases(game: Game) -> List[BenchmarkCase]:
+    def run(_: Any) -> None:
+        with quiet():
+            wait_command(game, "1y")
+
+    return [BenchmarkCase("wait_1y", run)]
+
+
+def refining_cases() -> List[BenchmarkCase]:
+    stage = RefiningStage()
+    inputs = {ore_id: 100.0 for ore_id in ORES}
+    skills = {"engineering": 0.6, "chemistry": 0.4, "equipment_operation": 0.5}
+
+    def run(_: Any) -> None:
+        stage.process(inputs, 0.8, skills, batch_size=10.0)
+
+    return [BenchmarkCase("refining_stage_process", run, repeat=200)]
+
+
+def build_cases(seed: int, directory: str) -> List[BenchmarkCase]:
+    game = build_game(seed)
+    return [
+        *region_cases(seed),
+        *mining_cases(game, seed),
+        *cargo_cases(),
+        *trade_route_cases(game),
+        *save_load_cases(game, directory),
+        *market_cases(seed),
+        *market_report_cases(seed),
+        *market_order_cases(seed),
+        *refining_cases(),
+        *time_skip_cases(game),
+    ]
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Headless game benchmark suite")
+    parser.add_argument(
+        "--only", nargs="+", default=None,
+        help="Only run cases whose name contains one of these strings",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case")
+    parser.add_argument("--seed", type=int, default=0, help="Game and world seed")
+    parser.add_argument("--output", default=None, help="Write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", default=None,
+        help="Compare against results previously written with --output",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Relative p50 slowdown that counts as a regression",
+    )
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_arguments(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        cases = build_cases(args.seed, directory)
+        if args.only:
+            cases = [case for case in cases if any(part in case.name for part in args.only)]
+        if args.list:
+            for case in cases:
+                print(case.name)
+            return 0
+
+        results: List[Dict[str, Any]] = []
+        for case in cases:
+            seed_rng(args.seed)
+            results.append(measure(case, args.repeat))
+            print(f"{case.name}: {results[-1]['p50_ms']:.3f} ms p50", file=sys.stderr)
+
+    print(format_results(results))
+    if args.output:
+        meta = {
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            **environment(),
+        }
+        write_results(args.output, results, meta)
+
+    if args.baseline:
+        rows = compare(results, load_results(args.baseline), args.threshold)
+        print()
+        print(format_comparison(rows))
+        if any(row["verdict"] == "regression" for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
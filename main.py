@@ -2,6 +2,7 @@ import argparse
 from typing import Optional, Sequence
 
 from src.repl import start_repl
+from src.utils.galaxy_cache import DEFAULT_CACHE_DIR
 
 
 def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -18,6 +19,27 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         type=int,
         help="Seed for procedural generation (uses current time if not provided)",
     )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="Generate solar systems on first visit instead of at startup",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to generate solar systems at startup",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory of the generated galaxy cache",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always generate the galaxy instead of using the cache",
+    )
     return parser.parse_args(argv)
 
 
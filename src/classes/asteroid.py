@@ -1,13 +1,55 @@
+import math
 import random
+from array import array
+from bisect import bisect_left
+from typing import AbstractSet, Dict, Iterable, Iterator, Optional, Set
+
 from src.classes.ore import Ore
-from src.helpers import rnd_float, meters_cubed_to_km_cubed
+from src.helpers import get_rng, rnd_float, meters_cubed_to_km_cubed
 
 
 class Asteroid:
+    """
+    View of one asteroid in an AsteroidStore.
+
+    Reading or assigning volume and ore goes straight to the store's columns.
+    Asteroid(name, volume, ore) still works and creates a store of its own.
+    """
+
+    __slots__ = ("_store", "_index")
+
     def __init__(self, name, volume, ore):
-        self.name = name
-        self.volume = volume  # in m³
-        self.ore = ore
+        store = AsteroidStore()
+        store.add(volume, ore, name)
+        self._store = store
+        self._index = 0
+
+    @classmethod
+    def _view(cls, store: "AsteroidStore", index: int) -> "Asteroid":
+        asteroid = cls.__new__(cls)
+        asteroid._store = store
+        asteroid._index = index
+        return asteroid
+
+    @property
+    def name(self) -> str:
+        return self._store.get_name(self._index)
+
+    @property
+    def volume(self) -> float:  # in m³
+        return self._store.volumes[self._index]
+
+    @volume.setter
+    def volume(self, value: float) -> None:
+        self._store.set_volume(self._index, value)
+
+    @property
+    def ore(self) -> Ore:
+        return self._store.get_ore(self._index)
+
+    @ore.setter
+    def ore(self, value: Ore) -> None:
+        self._store.set_ore(self._index, value)
 
     def to_string(self):
         return f"Asteroid: {self.name}\nVolume: {self.volume} m³\nOre: {self.ore.to_string()}"
@@ -36,20 +78,192 @@ class Asteroid:
         )
 
 
+class AsteroidStore:
+    """
+    Columnar storage for the asteroids of a field.
+
+    Volumes and ore ids live in parallel arrays, so a field holds two compact
+    buffers instead of one Python object per asteroid. Names are derived from
+    the position ("Asteroid 1", "Asteroid 2", ...) unless one was set
+    explicitly. Indexing and iterating yield Asteroid views.
+
+    Mining takes asteroids in index order, so the store keeps a depletion
+    cursor (every asteroid before it is empty) and, once first asked for a
+    particular ore, one queue per ore of the asteroid indexes holding it. Empty
+    asteroids are dropped from the front of a queue as they are met. Volumes
+    only shrink through extract(); anything raising a volume goes through
+    set_volume() so the cursor and queues can move back.
+    """
+
+    __slots__ = ("volumes", "ore_ids", "_ores", "_names", "_cursor", "_ore_queues", "_ore_heads")
+
+    def __init__(self) -> None:
+        self.volumes = array("d")
+        self.ore_ids = array("H")
+        self._ores: Dict[int, Ore] = {}  # ore id -> Ore, for the ids in ore_ids
+        self._names: Optional[Dict[int, str]] = None  # index -> non-default name
+        self._cursor = 0
+        self._ore_queues: Optional[Dict[int, array]] = None  # ore id -> ascending indexes
+        self._ore_heads: Dict[int, int] = {}  # ore id -> position of its first live entry
+
+    def add(self, volume: float, ore: Ore, name: Optional[str] = None) -> None:
+        index = len(self.volumes)
+        self.volumes.append(volume)
+        ore_id = self._register_ore(ore)
+        self.ore_ids.append(ore_id)
+        if self._ore_queues is not None:
+            self._ore_queues.setdefault(ore_id, array("I")).append(index)
+        if name is not None and name != self._default_name(index):
+            if self._names is None:
+                self._names = {}
+            self._names[index] = name
+
+    def append(self, asteroid: Asteroid) -> None:
+        self.add(asteroid.volume, asteroid.ore, asteroid.name)
+
+    def _register_ore(self, ore: Ore) -> int:
+        ore_id = ore.commodity.commodity_id
+        self._ores.setdefault(ore_id, ore)
+        return ore_id
+
+    @staticmethod
+    def _default_name(index: int) -> str:
+        return f"Asteroid {index + 1}"
+
+    def get_name(self, index: int) -> str:
+        if self._names is not None and index in self._names:
+            return self._names[index]
+        return self._default_name(index)
+
+    def get_ore(self, index: int) -> Ore:
+        return self._ores[self.ore_ids[index]]
+
+    def set_ore(self, index: int, ore: Ore) -> None:
+        self.ore_ids[index] = self._register_ore(ore)
+        self._ore_queues = None
+        self._ore_heads = {}
+
+    def set_volume(self, index: int, volume: float) -> None:
+        self.volumes[index] = volume
+        if volume <= 0:
+            return
+        # A refilled asteroid may sit behind the cursor or a queue head
+        self._cursor = min(self._cursor, index)
+        if self._ore_queues is not None:
+            ore_id = self.ore_ids[index]
+            position = bisect_left(self._ore_queues[ore_id], index)
+            self._ore_heads[ore_id] = min(self._ore_heads.get(ore_id, 0), position)
+
+    def total_volume(self) -> float:
+        return sum(self.volumes)
+
+    def first_available(self, start: int = 0) -> int:
+        """Index of the first asteroid from start on with volume left, or -1."""
+        volumes = self.volumes
+        from_cursor = start <= self._cursor
+        index = max(start, self._cursor)
+        while index < len(volumes) and volumes[index] <= 0:
+            index += 1
+        if from_cursor:
+            self._cursor = index
+        return index if index < len(volumes) else -1
+
+    def next_minable(self, ore_ids: Optional[AbstractSet[int]] = None) -> int:
+        """
+        Index of the first asteroid with volume left whose ore is one of
+        ore_ids, or -1. With no ore_ids any ore will do.
+        """
+        if ore_ids is None:
+            return self.first_available()
+        if self._ore_queues is None:
+            self._build_ore_queues()
+            assert self._ore_queues is not None
+        volumes = self.volumes
+        best = -1
+        for ore_id in ore_ids:
+            queue = self._ore_queues.get(ore_id)
+            if queue is None:
+                continue
+            head = self._ore_heads.get(ore_id, 0)
+            while head < len(queue) and volumes[queue[head]] <= 0:
+                head += 1
+            self._ore_heads[ore_id] = head
+            if head < len(queue) and (best < 0 or queue[head] < best):
+                best = queue[head]
+        return best
+
+    def _build_ore_queues(self) -> None:
+        queues: Dict[int, array] = {}
+        for index, ore_id in enumerate(self.ore_ids):
+            queues.setdefault(ore_id, array("I")).append(index)
+        self._ore_queues = queues
+        self._ore_heads = {}
+
+    def units_remaining(self, index: int) -> int:
+        """
+        Number of ore units that can still be taken from asteroid index.
+
+        Mining takes units while the volume is above zero, so the last unit may
+        overdraw the asteroid.
+        """
+        volume = self.volumes[index]
+        if volume <= 0:
+            return 0
+        volume_per_unit = self.get_ore(index).commodity.volume_per_unit
+        units = max(1, math.ceil(volume / volume_per_unit))
+        # Settle on the smallest count that empties it, whatever the rounding of the division
+        while units > 1 and volume - (units - 1) * volume_per_unit <= 0:
+            units -= 1
+        while volume - units * volume_per_unit > 0:
+            units += 1
+        return units
+
+    def extract(self, index: int, units: int) -> None:
+        """Take units of ore out of asteroid index."""
+        self.volumes[index] -= units * self.get_ore(index).commodity.volume_per_unit
+
+    def is_depleted(self) -> bool:
+        return self.first_available() == -1
+
+    def __len__(self) -> int:
+        return len(self.volumes)
+
+    def __getitem__(self, index: int) -> Asteroid:
+        if index < 0:
+            index += len(self.volumes)
+        if not 0 <= index < len(self.volumes):
+            raise IndexError("asteroid index out of range")
+        return Asteroid._view(self, index)
+
+    def __iter__(self) -> Iterator[Asteroid]:
+        for index in range(len(self.volumes)):
+            yield Asteroid._view(self, index)
+
+    def __repr__(self) -> str:
+        return f"AsteroidStore({len(self.volumes)} asteroids)"
+
+
 class AsteroidField:
     belt_counter: int = 0
 
-    def __init__(self, asteroid_quantity, ores_available, radius, position) -> None:
+    def __init__(
+        self,
+        asteroid_quantity,
+        ores_available,
+        radius,
+        position,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         from src.classes.ship import IsSpaceObject
 
         self.asteroid_quantity: int = asteroid_quantity
         self.ores_available: list[Ore] = ores_available
         self.radius: float = radius  # in AU
-        self.asteroids: list[Asteroid] = []
+        self.asteroids: AsteroidStore = AsteroidStore()
         self.space_object = IsSpaceObject(position, AsteroidField.belt_counter)
         self.visited: bool = False
         self.rarity_score: int = self._calculate_field_rarity()  # Added rarity score
-        self.spawn_asteroids()
+        self.spawn_asteroids(rng)
         AsteroidField.belt_counter += 1
 
     def to_string_short(self, position=None):
@@ -82,17 +296,27 @@ class AsteroidField:
     def get_info(self):
         return f"{self.asteroid_quantity} {self.radius} {self.ores_available} {self.asteroids}"
 
-    def spawn_asteroids(self):
-        for i in range(1, self.asteroid_quantity + 1):
-            ore = random.choice(self.ores_available)
-            volume = rnd_float(100.0, 100_000.0) * ore.volume
-            self.asteroids.append(Asteroid(f"Asteroid {i}", volume, ore))
+    def spawn_asteroids(self, rng: Optional[random.Random] = None):
+        rng = get_rng(rng)
+        for _ in range(self.asteroid_quantity):
+            ore = rng.choice(self.ores_available)
+            volume = rnd_float(100.0, 100_000.0, rng) * ore.volume
+            self.asteroids.add(volume, ore)
+
+    def get_ore_ids(self, ore_names: Iterable[str]) -> Set[int]:
+        """Ids of the available ores with the given names (case insensitive)."""
+        names = {name.lower() for name in ore_names}
+        return {
+            ore.commodity.commodity_id
+            for ore in self.ores_available
+            if ore.name.lower() in names
+        }
 
     def get_random_asteroid(self):
-        return random.choice(self.asteroids)
+        return self.asteroids[random.randrange(len(self.asteroids))]
 
     def get_total_volume(self):
-        return sum(asteroid.volume for asteroid in self.asteroids)
+        return self.asteroids.total_volume()
 
     def _calculate_field_rarity(self) -> int:
         if not self.ores_available:
@@ -130,7 +354,7 @@ class AsteroidField:
     def from_dict(cls, data):
         from src.classes.ore import ORES  # Local import
         from src.classes.ship import IsSpaceObject  # Local import
-        from pygame import Vector2  # Add missing Vector2 import
+        from src.helpers import Vector2
 
         ores = [
             ORES.get(ore_id)
@@ -151,7 +375,7 @@ class AsteroidField:
             Vector2(data["position"]["x"], data["position"]["y"]), data["id"]
         )
         # Clear asteroids spawned by __init__ and load from data
-        field.asteroids = []
+        field.asteroids = AsteroidStore()
         for ast_data in asteroids_data:
             field.asteroids.append(Asteroid.from_dict(ast_data))
 
@@ -6,7 +6,8 @@ separate cargohold and mineralhold lists with a single, unified cargo system.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Union, Any
+from fractions import Fraction
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
 from src.classes.ore import Ore
 from src.classes.mineral import Mineral
 from src.classes.component import Component
@@ -505,13 +506,46 @@ class CargoItem:
             ))
 
 
+class _StackKeys:
+    """
+    Stack keys of a hold, for error context.
+
+    Misses are common on the lookup paths and the context is rarely shown,
+    so the key list is only built when it is iterated or printed.
+    """
+
+    def __init__(self, items: Dict[str, CargoItem]):
+        self._items = items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return repr(list(self._items))
+
+
 class CargoHold:
     """
     Unified cargo management system for ships.
     
     This class manages all types of cargo items in a single container,
     replacing the separate cargohold and mineralhold lists.
+
+    The occupied volume, and the volume and unit count of each item type, are
+    kept as running totals so capacity checks don't depend on the number of
+    stacks. Volumes are summed as exact fractions, so the totals always equal
+    a recount of the stacks. Stack quantities must only be changed through the
+    hold's methods; set VERIFY_TOTALS to recount after every change.
+
+    Stacks are also indexed by item ID, name and type, so lookups don't scan
+    the hold. Each index maps to the matching stack keys in insertion order.
     """
+
+    # Debug aid: recount the stacks after every change and fail on a mismatch
+    VERIFY_TOTALS: bool = False
     
     def __init__(self, capacity: float):
         """
@@ -525,6 +559,92 @@ class CargoHold:
         
         self.capacity = capacity
         self._items: Dict[str, CargoItem] = {}
+        self._occupied_volume = Fraction(0)
+        self._occupied_space = 0.0  # float(_occupied_volume), read by the capacity checks
+        self._type_volumes: Dict[str, Fraction] = {}
+        self._type_units: Dict[str, int] = {}
+        # item ID / lowercase name / item class -> stack keys, used as ordered sets
+        self._keys_by_id: Dict[str, Dict[str, None]] = {}
+        self._keys_by_name: Dict[str, Dict[str, None]] = {}
+        self._keys_by_type: Dict[type, Dict[str, None]] = {}
+
+    def _index_stack(self, item_key: str, cargo_item: CargoItem) -> None:
+        """Add a new stack to the lookup indexes."""
+        self._keys_by_id.setdefault(cargo_item.item_id, {})[item_key] = None
+        self._keys_by_name.setdefault(cargo_item.item_name.lower(), {})[item_key] = None
+        self._keys_by_type.setdefault(type(cargo_item.item), {})[item_key] = None
+
+    def _unindex_stack(self, item_key: str, cargo_item: CargoItem) -> None:
+        """Remove an emptied stack from the lookup indexes."""
+        for index, index_key in (
+            (self._keys_by_id, cargo_item.item_id),
+            (self._keys_by_name, cargo_item.item_name.lower()),
+            (self._keys_by_type, type(cargo_item.item)),
+        ):
+            keys = index[index_key]
+            del keys[item_key]
+            if not keys:
+                del index[index_key]
+
+    def _track(self, cargo_item: CargoItem, quantity_change: int) -> None:
+        """Update the running totals after a stack's quantity changed by quantity_change."""
+        volume_change = quantity_change * Fraction(cargo_item.volume_per_unit)
+        item_type = cargo_item.item_type
+        self._occupied_volume += volume_change
+        self._occupied_space = float(self._occupied_volume)
+        self._type_volumes[item_type] = self._type_volumes.get(item_type, Fraction(0)) + volume_change
+        self._type_units[item_type] = self._type_units.get(item_type, 0) + quantity_change
+        if self.VERIFY_TOTALS:
+            self.verify_totals()
+
+    def verify_totals(self) -> None:
+        """
+        Recount the stacks and check the running totals and lookup indexes
+        against the result.
+
+        Raises:
+            AssertionError: If a total or an index has drifted from the stacks
+        """
+        occupied = Fraction(0)
+        type_volumes: Dict[str, Fraction] = {}
+        type_units: Dict[str, int] = {}
+        keys_by_id: Dict[str, Dict[str, None]] = {}
+        keys_by_name: Dict[str, Dict[str, None]] = {}
+        keys_by_type: Dict[type, Dict[str, None]] = {}
+        for item_key, cargo_item in self._items.items():
+            keys_by_id.setdefault(cargo_item.item_id, {})[item_key] = None
+            keys_by_name.setdefault(cargo_item.item_name.lower(), {})[item_key] = None
+            keys_by_type.setdefault(type(cargo_item.item), {})[item_key] = None
+            volume = cargo_item.quantity * Fraction(cargo_item.volume_per_unit)
+            occupied += volume
+            item_type = cargo_item.item_type
+            type_volumes[item_type] = type_volumes.get(item_type, Fraction(0)) + volume
+            type_units[item_type] = type_units.get(item_type, 0) + cargo_item.quantity
+
+        def nonzero(totals: Dict[str, Any]) -> Dict[str, Any]:
+            return {key: value for key, value in totals.items() if value}
+
+        if (
+            occupied != self._occupied_volume
+            or self._occupied_space != float(occupied)
+            or nonzero(type_volumes) != nonzero(self._type_volumes)
+            or nonzero(type_units) != nonzero(self._type_units)
+        ):
+            raise AssertionError(
+                f"Cargo totals out of sync: tracked {float(self._occupied_volume)} m³, "
+                f"recounted {float(occupied)} m³"
+            )
+
+        # Compared as lists, since lookups rely on the insertion order
+        def ordered(index: Dict[Any, Dict[str, None]]) -> Dict[Any, List[str]]:
+            return {key: list(keys) for key, keys in index.items()}
+
+        if (
+            ordered(keys_by_id) != ordered(self._keys_by_id)
+            or ordered(keys_by_name) != ordered(self._keys_by_name)
+            or ordered(keys_by_type) != ordered(self._keys_by_type)
+        ):
+            raise AssertionError("Cargo lookup indexes out of sync with the stacks")
     
     def _generate_item_key(self, item: Union[Ore, Mineral, Component, FinishedGood]) -> str:
         """
@@ -586,12 +706,13 @@ class CargoHold:
             
             if item_key in self._items:
                 # Add to existing stack
-                self._items[item_key].quantity += quantity
+                cargo_item = self._items[item_key]
+                cargo_item.quantity += quantity
                 # Update prices if provided
                 if buy_price > 0:
-                    self._items[item_key].buy_price = buy_price
+                    cargo_item.buy_price = buy_price
                 if sell_price > 0:
-                    self._items[item_key].sell_price = sell_price
+                    cargo_item.sell_price = sell_price
             else:
                 # Create new stack
                 cargo_item = CargoItem(item, quantity, buy_price, sell_price)
@@ -599,8 +720,7 @@ class CargoHold:
                 if validation_result.is_err():
                     return Result.err(validation_result.unwrap_err())
                 self._items[item_key] = cargo_item
-            
-            return Result.ok(None)
+                self._index_stack(item_key, cargo_item)
             
         except Exception as e:
             return Result.err(CargoErrorDetails(
@@ -608,6 +728,9 @@ class CargoHold:
                 f"Failed to add item to cargo: {str(e)}",
                 {"item_name": getattr(item, 'name', 'unknown')}
             ))
+
+        self._track(cargo_item, quantity)
+        return Result.ok(None)
     
     def remove_item(self, item_id: str, quantity: int) -> CargoResult[CargoItem]:
         """
@@ -627,7 +750,7 @@ class CargoHold:
                 {"quantity": quantity}
             ))
         
-        # Find item by ID (may need to search through keys)
+        # Find item by ID
         item_key_result = self._find_item_key(item_id)
         if item_key_result.is_err():
             return Result.err(item_key_result.unwrap_err())
@@ -660,21 +783,91 @@ class CargoHold:
                 cargo_item.buy_price,
                 cargo_item.sell_price
             )
-            
-            # Update or remove from cargo
-            cargo_item.quantity -= quantity
-            if cargo_item.quantity <= 0:
-                del self._items[item_key]
-            
-            return Result.ok(removed_item)
-            
         except Exception as e:
             return Result.err(CargoErrorDetails(
                 CargoError.SERIALIZATION_ERROR,
                 f"Failed to remove item from cargo: {str(e)}",
                 {"item_id": item_id}
             ))
-    
+
+        self._take_from_stack(item_key, quantity)
+        return Result.ok(removed_item)
+
+    def _take_from_stack(self, item_key: str, quantity: int) -> None:
+        """Update or remove a stack after quantity units were taken from it."""
+        cargo_item = self._items[item_key]
+        cargo_item.quantity -= quantity
+        if cargo_item.quantity <= 0:
+            del self._items[item_key]
+            self._unindex_stack(item_key, cargo_item)
+        self._track(cargo_item, -quantity)
+
+    def remove_many(self, removals: Iterable[Tuple[str, int]]) -> CargoResult[List[CargoItem]]:
+        """
+        Remove several items from cargo hold at once.
+        
+        Each (item_id, quantity) pair is taken from the stack remove_item would
+        use at that point, so once an earlier pair empties a stack, later pairs
+        for the same item move on to its next stack. All removals are checked
+        before any is made, so on error the hold is left unchanged.
+        
+        Args:
+            removals: Pairs of item ID and number of items to remove
+            
+        Returns:
+            Result[List[CargoItem], CargoErrorDetails]: Removed items, in the
+            order requested, or error details
+        """
+        planned: List[Tuple[str, int]] = []
+        remaining: Dict[str, int] = {}
+        for item_id, quantity in removals:
+            if quantity <= 0:
+                return Result.err(CargoErrorDetails(
+                    CargoError.INVALID_QUANTITY,
+                    f"Quantity must be positive: {quantity}",
+                    {"quantity": quantity, "item_id": item_id}
+                ))
+            
+            # First stack of the item not already emptied by this batch
+            item_key = next(
+                (key for key in self._keys_by_id.get(item_id, ())
+                 if remaining.get(key, self._items[key].quantity) > 0),
+                None
+            )
+            if item_key is None:
+                return Result.err(CargoErrorDetails(
+                    CargoError.ITEM_NOT_FOUND,
+                    f"Item not found: {item_id}",
+                    {"item_id": item_id, "available_items": _StackKeys(self._items)}
+                ))
+            
+            available = remaining.get(item_key, self._items[item_key].quantity)
+            if available < quantity:
+                return Result.err(CargoErrorDetails(
+                    CargoError.INVALID_QUANTITY,
+                    f"Not enough items: requested {quantity}, available {available}",
+                    {
+                        "requested": quantity,
+                        "available": available,
+                        "item_id": item_id
+                    }
+                ))
+            remaining[item_key] = available - quantity
+            planned.append((item_key, quantity))
+        
+        removed_items: List[CargoItem] = []
+        for item_key, quantity in planned:
+            cargo_item = self._items[item_key]
+            removed_items.append(CargoItem(
+                cargo_item.item,
+                quantity,
+                cargo_item.buy_price,
+                cargo_item.sell_price
+            ))
+            self._take_from_stack(item_key, quantity)
+        
+        return Result.ok(removed_items)
+
     def get_item(self, item_id: str) -> CargoResult[CargoItem]:
         """
         Get cargo item by ID.
@@ -699,28 +892,79 @@ class CargoHold:
             {"item_id": item_id}
         ))
     
+    def get_many(self, item_ids: Iterable[str]) -> CargoResult[List[CargoItem]]:
+        """
+        Get the cargo items for several IDs at once.
+        
+        Args:
+            item_ids: IDs of the items to retrieve
+            
+        Returns:
+            Result[List[CargoItem], CargoErrorDetails]: Found items, in the
+            order of item_ids, or an error naming every missing ID
+        """
+        found: List[CargoItem] = []
+        missing: List[str] = []
+        for item_id in item_ids:
+            keys = self._keys_by_id.get(item_id)
+            if keys:
+                found.append(self._items[next(iter(keys))])
+            else:
+                missing.append(item_id)
+        
+        if missing:
+            return Result.err(CargoErrorDetails(
+                CargoError.ITEM_NOT_FOUND,
+                f"Items not found in cargo: {', '.join(missing)}",
+                {"missing_item_ids": missing}
+            ))
+        
+        return Result.ok(found)
+    
     def get_all_items(self) -> List[CargoItem]:
         """Get all cargo items."""
         return list(self._items.values())
-    
+
+    def get_items_by_id(self, item_id: str) -> List[CargoItem]:
+        """Get every stack of an item, across purities and qualities."""
+        return [self._items[key] for key in self._keys_by_id.get(item_id, ())]
+
+    def get_items_by_name(self, name: str) -> List[CargoItem]:
+        """Get all stacks whose item name matches name, ignoring case."""
+        return [self._items[key] for key in self._keys_by_name.get(name.lower(), ())]
+
     def get_items_by_type(self, item_type: type) -> List[CargoItem]:
         """Get all items of a specific type (Ore, Mineral, etc.)."""
+        matching_types = [
+            stored_type for stored_type in self._keys_by_type
+            if issubclass(stored_type, item_type)
+        ]
+        if len(matching_types) == 1:
+            return [self._items[key] for key in self._keys_by_type[matching_types[0]]]
         return [
             cargo_item for cargo_item in self._items.values()
             if isinstance(cargo_item.item, item_type)
         ]
     
+    def get_type_units(self, item_type: type) -> int:
+        """Get the number of units held of a specific type (Ore, Mineral, etc.)."""
+        return self._type_units.get(item_type.__name__, 0)
+
+    def get_type_volume(self, item_type: type) -> float:
+        """Get the space occupied by items of a specific type (Ore, Mineral, etc.)."""
+        return float(self._type_volumes.get(item_type.__name__, 0))
+    
     def get_occupied_space(self) -> float:
         """Get total space occupied by all cargo."""
-        return sum(cargo_item.total_volume for cargo_item in self._items.values())
+        return self._occupied_space
     
     def get_remaining_space(self) -> float:
         """Get remaining cargo space."""
-        return max(0.0, self.capacity - self.get_occupied_space())
+        return max(0.0, self.capacity - self._occupied_space)
     
     def is_full(self) -> bool:
         """Check if cargo hold is full."""
-        return self.get_occupied_space() >= self.capacity
+        return self._occupied_space >= self.capacity
     
     def can_fit(self, item: Union[Ore, Mineral, Component, FinishedGood], 
                 quantity: int) -> bool:
@@ -730,6 +974,36 @@ class CargoHold:
         
         required_volume = quantity * item.commodity.volume_per_unit
         return required_volume <= self.get_remaining_space()
+
+    def count_fitting_units(self, item: Union[Ore, Mineral, Component, FinishedGood],
+                            limit: int) -> int:
+        """
+        Count how many units of an item, up to limit, fit in the hold.
+
+        Uses the same can_fit check as add_item, so adding the returned
+        number of units in a single add_item call always succeeds.
+
+        Args:
+            item: The item to add
+            limit: Maximum number of units wanted
+
+        Returns:
+            int: Number of units that fit
+        """
+        if limit <= 0 or not self.can_fit(item, 1):
+            return 0
+
+        volume_per_unit = item.commodity.volume_per_unit
+        if volume_per_unit <= 0:
+            return limit
+
+        units = max(1, min(limit, int(self.get_remaining_space() // volume_per_unit)))
+        # The estimate can be off by a unit at the capacity boundary through rounding
+        while units > 1 and not self.can_fit(item, units):
+            units -= 1
+        while units < limit and self.can_fit(item, units + 1):
+            units += 1
+        return units
     
     def _find_item_key(self, item_id: str) -> CargoResult[str]:
         """
@@ -739,24 +1013,17 @@ class CargoHold:
             item_id: ID of the item to find
             
         Returns:
-            Result[str, CargoErrorDetails]: Item key or error details
+            Result[str, CargoErrorDetails]: Key of the first stack of the item, or error details
         """
-        try:
-            for key, cargo_item in self._items.items():
-                if cargo_item.item_id == item_id:
-                    return Result.ok(key)
-            
-            return Result.err(CargoErrorDetails(
-                CargoError.ITEM_NOT_FOUND,
-                f"Item not found: {item_id}",
-                {"item_id": item_id, "available_items": list(self._items.keys())}
-            ))
-        except Exception as e:
-            return Result.err(CargoErrorDetails(
-                CargoError.SERIALIZATION_ERROR,
-                f"Error searching for item: {str(e)}",
-                {"item_id": item_id}
-            ))
+        keys = self._keys_by_id.get(item_id)
+        if keys:
+            return Result.ok(next(iter(keys)))
+        
+        return Result.err(CargoErrorDetails(
+            CargoError.ITEM_NOT_FOUND,
+            f"Item not found: {item_id}",
+            {"item_id": item_id, "available_items": _StackKeys(self._items)}
+        ))
     
     def to_dict(self) -> CargoResult[Dict[str, Any]]:
         """
@@ -811,7 +1078,10 @@ class CargoHold:
                 cargo_item_result = CargoItem.from_dict(item_data)
                 if cargo_item_result.is_err():
                     return Result.err(cargo_item_result.unwrap_err())
-                cargo_hold._items[key] = cargo_item_result.unwrap()
+                cargo_item = cargo_item_result.unwrap()
+                cargo_hold._items[key] = cargo_item
+                cargo_hold._index_stack(key, cargo_item)
+                cargo_hold._track(cargo_item, cargo_item.quantity)
             
             return Result.ok(cargo_hold)
             
@@ -10,9 +10,8 @@ import math
 import random
 from enum import Enum
 from typing import List, Optional, Union, TYPE_CHECKING
-from pygame import Vector2
 from src.classes.space_object import IsSpaceObject
-from src.helpers import rnd_float, rnd_int
+from src.helpers import Vector2, get_rng, rnd_float, rnd_int
 from src.classes.asteroid import AsteroidField
 from src.classes.ore import Ore
 from src.data import ORES, PlanetType, SolarSystemZone, StellarClass, STELLAR_PROPERTIES
@@ -175,15 +174,22 @@ class CelestialBody:
 class Star(CelestialBody):
     """Central star of the solar system"""
 
-    def __init__(self, name: str, position: Vector2 = Vector2(0, 0)):
+    def __init__(
+        self,
+        name: str,
+        position: Vector2 = Vector2(0, 0),
+        rng: Optional[random.Random] = None,
+    ):
         """
         Initialize a star with realistic properties based on stellar classification.
 
         Args:
             name: Name of the star
             position: Position in space (defaults to 0,0 for central star)
+            rng: Random stream to draw from (defaults to the global random module)
         """  # Generate random stellar class based on rarity weights
-        stellar_class = self._generate_stellar_class()
+        rng = get_rng(rng)
+        stellar_class = self._generate_stellar_class(rng)
         properties = STELLAR_PROPERTIES[stellar_class]
 
         # Generate random properties within the stellar class ranges
@@ -214,11 +220,11 @@ class Star(CelestialBody):
             else (radius_range, radius_range)
         )
 
-        temperature = random.uniform(temp_tuple[0], temp_tuple[1])
-        luminosity = random.uniform(lum_tuple[0], lum_tuple[1])
-        mass = random.uniform(mass_tuple[0], mass_tuple[1])
+        temperature = rng.uniform(temp_tuple[0], temp_tuple[1])
+        luminosity = rng.uniform(lum_tuple[0], lum_tuple[1])
+        mass = rng.uniform(mass_tuple[0], mass_tuple[1])
         # Scale down for game purposes
-        radius = random.uniform(radius_tuple[0], radius_tuple[1]) * 0.01
+        radius = rng.uniform(radius_tuple[0], radius_tuple[1]) * 0.01
 
         super().__init__(
             name, CelestialBodyType.STAR, position, radius=radius, mass=mass
@@ -234,7 +240,9 @@ class Star(CelestialBody):
         # Base frost line for Sun (G-type, luminosity=1.0) is ~2.7 AU
         self.frost_line_au = 2.7 * math.sqrt(luminosity)
 
-    def _generate_stellar_class(self) -> StellarClass:
+    def _generate_stellar_class(
+        self, rng: Optional[random.Random] = None
+    ) -> StellarClass:
         """Generate a random stellar class based on rarity weights"""
         classes = list(StellarClass)
         weights = []
@@ -252,7 +260,7 @@ class Star(CelestialBody):
                 weights.append(1.0)  # Default weight for unknown types
         # Use weighted random selection
         total_weight = sum(weights)
-        random_value = random.uniform(0, total_weight)
+        random_value = get_rng(rng).uniform(0, total_weight)
 
         cumulative_weight = 0.0
         for cls, weight in zip(classes, weights):
@@ -335,6 +343,7 @@ class Planet(CelestialBody):
         orbital_distance: float,
         stellar_class: str = "G",
         stellar_age: float = 5.0,
+        rng: Optional[random.Random] = None,
     ):
         """
         Initialize a planet with procedural generation based on orbital distance.
@@ -345,38 +354,41 @@ class Planet(CelestialBody):
             orbital_distance: Distance from the star in AU
             stellar_class: Spectral class of the host star
             stellar_age: Age of the host star in billion years
+            rng: Random stream to draw from (defaults to the global random module)
         """
         # Generate physical properties based on orbital distance and zone
         planet_type, radius, mass = self._generate_physical_properties(
-            orbital_distance)
+            orbital_distance, rng)
 
         super().__init__(name, CelestialBodyType.PLANET, position, radius, mass)
 
         self.orbital_distance = orbital_distance
         self.planet_type = planet_type
         self.temperature_zone = self._get_temperature_zone()
-        self.atmosphere = self._generate_atmosphere()
+        self.atmosphere = self._generate_atmosphere(rng)
         self.stellar_class = stellar_class
         self.stellar_age = stellar_age
 
         # Calculate UHS (Universal Habitability Score)
-        self.habitability_result = self._calculate_uhs()
+        self.habitability_result = self._calculate_uhs(rng)
         self.habitability_score = self.habitability_result.uhs_score
 
-    def _generate_physical_properties(self, orbital_distance: float):
+    def _generate_physical_properties(
+        self, orbital_distance: float, rng: Optional[random.Random] = None
+    ):
         """Generate planet physical properties based on orbital distance."""
         # Simplified model: inner planets smaller, outer planets larger
         if orbital_distance < 1.5:
-            radius = float(rnd_float(0.05, 0.15))  # Rocky planet size
-            mass = float(rnd_float(0.5, 1.5))  # Rocky planet mass
+            radius = float(rnd_float(0.05, 0.15, rng))  # Rocky planet size
+            mass = float(rnd_float(0.5, 1.5, rng))  # Rocky planet mass
             planet_type = PlanetType.ROCKY
         elif orbital_distance < 5.0:
-            radius = float(rnd_float(0.3, 0.8))  # Gas giant size
-            mass = float(rnd_float(1.5, 3.0))  # Gas giant mass
+            radius = float(rnd_float(0.3, 0.8, rng))  # Gas giant size
+            mass = float(rnd_float(1.5, 3.0, rng))  # Gas giant mass
             planet_type = PlanetType.GAS_GIANT
         else:
-            radius = float(rnd_float(0.2, 0.6))  # Ice giant size
-            mass = float(rnd_float(0.8, 2.0))  # Ice giant mass
+            radius = float(rnd_float(0.2, 0.6, rng))  # Ice giant size
+            mass = float(rnd_float(0.8, 2.0, rng))  # Ice giant mass
             planet_type = PlanetType.ICE_GIANT
 
         return planet_type, radius, mass
@@ -394,12 +406,13 @@ class Planet(CelestialBody):
         else:
             return SolarSystemZone.OUTER_COLD
 
-    def _generate_atmosphere(self) -> str:
+    def _generate_atmosphere(self, rng: Optional[random.Random] = None) -> str:
         """Generate atmospheric composition based on planet type and zone"""
+        rng = get_rng(rng)
         if self.planet_type == PlanetType.GAS_GIANT:
-            return random.choice(["thick", "dense", "toxic"])
+            return rng.choice(["thick", "dense", "toxic"])
         elif self.planet_type == PlanetType.ICE_GIANT:
-            return random.choice(["thick", "dense", "corrosive"])
+            return rng.choice(["thick", "dense", "corrosive"])
         else:  # Rocky or Super Earth
             if self.temperature_zone == SolarSystemZone.INNER_HOT:
                 # Hot planets lose atmosphere or have toxic ones
@@ -414,12 +427,12 @@ class Planet(CelestialBody):
                 atmospheres = ["none", "thin", "thick", "dense"]
                 weights = [0.2, 0.2, 0.3, 0.3]
 
-            return random.choices(atmospheres, weights=weights)[0]
+            return rng.choices(atmospheres, weights=weights)[0]
 
-    def _calculate_uhs(self):
+    def _calculate_uhs(self, rng: Optional[random.Random] = None):
         """Calculate Universal Habitability Score using the specified distribution model"""
         # Use the new distribution-based scoring instead of the realistic calculation
-        score = self._generate_habitability_score_distribution()
+        score = self._generate_habitability_score_distribution(rng)
 
         # Create a simple result object that matches the expected interface
         # We still use the original calculation for some metadata, but override the score
@@ -461,7 +474,9 @@ class Planet(CelestialBody):
 
         return original_result
 
-    def _generate_habitability_score_distribution(self) -> float:
+    def _generate_habitability_score_distribution(
+        self, rng: Optional[random.Random] = None
+    ) -> float:
         """
         Generate habitability score using the specified probability distribution:
         - UHS 0-50: 75%
@@ -470,16 +485,17 @@ class Planet(CelestialBody):
         - UHS 91-100: 1%
         """
         # Generate random number to determine which range to use
-        rand = random.random()
+        rng = get_rng(rng)
+        rand = rng.random()
 
         if rand < 0.75:  # 75% chance for 0-50 range
-            return float(random.uniform(0, 50))
+            return float(rng.uniform(0, 50))
         elif rand < 0.90:  # 15% chance for 51-75 range (0.75 + 0.15 = 0.90)
-            return float(random.uniform(51, 75))
+            return float(rng.uniform(51, 75))
         elif rand < 0.99:  # 9% chance for 76-90 range (0.90 + 0.09 = 0.99)
-            return float(random.uniform(76, 90))
+            return float(rng.uniform(76, 90))
         else:  # 1% chance for 91-100 range
-            return float(random.uniform(91, 100))
+            return float(rng.uniform(91, 100))
 
     def update_stellar_properties(self, stellar_class: str, stellar_age: float):
         """Update stellar properties and recalculate habitability"""
@@ -752,6 +768,7 @@ class AsteroidBelt(CelestialBody):
         outer_radius: float,
         num_fields: int,
         parent_system: Optional["SolarSystem"] = None,
+        rng: Optional[random.Random] = None,
     ):
         super().__init__(
             name,
@@ -765,10 +782,13 @@ class AsteroidBelt(CelestialBody):
         self.asteroid_fields: List[AsteroidField] = []
         self.num_fields = num_fields  # Store if needed, e.g. for to_dict
         self.parent_system = parent_system  # Reference to parent solar system
-        self.generate_asteroid_fields(num_fields)
+        self.generate_asteroid_fields(num_fields, rng)
 
-    def generate_asteroid_fields(self, num_fields: int) -> None:
+    def generate_asteroid_fields(
+        self, num_fields: int, rng: Optional[random.Random] = None
+    ) -> None:
         """Generates asteroid fields within the belt."""
+        rng = get_rng(rng)
         if not ORES:  # Ensure ORES is populated
             print(
                 "Warning: ORES dictionary is empty. Cannot generate ores for asteroid fields."
@@ -776,21 +796,21 @@ class AsteroidBelt(CelestialBody):
             return
 
         for _ in range(num_fields):
-            field_pos = self._random_position_in_belt()
+            field_pos = self._random_position_in_belt(rng)
             # Radius of the asteroid field itself
-            field_radius = rnd_float(0.05, 0.2)
+            field_radius = rnd_float(0.05, 0.2, rng)
             # Number of asteroids in this field
-            num_asteroids = rnd_int(15, 50)
+            num_asteroids = rnd_int(15, 50, rng)
 
             # Select 1 to 3 ore types for this field
-            ores_for_field = self._select_belt_ores()
+            ores_for_field = self._select_belt_ores(rng)
             if not ores_for_field:  # Fallback if ore selection fails
                 print(
                     f"Warning: Could not select ores for a field in belt {self.name}."
                 )
                 # Pick a default ore if possible, or skip field generation
                 if list(ORES.values()):
-                    ores_for_field = [random.choice(list(ORES.values()))]
+                    ores_for_field = [rng.choice(list(ORES.values()))]
                 else:
                     continue  # Skip this field if no ores can be assigned
 
@@ -800,24 +820,26 @@ class AsteroidBelt(CelestialBody):
                     ores_available=ores_for_field,
                     radius=field_radius,
                     position=field_pos,
+                    rng=rng,
                 )
                 self.asteroid_fields.append(new_field)
             except Exception as e:
                 print(f"Error creating AsteroidField in belt {self.name}: {e}")
 
-    def _random_position_in_belt(self) -> Vector2:
+    def _random_position_in_belt(self, rng: Optional[random.Random] = None) -> Vector2:
         """Calculates a random position within the annulus of the belt.
 
         Asteroid fields are positioned relative to the star (0, 0), not the belt's
         representative position, since they orbit within the belt's radius range.
         """
-        angle = random.uniform(0, 2 * math.pi)
+        rng = get_rng(rng)
+        angle = rng.uniform(0, 2 * math.pi)
         # Ensure inner_radius < outer_radius to avoid issues with random.uniform
         if self.inner_radius >= self.outer_radius:
             # Default to a small range around inner_radius if radii are problematic
-            dist_radius = self.inner_radius + rnd_float(0.01, 0.1)
+            dist_radius = self.inner_radius + rnd_float(0.01, 0.1, rng)
         else:
-            dist_radius = random.uniform(self.inner_radius, self.outer_radius)
+            dist_radius = rng.uniform(self.inner_radius, self.outer_radius)
 
         # Position relative to the star (0, 0), not the belt's representative position
         # The asteroid fields orbit the star within the belt's radius range
@@ -841,7 +863,7 @@ class AsteroidBelt(CelestialBody):
         """Property for accessing belt density score."""
         return self._calculate_density()
 
-    def _select_belt_ores(self) -> List[Ore]:
+    def _select_belt_ores(self, rng: Optional[random.Random] = None) -> List[Ore]:
         """Selects ores for an asteroid field based on temperature zones of nearby planets."""
         if not ORES:
             return []
@@ -850,11 +872,11 @@ class AsteroidBelt(CelestialBody):
         zone_weights = self._calculate_zone_influence()
 
         # Select ores based on temperature zone weights
-        selected_ores = self._select_ores_by_zone_weights(zone_weights)
+        selected_ores = self._select_ores_by_zone_weights(zone_weights, rng)
 
         # Fallback to random selection if zone-based selection fails
         if not selected_ores:
-            selected_ores = self._select_random_ores()
+            selected_ores = self._select_random_ores(rng)
 
         return selected_ores
 
@@ -950,10 +972,13 @@ class AsteroidBelt(CelestialBody):
                 MaterialCategory.LOW_TEMP: 0.6,
             }
 
-    def _select_ores_by_zone_weights(self, zone_weights: dict) -> List[Ore]:
+    def _select_ores_by_zone_weights(
+        self, zone_weights: dict, rng: Optional[random.Random] = None
+    ) -> List[Ore]:
         """Select ores based on temperature zone weights."""
         from src.classes.mineral import MaterialCategory
 
+        rng = get_rng(rng)
         if not ORES or not zone_weights:
             return []
 
@@ -971,7 +996,7 @@ class AsteroidBelt(CelestialBody):
 
         # Select ores based on zone weights
         selected_ores = []
-        num_ore_types = rnd_int(1, min(3, len(ORES)))
+        num_ore_types = rnd_int(1, min(3, len(ORES)), rng)
 
         for _ in range(num_ore_types):
             # Choose category based on weights
@@ -982,12 +1007,12 @@ class AsteroidBelt(CelestialBody):
             if sum(weights) == 0:
                 weights = [1.0, 1.0, 1.0]  # Equal weights as fallback
 
-            chosen_category = random.choices(categories, weights=weights)[0]
+            chosen_category = rng.choices(categories, weights=weights)[0]
 
             # Select ore from chosen category
             available_ores = categorized_ores[chosen_category]
             if available_ores:
-                chosen_ore = random.choice(available_ores)
+                chosen_ore = rng.choice(available_ores)
                 if chosen_ore not in selected_ores:
                     selected_ores.append(chosen_ore)
 
@@ -1030,18 +1055,19 @@ class AsteroidBelt(CelestialBody):
         else:
             return MaterialCategory.MID_TEMP
 
-    def _select_random_ores(self) -> List[Ore]:
+    def _select_random_ores(self, rng: Optional[random.Random] = None) -> List[Ore]:
         """Fallback method for random ore selection (original behavior)."""
         if not ORES:
             return []
 
-        num_ore_types = rnd_int(1, min(3, len(ORES)))
+        rng = get_rng(rng)
+        num_ore_types = rnd_int(1, min(3, len(ORES)), rng)
         available_ores_list = list(ORES.values())
 
         if not available_ores_list:
             return []
 
-        selected_ores = random.sample(
+        selected_ores = rng.sample(
             available_ores_list, k=min(num_ore_types, len(available_ores_list))
         )
         return selected_ores
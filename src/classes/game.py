@@ -1,21 +1,29 @@
 import json
 import os
-from typing import List, Dict, Union, Optional, Tuple, Any
-import pygame as pg
+from collections import deque
+from typing import Deque, List, Dict, Union, Optional, Tuple, Any
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-import random
+from dataclasses import asdict, dataclass
 import time
 from colorama import Fore, Back, Style, init
 
 from src.classes.ship import Ship
 from src.classes.solar_system import SolarSystem
-from src.classes.region import Region
+from src.classes.region import Region, materialize_system, system_from_dict
 from src.classes.skill_system import SkillSystem
+from src.classes.interest import InterestAccrual
+from src.classes.scheduler import GameScheduler
+from src.helpers import derive_rng, seed_rng
+from src.utils import audio
+from src.utils.galaxy_cache import GalaxyCache
 
 
 init(autoreset=True)
 
+DAY_SECONDS = 86400  # global_time runs in seconds
+WEEK_SECONDS = 7 * DAY_SECONDS
+DEBT_ACCRUALS_KEPT = 5  # Latest debt interest accruals kept for the banking history
+
 
 class UI:
     def __init__(self, default_fg: str = Fore.WHITE, default_bg: str = Back.BLACK) -> None:
@@ -127,8 +135,12 @@ class Character:
 
         self.savings: float = 0.0
         self.savings_interest_rate: float = 0.02
+        self.last_savings_interest_time = 0  # hours, like last_interest_time
 
         self.bank_transactions: list = []
+        self.debt_interest_accruals: Deque[InterestAccrual] = deque(maxlen=DEBT_ACCRUALS_KEPT)
+        # Interest applied by the game's scheduler that hasn't been reported yet
+        self.unreported_debt_interest: Optional[Tuple[float, float]] = None
 
         self.initialize_faction_standings()
 
@@ -409,17 +421,10 @@ class Character:
 
         if self.last_interest_time == 0:
             days_passed = int(current_time // PERIOD_LENGTH)
-            total_interest = 0.0
-            current_debt = self.debt
             if days_passed >= 1 and self.debt > 0:
-                for _ in range(days_passed):
-                    adjusted_rate = DAILY_INTEREST_RATE * self.debt_interest_mod
-                    interest = current_debt * adjusted_rate
-                    current_debt += interest
-                    total_interest += interest
-                self.debt = self.round_credits(current_debt)
-                self.last_interest_time = days_passed * PERIOD_LENGTH
-                return (self.round_credits(total_interest), self.debt)
+                return self._apply_debt_interest(
+                    DAILY_INTEREST_RATE, days_passed, PERIOD_LENGTH
+                )
             else:
                 self.last_interest_time = max(
                     0, current_time - PERIOD_LENGTH + 6)
@@ -429,18 +434,49 @@ class Character:
         days_passed = int(time_diff // PERIOD_LENGTH)
 
         if days_passed >= 1 and self.debt > 0:
-            total_interest = 0.0
-            current_debt = self.debt
-            for _ in range(days_passed):
-                adjusted_rate = DAILY_INTEREST_RATE * self.debt_interest_mod
-                interest = current_debt * adjusted_rate
-                current_debt += interest
-                total_interest += interest
-            self.debt = self.round_credits(current_debt)
-            self.last_interest_time += days_passed * PERIOD_LENGTH
-            return (self.round_credits(total_interest), self.debt)
+            return self._apply_debt_interest(
+                DAILY_INTEREST_RATE, days_passed, PERIOD_LENGTH
+            )
         return None
 
+    def accrue_debt_interest(self, current_time: int) -> None:
+        """Apply due debt interest, keeping it to be reported by collect_debt_interest."""
+        result = self.calculate_debt_interest(current_time)
+        if result is None:
+            return
+        if self.unreported_debt_interest is not None:
+            result = (
+                self.round_credits(self.unreported_debt_interest[0] + result[0]),
+                result[1],
+            )
+        self.unreported_debt_interest = result
+
+    def collect_debt_interest(self, current_time: int) -> Optional[Tuple[float, float]]:
+        """
+        Apply due debt interest and return (interest_amount, new_debt) for all
+        interest applied since the last call, or None if there was none.
+        """
+        self.accrue_debt_interest(current_time)
+        result = self.unreported_debt_interest
+        self.unreported_debt_interest = None
+        return result
+
+    def _apply_debt_interest(
+        self, daily_rate: float, days_passed: int, period_length: int
+    ) -> Tuple[float, float]:
+        """Compound the debt over days_passed periods and record the accrual."""
+        accrual = InterestAccrual(
+            principal=self.debt,
+            rate=daily_rate * self.debt_interest_mod,
+            periods=days_passed,
+            start_time=self.last_interest_time,
+            period_length=period_length,
+        )
+        self.debt_interest_accruals.append(accrual)
+        self.debt = self.round_credits(accrual.final_balance)
+        self.last_interest_time += days_passed * period_length
+        return (self.round_credits(accrual.total_interest), self.debt)
+
     def to_string(self) -> list[str]:
         trait_info = ""
         if self.positive_trait or self.negative_trait:
@@ -513,6 +549,9 @@ class Character:
             "reputation_explorers": self.reputation_explorers,
             "credits": self.credits,
             "debt": self.debt,
+            "debt_interest_accruals": [
+                asdict(accrual) for accrual in self.debt_interest_accruals
+            ],
             "positive_trait": self.positive_trait,
             "negative_trait": self.negative_trait,
         }
@@ -552,6 +591,10 @@ class Character:
         character.reputation_explorers = data.get("reputation_explorers", 0)
         character.positive_trait = data.get("positive_trait", "")
         character.negative_trait = data.get("negative_trait", "")
+        character.debt_interest_accruals.extend(
+            InterestAccrual(**accrual)
+            for accrual in data.get("debt_interest_accruals", [])
+        )
 
         character.apply_trait_effects()
 
@@ -628,19 +671,29 @@ class Game:
         mute_flag: bool = False,
         skip_customization: bool = False,
         seed: Optional[int] = None,
+        lazy_generation: bool = False,
+        workers: int = 1,
+        cache_dir: Optional[str] = None,
     ) -> None:
         if seed is None:
             seed = int(time.time())
         self.seed = seed
-        random.seed(self.seed)
+        # World generation draws from its own streams derived from the seed;
+        # the global generator only drives gameplay randomness
+        seed_rng(self.seed)
 
         self.global_time = 0
-        self.region = Region.generate_random_region("Local Sector", 50)
+        self.scheduler = GameScheduler()
+        self._schedule_time_effects()
+        self.lazy_generation = lazy_generation
+        self.region = self._load_or_generate_region(
+            "Local Sector", 50, lazy_generation, workers, cache_dir
+        )
         self.solar_systems = self.region.solar_systems
         self.current_solar_system_index = 0
-        current_system = self.solar_systems[self.current_solar_system_index]
+        current_system = self.get_current_solar_system()
         all_stations = current_system.get_all_stations()
-        self.rnd_station = random.choice(
+        self.rnd_station = derive_rng(self.seed, "start_station").choice(
             all_stations) if all_stations else None
         self.player_character: Character
         self.player_ship: Ship
@@ -652,9 +705,58 @@ class Game:
         self.sound_enabled = not mute_flag
 
         if self.sound_enabled:
-            pg.mixer.init()
-            pg.mixer.music.load("Decoherence.mp3")
-            pg.mixer.music.play(-1)
+            self.sound_enabled = audio.play_music("Decoherence.mp3")
+
+    def _load_or_generate_region(
+        self,
+        name: str,
+        num_systems: int,
+        lazy: bool,
+        workers: int,
+        cache_dir: Optional[str],
+    ) -> Region:
+        """
+        Load the region for this seed from the galaxy cache in cache_dir, or
+        generate it and store it there. No cache is used if cache_dir is None.
+
+        An eager start stores every system. A lazy start stores the stubs,
+        and each system it generates later is added to the cache file then.
+        """
+        cache = GalaxyCache(cache_dir) if cache_dir else None
+        region = (
+            cache.load(name, self.seed, num_systems, write_back=lazy)
+            if cache else None
+        )
+        if region is not None:
+            if not lazy:
+                stubs = list(region.solar_systems)
+                region.materialize_all(workers)
+                # A lazy start may have left systems out of the file
+                if not all(stub.is_cached for stub in stubs):  # type: ignore[union-attr]
+                    self._store_region(cache, name, stubs, region)  # type: ignore[arg-type]
+            return region
+
+        region = Region.generate_random_region(
+            name, num_systems, lazy=True, seed=self.seed
+        )
+        stubs = list(region.solar_systems)
+        if not lazy:
+            region.materialize_all(workers)
+        if cache and self._store_region(cache, name, stubs, region) and lazy:
+            # Generate the systems from the cache file, so they are added to it
+            region = cache.load(name, self.seed, num_systems, write_back=True) or region
+        return region
+
+    def _store_region(
+        self, cache: GalaxyCache, name: str, stubs: list, region: Region
+    ) -> bool:
+        """Store region in the galaxy cache, returning whether that worked."""
+        try:
+            cache.store(name, self.seed, stubs, region.solar_systems)
+        except OSError as e:
+            print(f"Warning: could not write galaxy cache: {e}")
+            return False
+        return True
 
     def set_player_character(
         self,
@@ -691,8 +793,8 @@ class Game:
         return self.player_character
 
     def get_current_solar_system(self) -> SolarSystem:
-        """Returns the current solar system the player is in."""
-        return self.solar_systems[self.current_solar_system_index]
+        """Returns the current solar system the player is in, generating it on first visit."""
+        return materialize_system(self.solar_systems, self.current_solar_system_index)
 
     def add_solar_system(self, solar_system: SolarSystem) -> None:
         """Adds a new solar system to the game."""
@@ -701,8 +803,40 @@ class Game:
     def get_solar_system(self) -> SolarSystem:
         return self.get_current_solar_system()
 
-    def advance_time(self, time_delta: timedelta) -> None:
-        self.global_time += int(time_delta.total_seconds())
+    def advance_time(self, time_delta: Union[timedelta, float]) -> None:
+        """
+        Move the game clock forward by time_delta (a timedelta, or seconds)
+        and run the scheduled events that fell due on the way.
+        """
+        if isinstance(time_delta, timedelta):
+            self.global_time += int(time_delta.total_seconds())
+        else:
+            self.global_time += time_delta
+        self.scheduler.run_until(self.global_time)
+
+    def _schedule_time_effects(self) -> None:
+        """Register the effects that play out over game time with the scheduler."""
+        self.scheduler.schedule_periodic(
+            "debt_interest", DAY_SECONDS, DAY_SECONDS, self._on_debt_interest
+        )
+        self.scheduler.schedule_periodic(
+            "savings_interest", WEEK_SECONDS, WEEK_SECONDS, self._on_savings_interest
+        )
+
+    def _on_debt_interest(self, due_time: float, occurrences: int) -> None:
+        # Character.calculate_debt_interest works out how many days are due
+        # itself, so coalesced occurrences take a single call
+        character = getattr(self, "player_character", None)
+        if character is not None:
+            character.accrue_debt_interest(int(self.global_time / 3600))
+
+    def _on_savings_interest(self, due_time: float, occurrences: int) -> None:
+        from src.commands.banking import calculate_savings_interest
+
+        character = getattr(self, "player_character", None)
+        if character is not None:
+            calculate_savings_interest(
+                self, character, int(self.global_time / 3600))
 
     def get_region(self) -> Region:
         return self.region
@@ -764,9 +898,9 @@ class Game:
                 game.player_character = Character.from_dict(data["player_character"])
             
             if "solar_systems" in data:
-                from .solar_system import SolarSystem
                 game.solar_systems = [
-                    SolarSystem.from_dict(ss_data) for ss_data in data["solar_systems"]
+                    system_from_dict(ss_data, index)
+                    for index, ss_data in enumerate(data["solar_systems"])
                 ]
             
             if "region" in data and data["region"]:
@@ -0,0 +1,83 @@
+import math
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+# Balances stop growing here instead of overflowing, so that compounding over
+# an absurdly long stretch of game time still leaves a usable number
+MAX_BALANCE = 1e300
+
+
+def compound(principal: float, rate: float, periods: int) -> float:
+    """
+    Balance after compounding principal at rate for a whole number of periods.
+
+    The balance saturates at +/-MAX_BALANCE rather than overflowing.
+    """
+    if periods <= 0 or principal == 0:
+        return principal
+    if rate > 0:
+        growth_log = periods * math.log1p(rate)
+        balance_log = math.log(abs(principal)) + growth_log
+        if balance_log > math.log(MAX_BALANCE):
+            return math.copysign(MAX_BALANCE, principal)
+        if growth_log > math.log(MAX_BALANCE):
+            # The growth factor alone overflows, but not the (tiny) principal grown by it
+            return math.copysign(math.exp(balance_log), principal)
+    return principal * (1 + rate) ** periods
+
+
+@dataclass(frozen=True)
+class InterestStatement:
+    """One compounding period of an InterestAccrual."""
+
+    period: int  # 1-based index within the accrual
+    start_time: float
+    opening_balance: float
+    interest: float
+    closing_balance: float
+
+
+@dataclass(frozen=True)
+class InterestAccrual:
+    """
+    Interest applied to a balance over several periods in one step.
+
+    Only the principal, rate and period count are stored; the per-period
+    statements are computed on demand, so an accrual covering millions of
+    periods costs no more to record than one covering a single period.
+    """
+
+    principal: float
+    rate: float
+    periods: int
+    start_time: float
+    period_length: float
+
+    @property
+    def final_balance(self) -> float:
+        return compound(self.principal, self.rate, self.periods)
+
+    @property
+    def total_interest(self) -> float:
+        return self.final_balance - self.principal
+
+    def statement(self, period: int) -> InterestStatement:
+        if not 1 <= period <= self.periods:
+            raise IndexError(f"period {period} is outside 1..{self.periods}")
+        opening = compound(self.principal, self.rate, period - 1)
+        closing = compound(self.principal, self.rate, period)
+        return InterestStatement(
+            period=period,
+            start_time=self.start_time + (period - 1) * self.period_length,
+            opening_balance=opening,
+            interest=closing - opening,
+            closing_balance=closing,
+        )
+
+    def statements(
+        self, first: int = 1, last: Optional[int] = None
+    ) -> Iterator[InterestStatement]:
+        """Yield the statements for periods first..last (inclusive), one at a time."""
+        last = self.periods if last is None else min(last, self.periods)
+        for period in range(max(first, 1), last + 1):
+            yield self.statement(period)
@@ -0,0 +1,582 @@
+"""
+Columnar market storage for vectorized network-wide ticks.
+
+This module implements MarketColumns, which keeps the per-item state of every
+market in a MarketNetwork in NumPy arrays so the network can advance all of
+its (station, item) pairs in one vectorized step, and the ColumnMarketData and
+ColumnPriceHistory views that let the rest of the economy code keep working
+with MarketData objects for individual items.
+"""
+
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.classes.market_data import (
+    PRICE_HISTORY_LENGTH,
+    TREND_SMOOTHING,
+    VOLATILITY_WINDOW,
+    MarketData,
+    PriceHistory,
+    StationMarket,
+)
+
+if TYPE_CHECKING:
+    from src.classes.market_simulator import MarketSimulator
+
+# A set of rows: a slice when they are consecutive, as a market's usually are
+Rows = Union[np.ndarray, slice]
+
+
+def _row_count(rows: Rows) -> int:
+    if isinstance(rows, slice):
+        return rows.stop - rows.start
+    return len(rows)
+
+
+def _row_numbers(rows: Rows, picked: np.ndarray) -> np.ndarray:
+    """The row numbers of the entries of rows at the positions picked."""
+    if isinstance(rows, slice):
+        return picked + rows.start
+    return rows[picked]
+
+
+def _row_value(column: str) -> property:
+    """A float attribute backed by the object's row of a MarketColumns column."""
+
+    def get(self) -> float:
+        return getattr(self._columns, column).item(self._row)
+
+    def set(self, value: float) -> None:
+        getattr(self._columns, column)[self._row] = value
+
+    return property(get, set)
+
+
+def _window_value(column: str) -> property:
+    """A window statistic of the object's row, brought up to date before it is read."""
+
+    def get(self) -> float:
+        columns = self._columns
+        if columns.stats_stale[self._row]:
+            columns.refresh_stats()
+        return getattr(columns, column).item(self._row)
+
+    return property(get)
+
+
+class ColumnPriceHistory(PriceHistory):
+    """
+    PriceHistory of one row of a MarketColumns.
+    
+    The row's entries sit in a plain ring of history_length slots, entry n
+    at slot n % history_length, so a tick writes each recorded price once.
+    Reads put the ring in order first, which costs a copy of the entries
+    read; appending goes through MarketColumns.append_history.
+    """
+    
+    __slots__ = ("_columns", "_row")
+    
+    def __init__(self, columns: "MarketColumns", row: int):
+        self.capacity = columns.history_length
+        self._columns = columns
+        self._row = row
+    
+    @property  # type: ignore[override]
+    def _timestamps(self) -> np.ndarray:
+        return self._columns.history_timestamps[self._row]
+    
+    @property  # type: ignore[override]
+    def _prices(self) -> np.ndarray:
+        return self._columns.history_prices[self._row]
+    
+    @property  # type: ignore[override]
+    def _length(self) -> int:
+        return min(int(self._columns.history_count[self._row]), self.capacity)
+    
+    @property  # type: ignore[override]
+    def _start(self) -> int:
+        return (int(self._columns.history_count[self._row]) - self._length) % self.capacity
+    
+    def append(self, timestamp: float, price: float) -> None:
+        self._columns.append_history(self._row, timestamp, price)
+    
+    def _window(self, values: np.ndarray, last: Optional[int]) -> memoryview:  # type: ignore[override]
+        length = self._length
+        count = length if last is None else max(0, min(last, length))
+        end = self._start + length
+        return memoryview(values[np.arange(end - count, end) % self.capacity])
+    
+    def price_back(self, count: int) -> Optional[float]:
+        length = self._length
+        if not 0 < count <= length:
+            return None
+        return float(self._prices[(self._start + length - count) % self.capacity])
+    
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[float, float], List[Tuple[float, float]]]:
+        if isinstance(index, slice):
+            return super().__getitem__(index)
+        length = self._length
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("price history index out of range")
+        slot = (self._start + index) % self.capacity
+        return (float(self._timestamps[slot]), float(self._prices[slot]))
+
+
+class ColumnWindowStats:
+    """
+    The PriceWindowStats of one row of a MarketColumns.
+    
+    A tick changes the histories of most rows at once, so rather than keep
+    every row's statistics up to date, MarketColumns.refresh_stats computes
+    them for all rows whose history has changed, in one go, the first time
+    any of them is read.
+    """
+    
+    __slots__ = ("_columns", "_row", "window")
+    
+    def __init__(self, columns: "MarketColumns", row: int):
+        self._columns = columns
+        self._row = row
+        self.window = VOLATILITY_WINDOW
+    
+    mean = _window_value("window_mean")
+    variance = _window_value("window_variance")
+    trend_ewma = _window_value("trend_ewma")
+    _count = _window_value("window_count")
+    _low = _window_value("window_low")
+    _high = _window_value("window_high")
+    
+    @property
+    def count(self) -> int:
+        return int(self._count)
+    
+    @property
+    def low(self) -> Optional[float]:
+        return self._low if self.count else None
+    
+    @property
+    def high(self) -> Optional[float]:
+        return self._high if self.count else None
+
+
+class ColumnMarketData(MarketData):
+    """
+    MarketData of an item whose state lives in a row of a MarketColumns.
+    
+    Prices, supply/demand levels, the trend and the history are read from
+    and written to the columns, so changes made through this object and
+    changes made by a vectorized tick are the same changes.
+    """
+    
+    def __init__(self, columns: "MarketColumns", row: int, item_id: str, transaction_volume: float):
+        self._columns = columns
+        self._row = row
+        self.item_id = item_id
+        self.transaction_volume = transaction_volume
+    
+    base_price = _row_value("base_price")  # type: ignore[assignment]
+    current_price = _row_value("current_price")  # type: ignore[assignment]
+    supply_level = _row_value("supply_level")  # type: ignore[assignment]
+    demand_level = _row_value("demand_level")  # type: ignore[assignment]
+    price_trend = _row_value("price_trend")  # type: ignore[assignment]
+    last_update = _row_value("last_update")  # type: ignore[assignment]
+    
+    @property  # type: ignore[override]
+    def price_history(self) -> PriceHistory:
+        return ColumnPriceHistory(self._columns, self._row)
+    
+    @property  # type: ignore[override]
+    def price_stats(self) -> ColumnWindowStats:
+        return ColumnWindowStats(self._columns, self._row)
+    
+    def calculate_price_volatility(self) -> float:
+        columns = self._columns
+        if columns.stats_stale[self._row]:
+            columns.refresh_stats()
+        return columns.volatility.item(self._row)
+    
+    def update_price(self, new_price: float, timestamp: Optional[float] = None) -> None:
+        self._columns.record_price(
+            self._row, new_price, time.time() if timestamp is None else timestamp
+        )
+
+
+class MarketColumns:
+    """
+    The per-item state of every market in a network, one row per (station, item).
+    
+    Each item column is a NumPy array indexed by row and each market column
+    one indexed by market, and row_market maps rows to their market. A
+    market's items are replaced by ColumnMarketData views when it is added,
+    and its simulator keeps its clock and parameters here too, so tick can
+    update every market with a few array operations per column rather than
+    a Python loop per item. Arrays grow by doubling as markets are added;
+    the rows of a removed market stay but are no longer ticked.
+    """
+    
+    ITEM_COLUMNS = (
+        "base_price", "current_price", "supply_level", "demand_level",
+        "price_trend", "trend_ewma", "last_update", "recorded_price",
+    )
+    # Columns of the statistics ColumnWindowStats reads
+    WINDOW_COLUMNS = (
+        "window_count", "window_mean", "window_variance", "window_low", "window_high",
+        "volatility",
+    )
+    MARKET_COLUMNS = (
+        "last_simulation_time", "base_decay_rate", "time_evolution_factor",
+        "npc_trade_frequency", "events_per_hour",
+    )
+    # Column of each market's StationMarket.last_market_update
+    MARKET_UPDATE_COLUMN = "last_market_update"
+    
+    def __init__(self, history_length: int = PRICE_HISTORY_LENGTH):
+        """
+        Initialize an empty store.
+        
+        Args:
+            history_length: Price history entries kept per item
+        """
+        self.history_length = history_length
+        self.row_count = 0
+        self.market_count = 0
+        # Seeded from the random module, so seeded games get the same ticks
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        
+        self.row_market = np.zeros(0, dtype=np.int64)
+        for name in (*self.ITEM_COLUMNS, *self.WINDOW_COLUMNS):
+            setattr(self, name, np.zeros(0))
+        # Rows whose history has changed since refresh_stats last ran
+        self.stats_stale = np.zeros(0, dtype=bool)
+        # Price history rings, and how many entries each row has had
+        self.history_timestamps = np.zeros((0, history_length))
+        self.history_prices = np.zeros((0, history_length))
+        self.history_count = np.zeros(0, dtype=np.int64)
+        
+        for name in (*self.MARKET_COLUMNS, self.MARKET_UPDATE_COLUMN):
+            setattr(self, name, np.zeros(0))
+        self.market_active = np.zeros(0, dtype=bool)
+        self.simulators: List["MarketSimulator"] = []
+        self.market_rows: List[Rows] = []
+        self._market_index: Dict[str, int] = {}
+    
+    def add_market(self, simulator: "MarketSimulator") -> int:
+        """
+        Move a simulator's market into the store and return its market index.
+        
+        The market's MarketData objects are replaced by ColumnMarketData
+        views of their new rows, and items added to the market later are
+        given rows by bind_item.
+        """
+        market = simulator.market
+        index = self.market_count
+        self._grow_markets(index + 1)
+        self.market_count = index + 1
+        self.market_active[index] = True
+        self.simulators.append(simulator)
+        self.market_rows.append(slice(self.row_count, self.row_count))
+        self._market_index[market.station_id] = index
+        
+        for name in self.MARKET_COLUMNS:
+            getattr(self, name)[index] = getattr(simulator, name)
+        self.last_market_update[index] = market.last_market_update
+        
+        market.column_index = index
+        market.columns = self
+        for item_id, market_data in list(market.market_items.items()):
+            market.market_items[item_id] = self.bind_item(market, market_data)
+        return index
+    
+    def remove_market(self, station_id: str) -> None:
+        """Stop ticking a market; its items keep working as views of their rows."""
+        index = self._market_index.pop(station_id, None)
+        if index is not None:
+            self.market_active[index] = False
+    
+    def bind_item(self, market: StationMarket, market_data: MarketData) -> ColumnMarketData:
+        """
+        Give market_data a row of market's and return the view of it.
+        
+        An item that replaces one of the market's bound items takes over
+        the old item's row.
+        """
+        index = self._market_index[market.station_id]
+        replaced = market.market_items.get(market_data.item_id)
+        if isinstance(replaced, ColumnMarketData) and replaced._columns is self:
+            row = replaced._row
+            self.history_count[row] = 0
+        else:
+            row = self.row_count
+            self._grow_rows(row + 1)
+            self.row_count = row + 1
+            self.row_market[row] = index
+            rows = self.market_rows[index]
+            if isinstance(rows, slice) and rows.stop == row:
+                self.market_rows[index] = slice(rows.start, row + 1)
+            else:
+                if isinstance(rows, slice):
+                    rows = np.arange(rows.start, rows.stop)
+                self.market_rows[index] = np.append(rows, row)
+        
+        self.base_price[row] = market_data.base_price
+        self.current_price[row] = market_data.current_price
+        self.supply_level[row] = market_data.supply_level
+        self.demand_level[row] = market_data.demand_level
+        self.price_trend[row] = market_data.price_trend
+        self.trend_ewma[row] = market_data.get_smoothed_trend()
+        self.last_update[row] = market_data.last_update
+        # A price that was never recorded drifts from the base price
+        self.recorded_price[row] = market_data.base_price
+        for timestamp, price in market_data.price_history:
+            self.append_history(row, timestamp, price)
+        self.stats_stale[row] = True
+        
+        return ColumnMarketData(self, row, market_data.item_id, market_data.transaction_volume)
+    
+    def _grow_rows(self, needed: int) -> None:
+        capacity = len(self.row_market)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, 2 * capacity, 64)
+        for name in (
+            "row_market", "stats_stale", "history_count", *self.ITEM_COLUMNS, *self.WINDOW_COLUMNS
+        ):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+        # The rings are filled in now rather than left to the allocator, so
+        # the first tick to write to them does not fault their pages in
+        for name in ("history_timestamps", "history_prices"):
+            old = getattr(self, name)
+            new = np.empty((new_capacity, self.history_length))
+            new[:capacity] = old
+            new[capacity:] = 0.0
+            setattr(self, name, new)
+    
+    def _grow_markets(self, needed: int) -> None:
+        capacity = len(self.market_active)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, 2 * capacity, 16)
+        for name in ("market_active", *self.MARKET_COLUMNS, self.MARKET_UPDATE_COLUMN):
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+    
+    def append_history(self, row: int, timestamp: float, price: float) -> None:
+        """Add an entry to a row's price history, as PriceHistory.append does."""
+        count = self.history_count.item(row)
+        slot = count % self.history_length
+        self.history_timestamps[row, slot] = timestamp
+        self.history_prices[row, slot] = price
+        self.history_count[row] = count + 1
+        self.recorded_price[row] = price
+        self.stats_stale[row] = True
+    
+    def record_price(self, row: int, new_price: float, timestamp: float) -> None:
+        """Set a row's price and record it, as MarketData.update_price does."""
+        current_price = self.current_price.item(row)
+        if current_price > 0:
+            price_trend = (new_price - current_price) / current_price
+            trend_ewma = self.trend_ewma.item(row)
+            self.price_trend[row] = price_trend
+            self.trend_ewma[row] = trend_ewma + TREND_SMOOTHING * (price_trend - trend_ewma)
+        self.append_history(row, timestamp, new_price)
+        self.current_price[row] = new_price
+        self.last_update[row] = timestamp
+    
+    def market_volatility(self, index: int) -> np.ndarray:
+        """The calculate_price_volatility of each of a market's items, in market_rows order."""
+        rows = self.market_rows[index]
+        if self.stats_stale[rows].any():
+            self.refresh_stats()
+        return self.volatility[rows]
+    
+    def refresh_stats(self) -> None:
+        """
+        Recompute the window statistics of every row whose history has changed.
+        
+        The statistics PriceWindowStats keeps, over each row's last
+        VOLATILITY_WINDOW prices, computed for all those rows together from
+        a rows x window array of their prices.
+        """
+        rows = np.flatnonzero(self.stats_stale[:self.row_count])
+        if not len(rows):
+            return
+        count = self.history_count[rows]
+        size = np.minimum(count, min(self.history_length, VOLATILITY_WINDOW))
+        back = np.arange(1, VOLATILITY_WINDOW + 1)
+        slots = (count[:, np.newaxis] - back) % self.history_length
+        prices = self.history_prices[rows[:, np.newaxis], slots]
+        in_window = back <= size[:, np.newaxis]
+        
+        divisor = np.maximum(size, 1)
+        mean = np.where(in_window, prices, 0.0).sum(axis=1) / divisor
+        deviation = np.where(in_window, prices - mean[:, np.newaxis], 0.0)
+        variance = (deviation * deviation).sum(axis=1) / divisor
+        self.window_count[rows] = size
+        self.window_mean[rows] = mean
+        self.window_variance[rows] = variance
+        # As calculate_price_volatility works it out from the statistics
+        self.volatility[rows] = np.where(
+            (size >= 2) & (mean > 0), np.sqrt(variance) / np.where(mean > 0, mean, 1.0), 0.0
+        )
+        self.window_low[rows] = np.where(in_window, prices, np.inf).min(axis=1)
+        self.window_high[rows] = np.where(in_window, prices, -np.inf).max(axis=1)
+        self.stats_stale[rows] = False
+    
+    def simulators_behind(self, current_time: float) -> List["MarketSimulator"]:
+        """The simulators of the active markets not yet simulated up to current_time."""
+        markets = self.market_count
+        behind = self.market_active[:markets] & (
+            self.last_simulation_time[:markets] < current_time
+        )
+        return [self.simulators[index] for index in np.flatnonzero(behind)]
+    
+    def tick(self, current_time: float) -> None:
+        """
+        Bring every active market up to game time current_time in one step.
+        
+        Does for all markets at once what MarketSimulator.update_prices does
+        for one: NPC trades, time evolution and market events over each
+        market's time since its last update. Trade and event counts are
+        drawn for every market together and only the few markets that get
+        any run them, through their simulators.
+        """
+        markets = self.market_count
+        if markets == 0:
+            return
+        last_time = self.last_simulation_time[:markets]
+        elapsed = np.where(self.market_active[:markets], current_time - last_time, 0.0)
+        np.maximum(elapsed, 0.0, out=elapsed)
+        active = elapsed > 0
+        if not active.any():
+            return
+        last_time[active] = current_time
+        
+        frequency = self.npc_trade_frequency[:markets]
+        trade_counts = self.rng.poisson(elapsed * frequency * frequency)
+        for index in np.flatnonzero(trade_counts):
+            simulator = self.simulators[index]
+            for _ in range(trade_counts[index]):
+                simulator._execute_npc_trade()
+        
+        if active.all():
+            self.evolve(slice(0, self.row_count), elapsed, current_time)
+        else:
+            rows = np.flatnonzero(active[self.row_market[:self.row_count]])
+            self.evolve(rows, elapsed, current_time)
+        
+        event_counts = self.rng.poisson(elapsed * self.events_per_hour[:markets] / 3600)
+        for index in np.flatnonzero(event_counts):
+            simulator = self.simulators[index]
+            for _ in range(event_counts[index]):
+                simulator._trigger_market_event()
+        
+        self.last_market_update[:markets][active] = current_time
+    
+    def evolve_market(self, index: int, time_elapsed: float, current_time: float) -> None:
+        """Apply MarketSimulator._apply_time_evolution to one market's rows."""
+        rows = self.market_rows[index]
+        if _row_count(rows):
+            elapsed = np.zeros(self.market_count)
+            elapsed[index] = time_elapsed
+            self.evolve(rows, elapsed, current_time)
+    
+    def evolve(self, rows: Rows, elapsed: np.ndarray, current_time: float) -> None:
+        """
+        Apply time evolution to rows, elapsed[m] seconds of it to the rows of market m.
+        
+        The same model as MarketSimulator._apply_time_evolution: an exact
+        exponential decay towards the base levels, uniform noise whose
+        spread grows with the square root of the time, prices no lower than
+        a tenth of the base price, and prices recorded in the history once
+        they are 0.01 away from the last recorded one. The decay factors are
+        computed once per market, every column once for all rows, and the
+        recorded prices and their history entries are written in one batch.
+        """
+        markets = len(elapsed)
+        evolution = self.time_evolution_factor[:markets]
+        price_decay = -np.expm1(-self.base_decay_rate[:markets] * evolution * elapsed)
+        level_decay = -np.expm1(-0.01 * evolution * elapsed)
+        noise_scale = evolution * np.sqrt(elapsed)
+        
+        market = self.row_market[rows]
+        current_price = self.current_price[rows]
+        base_price = self.base_price[rows]
+        random_factor = (self.rng.random(len(market)) * 0.04 - 0.02) * noise_scale[market]
+        new_price = current_price - (current_price - base_price) * price_decay[market]
+        new_price += base_price * random_factor
+        np.maximum(new_price, base_price * 0.1, out=new_price)
+        
+        # Prices that moved significantly are recorded, as update_price would
+        recorded = np.flatnonzero(np.abs(new_price - self.recorded_price[rows]) > 0.01)
+        self._record_prices(
+            _row_numbers(rows, recorded), new_price[recorded], current_price[recorded], current_time
+        )
+        self.current_price[rows] = new_price
+        
+        level_decay = level_decay[market]
+        supply_level = self.supply_level[rows]
+        self.supply_level[rows] = np.clip(supply_level + (0.5 - supply_level) * level_decay, 0.0, 1.0)
+        demand_level = self.demand_level[rows]
+        self.demand_level[rows] = np.clip(demand_level + (0.5 - demand_level) * level_decay, 0.0, 1.0)
+    
+    def relax_market(self, index: int, time_elapsed: float, current_time: float) -> None:
+        """Apply MarketSimulator._relax to one market's rows."""
+        rows = self.market_rows[index]
+        if not _row_count(rows):
+            return
+        evolution = self.time_evolution_factor.item(index)
+        price_retention = math.exp(-self.base_decay_rate.item(index) * evolution * time_elapsed)
+        level_retention = math.exp(-0.01 * evolution * time_elapsed)
+        
+        current_price = self.current_price[rows]
+        base_price = self.base_price[rows]
+        new_price = np.maximum(base_price * 0.1, base_price + (current_price - base_price) * price_retention)
+        moved = np.flatnonzero(np.abs(new_price - current_price) > 0.01)
+        if len(moved):
+            moved_rows = _row_numbers(rows, moved)
+            self._record_prices(moved_rows, new_price[moved], current_price[moved], current_time)
+            self.current_price[moved_rows] = new_price[moved]
+        
+        self.supply_level[rows] = 0.5 + (self.supply_level[rows] - 0.5) * level_retention
+        self.demand_level[rows] = 0.5 + (self.demand_level[rows] - 0.5) * level_retention
+    
+    def _record_prices(
+        self, rows: np.ndarray, new_prices: np.ndarray, old_prices: np.ndarray, current_time: float
+    ) -> None:
+        """
+        Record new_prices for rows, as update_price would, in one batch.
+        
+        Only the bookkeeping of the recording is done here: the trend, the
+        history and the stamps. Setting current_price is left to the caller,
+        which usually sets it for more rows than it records.
+        """
+        if not len(rows):
+            return
+        trending = old_prices > 0
+        trend_rows = rows[trending]
+        old_prices = old_prices[trending]
+        price_trend = (new_prices[trending] - old_prices) / old_prices
+        self.price_trend[trend_rows] = price_trend
+        self.trend_ewma[trend_rows] += TREND_SMOOTHING * (price_trend - self.trend_ewma[trend_rows])
+        
+        self.recorded_price[rows] = new_prices
+        self.last_update[rows] = current_time
+        self.stats_stale[rows] = True
+        count = self.history_count[rows]
+        slots = rows * self.history_length + count % self.history_length
+        self.history_timestamps.reshape(-1)[slots] = current_time
+        self.history_prices.reshape(-1)[slots] = new_prices
+        self.history_count[rows] = count + 1
@@ -5,10 +5,200 @@ This module implements the MarketData and StationMarket classes that provide
 price history tracking, trend analysis, and market management functionality.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+import math
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
 import time
 
+if TYPE_CHECKING:
+    from src.classes.market_columns import MarketColumns
+
+PRICE_HISTORY_LENGTH = 100  # Price changes kept per item
+VOLATILITY_WINDOW = 20  # Most recent prices that volatility is measured over
+TREND_SMOOTHING = 0.2  # Weight of the latest price change in the smoothed trend
+
+
+class PriceHistory:
+    """
+    The last capacity (timestamp, price) pairs of an item, oldest first.
+    
+    A ring buffer over two preallocated arrays of doubles, so appending is
+    O(1) and allocates nothing. Every value is written twice, at its slot and
+    capacity slots further on, which keeps any run of recent entries
+    contiguous: timestamps() and prices() hand out memoryviews of the last n
+    entries without copying them. Indexing, slicing and iteration work like
+    the list of tuples this replaces.
+    """
+    
+    __slots__ = ("capacity", "_timestamps", "_prices", "_start", "_length")
+    
+    def __init__(
+        self,
+        pairs: Iterable[Tuple[float, float]] = (),
+        capacity: int = PRICE_HISTORY_LENGTH,
+    ):
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(16 * capacity))  # 2 * capacity zeros
+        self._prices = array("d", bytes(16 * capacity))
+        self._start = 0
+        self._length = 0
+        for timestamp, price in pairs:
+            self.append(timestamp, price)
+    
+    def append(self, timestamp: float, price: float) -> None:
+        """Add an entry, dropping the oldest one if the history is full."""
+        capacity = self.capacity
+        slot = (self._start + self._length) % capacity
+        self._timestamps[slot] = self._timestamps[slot + capacity] = timestamp
+        self._prices[slot] = self._prices[slot + capacity] = price
+        if self._length < capacity:
+            self._length += 1
+        else:
+            self._start = (self._start + 1) % capacity
+    
+    def timestamps(self, last: Optional[int] = None) -> memoryview:
+        """The last entries' timestamps (all of them by default), oldest first."""
+        return self._window(self._timestamps, last)
+    
+    def prices(self, last: Optional[int] = None) -> memoryview:
+        """The last entries' prices (all of them by default), oldest first."""
+        return self._window(self._prices, last)
+    
+    def price_back(self, count: int) -> Optional[float]:
+        """The price count entries back (1 is the latest), or None if there are fewer."""
+        if not 0 < count <= self._length:
+            return None
+        return self._prices[self._start + self._length - count]
+    
+    def _window(self, values: array, last: Optional[int]) -> memoryview:
+        count = self._length if last is None else max(0, min(last, self._length))
+        end = self._start + self._length
+        return memoryview(values)[end - count:end]
+    
+    def to_list(self) -> List[Tuple[float, float]]:
+        return list(zip(self.timestamps(), self.prices()))
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        return zip(self.timestamps(), self.prices())
+    
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[float, float], List[Tuple[float, float]]]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(self._length)[index]]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("price history index out of range")
+        slot = self._start + index
+        return (self._timestamps[slot], self._prices[slot])
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PriceHistory):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == [tuple(pair) for pair in other]
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"PriceHistory({self.to_list()!r}, capacity={self.capacity})"
+
+
+class PriceWindowStats:
+    """
+    Statistics over the last window prices, kept up to date one price at a time.
+    
+    The mean and variance are maintained with Welford's method adapted to a
+    sliding window, and the lowest and highest prices with monotonic deques,
+    so each new price costs O(1) and reading any of them needs no rescan.
+    Also keeps an exponentially weighted moving average of the relative price
+    changes. Sliding-window updates accumulate rounding error, so the owner
+    rebuilds the stats from the actual prices every REBUILD_INTERVAL prices.
+    """
+    
+    REBUILD_INTERVAL = 1000
+    
+    __slots__ = (
+        "window", "count", "mean", "_m2", "_lows", "_highs", "_seen",
+        "trend_ewma", "updates_since_rebuild",
+    )
+    
+    def __init__(self, window: int = VOLATILITY_WINDOW):
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        # (sequence number, price), prices increasing / decreasing from the left
+        self._lows: deque = deque()
+        self._highs: deque = deque()
+        self._seen = 0
+        self.trend_ewma = 0.0
+        self.updates_since_rebuild = 0
+    
+    def add(self, price: float, leaving: Optional[float] = None) -> None:
+        """
+        Add price to the window. Once the window is full, leaving must be the
+        price that drops out of it.
+        """
+        if leaving is None or self.count < self.window:
+            self.count += 1
+            delta = price - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (price - self.mean)
+        else:
+            old_mean = self.mean
+            self.mean += (price - leaving) / self.count
+            self._m2 += (price - leaving) * (price - self.mean + leaving - old_mean)
+            self._m2 = max(0.0, self._m2)
+        
+        sequence = self._seen
+        self._seen = sequence + 1
+        entry = (sequence, price)
+        oldest_kept = sequence + 1 - self.window
+        lows = self._lows
+        while lows and lows[-1][1] >= price:
+            lows.pop()
+        lows.append(entry)
+        if lows[0][0] < oldest_kept:
+            lows.popleft()
+        highs = self._highs
+        while highs and highs[-1][1] <= price:
+            highs.pop()
+        highs.append(entry)
+        if highs[0][0] < oldest_kept:
+            highs.popleft()
+        self.updates_since_rebuild += 1
+    
+    def add_trend(self, price_trend: float) -> None:
+        self.trend_ewma += TREND_SMOOTHING * (price_trend - self.trend_ewma)
+    
+    def rebuild(self, prices: Iterable[float]) -> None:
+        """Recompute everything but the trend average from the window's prices."""
+        trend_ewma = self.trend_ewma
+        self.__init__(self.window)  # type: ignore[misc]
+        self.trend_ewma = trend_ewma
+        for price in prices:
+            self.add(price)
+        self.updates_since_rebuild = 0
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the prices in the window."""
+        return self._m2 / self.count if self.count else 0.0
+    
+    @property
+    def low(self) -> Optional[float]:
+        return self._lows[0][1] if self._lows else None
+    
+    @property
+    def high(self) -> Optional[float]:
+        return self._highs[0][1] if self._highs else None
+
 
 @dataclass
 class MarketData:
@@ -24,29 +214,47 @@ class MarketData:
     supply_level: float = 0.5  # 0.0 (none) to 1.0 (abundant)
     demand_level: float = 0.5  # 0.0 (none) to 1.0 (high demand)
     price_trend: float = 0.0  # Negative for falling, positive for rising
-    price_history: List[Tuple[float, float]] = field(default_factory=list)  # (timestamp, price) pairs
+    price_history: PriceHistory = field(default_factory=PriceHistory)  # (timestamp, price) pairs
     transaction_volume: float = 0.0  # Recent transaction volume
     last_update: float = field(default_factory=time.time)
+    price_stats: PriceWindowStats = field(
+        default_factory=PriceWindowStats, init=False, repr=False, compare=False
+    )
     
-    def update_price(self, new_price: float) -> None:
+    def __post_init__(self):
+        # Accept a plain list of (timestamp, price) pairs, e.g. from a save file
+        if not isinstance(self.price_history, PriceHistory):
+            self.price_history = PriceHistory(self.price_history)
+        self.price_stats.trend_ewma = self.price_trend
+        self.price_stats.rebuild(self.price_history.prices(self.price_stats.window))
+    
+    def update_price(self, new_price: float, timestamp: Optional[float] = None) -> None:
         """
         Update the current price and add to price history.
         
         Args:
             new_price: The new price for this item
+            timestamp: When the price changed, e.g. in game time; defaults to now
         """
-        current_time = time.time()
+        current_time = time.time() if timestamp is None else timestamp
         
         # Calculate price trend
         if self.current_price > 0:
             self.price_trend = (new_price - self.current_price) / self.current_price
+            self.price_stats.add_trend(self.price_trend)
+        
+        # Update the windowed statistics with the price entering the window
+        # and the one leaving it
+        stats = self.price_stats
+        leaving = self.price_history.price_back(stats.window)
         
-        # Add to price history
-        self.price_history.append((current_time, new_price))
+        # Add to price history (keeps only the last PRICE_HISTORY_LENGTH entries)
+        self.price_history.append(current_time, new_price)
         
-        # Keep only recent history (last 100 entries)
-        if len(self.price_history) > 100:
-            self.price_history = self.price_history[-100:]
+        if stats.updates_since_rebuild >= stats.REBUILD_INTERVAL:
+            stats.rebuild(self.price_history.prices(stats.window))
+        else:
+            stats.add(new_price, leaving)
         
         # Update current price and timestamp
         self.current_price = new_price
@@ -110,20 +318,35 @@ class MarketData:
         Returns:
             Volatility measure (0.0 = stable, higher = more volatile)
         """
-        if len(self.price_history) < 2:
-            return 0.0
-        
-        # Calculate standard deviation of recent price changes
-        recent_prices = [price for _, price in self.price_history[-20:]]
-        if len(recent_prices) < 2:
+        stats = self.price_stats
+        if stats.count < 2:
             return 0.0
         
-        mean_price = sum(recent_prices) / len(recent_prices)
-        variance = sum((price - mean_price) ** 2 for price in recent_prices) / len(recent_prices)
-        volatility = (variance ** 0.5) / mean_price if mean_price > 0 else 0.0
+        # Standard deviation of the recent prices relative to their mean,
+        # maintained by update_price
+        mean_price = stats.mean
+        volatility = math.sqrt(stats.variance) / mean_price if mean_price > 0 else 0.0
         
         return volatility
     
+    def get_price_range(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Get the lowest and highest of the prices volatility is measured over.
+        
+        Returns:
+            (low, high), or (None, None) if there is no price history
+        """
+        return self.price_stats.low, self.price_stats.high
+    
+    def get_smoothed_trend(self) -> float:
+        """
+        Get an exponentially weighted average of recent relative price changes.
+        
+        Returns:
+            Smoothed trend (negative for falling, positive for rising)
+        """
+        return self.price_stats.trend_ewma
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -133,7 +356,7 @@ class MarketData:
             "supply_level": self.supply_level,
             "demand_level": self.demand_level,
             "price_trend": self.price_trend,
-            "price_history": self.price_history,
+            "price_history": self.price_history.to_list(),
             "transaction_volume": self.transaction_volume,
             "last_update": self.last_update,
         }
@@ -184,8 +407,25 @@ class StationMarket:
         self.price_volatility = max(0.0, min(1.0, price_volatility))
         self.market_size = max(0.1, min(10.0, market_size))
         self.connected_markets: List[str] = []
+        # Set once a MarketNetwork keeps this market's state in its columns
+        self.columns: Optional["MarketColumns"] = None
+        self.column_index = -1
         self.last_market_update = time.time()
     
+    @property
+    def last_market_update(self) -> float:
+        """Time the market was last updated, kept in the columns once bound."""
+        if self.columns is None:
+            return self._last_market_update
+        return float(self.columns.last_market_update[self.column_index])
+    
+    @last_market_update.setter
+    def last_market_update(self, value: float) -> None:
+        if self.columns is None:
+            self._last_market_update = value
+        else:
+            self.columns.last_market_update[self.column_index] = value
+    
     def add_market_item(self, item_id: str, base_price: float, current_price: Optional[float] = None) -> None:
         """
         Add an item to the market.
@@ -198,11 +438,14 @@ class StationMarket:
         if current_price is None:
             current_price = base_price
         
-        self.market_items[item_id] = MarketData(
+        market_data = MarketData(
             item_id=item_id,
             base_price=base_price,
             current_price=current_price,
         )
+        if self.columns is not None:
+            market_data = self.columns.bind_item(self, market_data)
+        self.market_items[item_id] = market_data
     
     def get_market_data(self, item_id: str) -> Optional[MarketData]:
         """
@@ -295,11 +538,19 @@ class StationMarket:
                 "market_trends": "No data",
             }
         
-        total_volatility = sum(data.calculate_price_volatility() for data in self.market_items.values())
-        avg_volatility = total_volatility / len(self.market_items)
-        
-        rising_count = sum(1 for data in self.market_items.values() if data.price_trend > 0.01)
-        falling_count = sum(1 for data in self.market_items.values() if data.price_trend < -0.01)
+        if self.columns is not None:
+            # The figures of a network's market are read as arrays
+            rows = self.columns.market_rows[self.column_index]
+            avg_volatility = float(self.columns.market_volatility(self.column_index).mean())
+            price_trends = self.columns.price_trend[rows]
+            rising_count = int((price_trends > 0.01).sum())
+            falling_count = int((price_trends < -0.01).sum())
+        else:
+            total_volatility = sum(data.calculate_price_volatility() for data in self.market_items.values())
+            avg_volatility = total_volatility / len(self.market_items)
+            
+            rising_count = sum(1 for data in self.market_items.values() if data.price_trend > 0.01)
+            falling_count = sum(1 for data in self.market_items.values() if data.price_trend < -0.01)
         stable_count = len(self.market_items) - rising_count - falling_count
         
         if rising_count > falling_count:
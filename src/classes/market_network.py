@@ -5,14 +5,18 @@ This module implements the MarketNetwork class that manages connections between
 station markets and handles price effect propagation based on trade routes.
 """
 
-import time
+import heapq
+import itertools
 import random
-from typing import Dict, List, Optional, Any, Set
-from dataclasses import dataclass
+from collections import deque
+from typing import Dict, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
+from src.classes.market_columns import MarketColumns
 from src.classes.market_data import StationMarket
 from src.classes.market_simulator import MarketSimulator
+from src.helpers import rnd_poisson
 
 
 class MarketEventType(Enum):
@@ -97,18 +101,35 @@ class MarketEvent:
     duration: float  # How long the event lasts in seconds
     propagated_to: Set[str]  # Markets this event has already reached
     
-    def is_expired(self) -> bool:
-        """Check if the event has expired."""
-        return time.time() > (self.created_time + self.duration)
+    def is_expired(self, current_time: float) -> bool:
+        """Check if the event has expired by game time current_time."""
+        return current_time > (self.created_time + self.duration)
     
-    def get_current_strength(self) -> float:
-        """Get the current strength of the event (decays over time)."""
-        if self.is_expired():
+    def get_current_strength(self, current_time: float) -> float:
+        """Get the strength of the event at game time current_time (decays over time)."""
+        if self.is_expired(current_time):
             return 0.0
         
-        elapsed = time.time() - self.created_time
+        elapsed = current_time - self.created_time
         decay_factor = 1.0 - (elapsed / self.duration)
         return self.magnitude * decay_factor
+    
+    def get_strength_at(self, timestamp: float) -> float:
+        """Get the strength the event will have (or had) at timestamp."""
+        elapsed = timestamp - self.created_time
+        if elapsed > self.duration:
+            return 0.0
+        return self.magnitude * (1.0 - max(0.0, elapsed) / self.duration)
+
+
+@dataclass(order=True)
+class PropagationHop:
+    """An event due to reach target_market over connection at arrival_time."""
+    arrival_time: float
+    sequence: int  # Keeps hops that arrive together in the order they were queued
+    event: MarketEvent = field(compare=False)
+    target_market: str = field(compare=False)
+    connection: MarketConnection = field(compare=False)
 
 
 class MarketNetwork:
@@ -117,21 +138,54 @@ class MarketNetwork:
     
     Creates a network of interconnected markets where price changes and events
     can propagate based on trade routes and communication networks.
+    
+    The network runs on game time (Game.global_time) and its markets are
+    evaluated lazily: sync moves the clock and delivers the events due by
+    then, but a market is only simulated up to the clock when get_market
+    asks for it, so markets nobody visits cost nothing until they are.
+    update_network and advance_time still bring every market up to date;
+    update_network does so with one vectorized MarketColumns tick over every
+    (station, item) pair in the network.
     """
     
-    def __init__(self):
-        """Initialize the market network."""
+    def __init__(self, current_time: float = 0.0):
+        """
+        Initialize the market network.
+        
+        Args:
+            current_time: Game time (global_time) the network starts at
+        """
+        self.current_time = current_time
         self.markets: Dict[str, StationMarket] = {}
         self.simulators: Dict[str, MarketSimulator] = {}
-        self.connections: List[MarketConnection] = []
+        # The per-item state of every market, as arrays
+        self.columns = MarketColumns()
+        # market_id -> {neighbor_id: connection}; each connection is listed
+        # under both of its markets
+        self.adjacency: Dict[str, Dict[str, MarketConnection]] = {}
+        # Every connection once, in the order they were added
+        self._connections: Dict[Tuple[str, str], MarketConnection] = {}
         self.active_events: List[MarketEvent] = []
+        # Hops of active events still on their way, earliest arrival first
+        self.pending_hops: List[PropagationHop] = []
+        self._hop_counter = itertools.count()
         self.event_counter = 0
-        self.last_network_update = time.time()
+        self.last_network_update = current_time
         
         # Network parameters
         self.propagation_damping = 0.8  # How much effects weaken as they propagate
         self.min_propagation_strength = 0.01  # Minimum strength to continue propagation
         self.max_propagation_hops = 5  # Maximum hops for event propagation
+        self.random_events_per_hour = 0.001  # Expected random events per hour of game time
+    
+    @property
+    def connections(self) -> Tuple[MarketConnection, ...]:
+        """
+        All connections in the network, in the order they were added.
+        
+        Read-only; use add_connection and remove_connection to change them.
+        """
+        return tuple(self._connections.values())
     
     def add_market(self, market: StationMarket) -> None:
         """
@@ -141,7 +195,10 @@ class MarketNetwork:
             market: StationMarket to add to the network
         """
         self.markets[market.station_id] = market
-        self.simulators[market.station_id] = MarketSimulator(market)
+        simulator = MarketSimulator(market, self.current_time)
+        simulator.bind_columns(self.columns)
+        self.simulators[market.station_id] = simulator
+        self.adjacency.setdefault(market.station_id, {})
     
     def remove_market(self, station_id: str) -> None:
         """
@@ -150,15 +207,15 @@ class MarketNetwork:
         Args:
             station_id: ID of the station market to remove
         """
+        # Remove connections involving this market
+        for neighbor_id in list(self.adjacency.get(station_id, {})):
+            self.remove_connection(station_id, neighbor_id)
+        self.adjacency.pop(station_id, None)
+        
         if station_id in self.markets:
             del self.markets[station_id]
             del self.simulators[station_id]
-        
-        # Remove connections involving this market
-        self.connections = [
-            conn for conn in self.connections
-            if conn.from_market != station_id and conn.to_market != station_id
-        ]
+            self.columns.remove_market(station_id)
     
     def add_connection(
         self,
@@ -188,6 +245,7 @@ class MarketNetwork:
         existing = self.get_connection(from_market, to_market)
         if existing:
             # Update existing connection
+            connection = existing
             existing.connection_strength = connection_strength
             existing.distance = distance
             existing.trade_volume = trade_volume
@@ -202,11 +260,46 @@ class MarketNetwork:
                 trade_volume=trade_volume,
                 connection_type=connection_type,
             )
-            self.connections.append(connection)
+            self._connections[(from_market, to_market)] = connection
+            self.adjacency[from_market][to_market] = connection
+            self.adjacency[to_market][from_market] = connection
         
         # Update market connection lists
         self.markets[from_market].add_connected_market(to_market)
         self.markets[to_market].add_connected_market(from_market)
+        
+        # Events already spreading carry on over the connection from now on
+        for event in self.active_events:
+            for reached, target_market in ((from_market, to_market), (to_market, from_market)):
+                if reached in event.propagated_to and target_market not in event.propagated_to:
+                    self._queue_hop(
+                        event, target_market, connection,
+                        max(event.created_time, self.current_time),
+                    )
+    
+    def remove_connection(self, from_market: str, to_market: str) -> None:
+        """
+        Remove the connection between two markets, if there is one.
+        
+        Hops of events already on their way over it are dropped.
+        
+        Args:
+            from_market: Station ID of one market
+            to_market: Station ID of the other market
+        """
+        connection = self.get_connection(from_market, to_market)
+        if connection is None:
+            return
+        
+        connection.is_active = False
+        self._connections.pop((connection.from_market, connection.to_market), None)
+        self.adjacency[from_market].pop(to_market, None)
+        self.adjacency[to_market].pop(from_market, None)
+        
+        for market_id, neighbor_id in ((from_market, to_market), (to_market, from_market)):
+            market = self.markets.get(market_id)
+            if market is not None:
+                market.remove_connected_market(neighbor_id)
     
     def get_connection(self, from_market: str, to_market: str) -> Optional[MarketConnection]:
         """
@@ -219,11 +312,7 @@ class MarketNetwork:
         Returns:
             MarketConnection if found, None otherwise
         """
-        for connection in self.connections:
-            if (connection.from_market == from_market and connection.to_market == to_market) or \
-               (connection.from_market == to_market and connection.to_market == from_market):
-                return connection
-        return None
+        return self.adjacency.get(from_market, {}).get(to_market)
     
     def update_network(self, time_elapsed: float) -> None:
         """
@@ -232,22 +321,86 @@ class MarketNetwork:
         Args:
             time_elapsed: Time elapsed since last update in seconds
         """
-        current_time = time.time()
+        previous_time = self.current_time
+        self.current_time += time_elapsed
+        
+        # Catch up any market simulators that lazy evaluation has left
+        # behind, then deliver the stretch's events, which bring the markets
+        # they reach up to the time they arrive
+        for simulator in self.columns.simulators_behind(previous_time):
+            simulator.advance_to(previous_time)
+        
+        self._update_events()
+        
+        # Update every market the rest of the way in one vectorized tick
+        self.columns.tick(self.current_time)
+    
+    def advance_time(self, time_elapsed: float) -> None:
+        """
+        Catch the whole network up on a long stretch of time in one go.
+        
+        The network-wide event handling runs once for the whole stretch, and
+        each market then catches up through MarketSimulator.advance_time.
+        
+        Args:
+            time_elapsed: Time elapsed since last update in seconds
+        """
+        self.current_time += time_elapsed
+        
+        self._update_events()
         
-        # Update individual market simulators
         for simulator in self.simulators.values():
-            simulator.update_prices(time_elapsed)
+            simulator.advance_to(self.current_time)
+    
+    def sync(self, current_time: float) -> None:
+        """
+        Move the network's clock to game time current_time without simulating its markets.
+        
+        Events still spread and expire on time; a market an event reaches
+        is caught up to the event's arrival first. Everything else waits
+        for get_market, so this costs nothing per market.
+        
+        Args:
+            current_time: Game time (global_time) to move to
+        """
+        if current_time <= self.current_time:
+            return
+        
+        self.current_time = current_time
+        self._update_events()
+    
+    def get_market(self, station_id: str) -> Optional[StationMarket]:
+        """
+        Get a market brought up to the network's current time, e.g. on docking.
+        
+        Args:
+            station_id: ID of the station market
+            
+        Returns:
+            The StationMarket, or None if it is not in the network
+        """
+        simulator = self.simulators.get(station_id)
+        if simulator is None:
+            return None
+        
+        simulator.advance_to(self.current_time)
+        return simulator.market
+    
+    def _update_events(self) -> None:
+        """Propagate, randomly create and expire events up to current_time."""
+        # Randomly generate new market events, each at its own time after
+        # the hops due before it have arrived
+        for created_time in self._random_event_times():
+            self._process_event_propagation(created_time)
+            self._generate_random_event(created_time)
         
         # Process event propagation
-        self._process_event_propagation()
+        self._process_event_propagation(self.current_time)
         
         # Clean up expired events
         self._cleanup_expired_events()
         
-        # Randomly generate new market events
-        self._generate_random_events()
-        
-        self.last_network_update = current_time
+        self.last_network_update = self.current_time
     
     def create_market_event(
         self,
@@ -256,6 +409,7 @@ class MarketNetwork:
         affected_items: List[str],
         magnitude: float,
         duration: float = 86400.0,  # 24 hours default
+        created_time: Optional[float] = None,
     ) -> str:
         """
         Create a new market event.
@@ -266,12 +420,16 @@ class MarketNetwork:
             affected_items: List of item IDs affected by the event
             magnitude: Strength of the event (0.0 to 1.0)
             duration: How long the event lasts in seconds
+            created_time: Game time the event starts at; defaults to current_time
             
         Returns:
             Event ID for tracking
         """
+        if created_time is None:
+            created_time = self.current_time
+        
         self.event_counter += 1
-        event_id = f"event_{self.event_counter}_{int(time.time())}"
+        event_id = f"event_{self.event_counter}_{int(created_time)}"
         
         event = MarketEvent(
             event_id=event_id,
@@ -279,7 +437,7 @@ class MarketNetwork:
             origin_market=origin_market,
             affected_items=affected_items,
             magnitude=magnitude,
-            created_time=time.time(),
+            created_time=created_time,
             duration=duration,
             propagated_to={origin_market},
         )
@@ -287,52 +445,88 @@ class MarketNetwork:
         self.active_events.append(event)
         
         # Apply immediate effects to origin market
-        self._apply_event_to_market(event, origin_market, magnitude)
+        self._apply_event_to_market(event, origin_market, magnitude, created_time)
+        self._queue_hops(event, origin_market)
         
         return event_id
     
-    def _process_event_propagation(self) -> None:
-        """Process propagation of active events through the network."""
-        for event in self.active_events:
-            if event.is_expired():
+    def _queue_hops(self, event: MarketEvent, market_id: str) -> None:
+        """
+        Queue the hops that carry event on from market_id to its neighbors.
+        
+        A hop arrives a connection's propagation delay after the event was
+        created. Hops that could never take effect are not queued: those past
+        max_propagation_hops, those arriving after the event expires and those
+        too weak to pass min_propagation_strength when they arrive.
+        """
+        if len(event.propagated_to) >= self.max_propagation_hops:
+            return
+        
+        for target_market, connection in self.adjacency.get(market_id, {}).items():
+            if target_market not in event.propagated_to:
+                self._queue_hop(event, target_market, connection, event.created_time)
+    
+    def _queue_hop(
+        self,
+        event: MarketEvent,
+        target_market: str,
+        connection: MarketConnection,
+        departure_time: float,
+    ) -> None:
+        """Queue event to reach target_market over connection, leaving at departure_time."""
+        if len(event.propagated_to) >= self.max_propagation_hops:
+            return
+        
+        arrival_time = departure_time + connection.get_propagation_delay()
+        strength = (
+            event.get_strength_at(arrival_time)
+            * connection.get_propagation_strength()
+            * self.propagation_damping
+        )
+        if strength < self.min_propagation_strength:
+            return
+        
+        heapq.heappush(
+            self.pending_hops,
+            PropagationHop(
+                arrival_time, next(self._hop_counter), event, target_market, connection
+            ),
+        )
+    
+    def _process_event_propagation(self, until_time: float) -> None:
+        """
+        Carry active events over the hops that have arrived by game time until_time.
+        
+        Only hops that are due are looked at, earliest first. The hops an
+        event goes on to from a market it reaches are delivered in the same
+        call if they are due too, so a single sync over a long stretch of
+        game time carries events as far as they would have got meanwhile.
+        """
+        while self.pending_hops and self.pending_hops[0].arrival_time <= until_time:
+            hop = heapq.heappop(self.pending_hops)
+            event = hop.event
+            if (hop.target_market in event.propagated_to or
+                hop.target_market not in self.markets or
+                not hop.connection.is_active or
+                len(event.propagated_to) >= self.max_propagation_hops):
                 continue
             
-            current_strength = event.get_current_strength()
-            if current_strength < self.min_propagation_strength:
+            # The event keeps weakening while the hop is on its way
+            strength = (
+                event.get_strength_at(hop.arrival_time)
+                * hop.connection.get_propagation_strength()
+                * self.propagation_damping
+            )
+            if strength < self.min_propagation_strength:
                 continue
             
-            # Find markets to propagate to
-            markets_to_propagate = []
-            
-            for propagated_market in event.propagated_to.copy():
-                for connection in self.connections:
-                    target_market = None
-                    
-                    if connection.from_market == propagated_market:
-                        target_market = connection.to_market
-                    elif connection.to_market == propagated_market:
-                        target_market = connection.from_market
-                    
-                    if (target_market and 
-                        target_market not in event.propagated_to and
-                        connection.is_active):
-                        
-                        # Check if enough time has passed for propagation
-                        delay = connection.get_propagation_delay()
-                        if time.time() >= (event.created_time + delay):
-                            propagation_strength = connection.get_propagation_strength()
-                            effective_strength = current_strength * propagation_strength * self.propagation_damping
-                            
-                            if effective_strength >= self.min_propagation_strength:
-                                markets_to_propagate.append((target_market, effective_strength))
-            
-            # Apply propagation effects
-            for target_market, strength in markets_to_propagate:
-                if len(event.propagated_to) < self.max_propagation_hops:
-                    self._apply_event_to_market(event, target_market, strength)
-                    event.propagated_to.add(target_market)
+            self._apply_event_to_market(event, hop.target_market, strength, hop.arrival_time)
+            event.propagated_to.add(hop.target_market)
+            self._queue_hops(event, hop.target_market)
     
-    def _apply_event_to_market(self, event: MarketEvent, market_id: str, strength: float) -> None:
+    def _apply_event_to_market(
+        self, event: MarketEvent, market_id: str, strength: float, timestamp: float
+    ) -> None:
         """
         Apply event effects to a specific market.
         
@@ -340,11 +534,15 @@ class MarketNetwork:
             event: MarketEvent to apply
             market_id: ID of the market to affect
             strength: Strength of the effect to apply
+            timestamp: Game time the event reaches the market
         """
         market = self.markets.get(market_id)
         if not market:
             return
         
+        # A lazily evaluated market has to catch up before the event lands
+        self.simulators[market_id].advance_to(timestamp)
+        
         for item_id in event.affected_items:
             market_data = market.get_market_data(item_id)
             if not market_data:
@@ -355,7 +553,7 @@ class MarketNetwork:
                 # Sudden price change
                 price_change = random.uniform(-0.2, 0.2) * strength
                 new_price = market_data.current_price * (1 + price_change)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, timestamp)
                 
             elif event.event_type == MarketEventType.SUPPLY_DISRUPTION:
                 # Reduce supply, increase price
@@ -365,7 +563,7 @@ class MarketNetwork:
                 
                 price_increase = 1.0 + (0.2 * strength)
                 new_price = market_data.current_price * price_increase
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, timestamp)
                 
             elif event.event_type == MarketEventType.DEMAND_SURGE:
                 # Increase demand, increase price
@@ -375,7 +573,7 @@ class MarketNetwork:
                 
                 price_increase = 1.0 + (0.15 * strength)
                 new_price = market_data.current_price * price_increase
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, timestamp)
                 
             elif event.event_type == MarketEventType.ECONOMIC_BOOM:
                 # General positive effects
@@ -385,7 +583,7 @@ class MarketNetwork:
                 
                 price_increase = 1.0 + (0.1 * strength)
                 new_price = market_data.current_price * price_increase
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, timestamp)
                 
             elif event.event_type == MarketEventType.MARKET_CRASH:
                 # General negative effects
@@ -395,36 +593,53 @@ class MarketNetwork:
                 
                 price_decrease = 1.0 - (0.25 * strength)
                 new_price = market_data.current_price * price_decrease
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, timestamp)
     
     def _cleanup_expired_events(self) -> None:
         """Remove expired events from the active list."""
-        self.active_events = [event for event in self.active_events if not event.is_expired()]
+        self.active_events = [
+            event for event in self.active_events if not event.is_expired(self.current_time)
+        ]
     
-    def _generate_random_events(self) -> None:
-        """Randomly generate new market events."""
+    def _random_event_times(self) -> List[float]:
+        """
+        Game times of the random events between last_network_update and current_time.
+        
+        Events happen at random_events_per_hour on average, so their number
+        is drawn from a Poisson distribution over the stretch and their
+        times are spread uniformly over it. One long update gets as many as
+        many short ones.
+        """
         if not self.markets:
-            return
+            return []
         
-        # Low chance of generating a random event
-        if random.random() < 0.001:  # 0.1% chance per update
-            event_types = list(MarketEventType)
-            event_type = random.choice(event_types)
+        start_time = self.last_network_update
+        time_elapsed = self.current_time - start_time
+        event_count = rnd_poisson(self.random_events_per_hour * time_elapsed / 3600)
+        return sorted(
+            start_time + random.uniform(0, time_elapsed) for _ in range(event_count)
+        )
+    
+    def _generate_random_event(self, created_time: float) -> None:
+        """Generate a random market event starting at game time created_time."""
+        event_types = list(MarketEventType)
+        event_type = random.choice(event_types)
+        
+        origin_market = random.choice(list(self.markets.keys()))
+        market = self.markets[origin_market]
+        
+        if market.market_items:
+            # Select 1-3 random items to affect
+            num_items = min(3, len(market.market_items))
+            affected_items = random.sample(list(market.market_items.keys()), num_items)
             
-            origin_market = random.choice(list(self.markets.keys()))
-            market = self.markets[origin_market]
+            magnitude = random.uniform(0.1, 0.8)
+            duration = random.uniform(3600, 86400)  # 1-24 hours
             
-            if market.market_items:
-                # Select 1-3 random items to affect
-                num_items = min(3, len(market.market_items))
-                affected_items = random.sample(list(market.market_items.keys()), num_items)
-                
-                magnitude = random.uniform(0.1, 0.8)
-                duration = random.uniform(3600, 86400)  # 1-24 hours
-                
-                self.create_market_event(
-                    event_type, origin_market, affected_items, magnitude, duration
-                )
+            self.create_market_event(
+                event_type, origin_market, affected_items, magnitude, duration,
+                created_time,
+            )
     
     def get_market_path(self, from_market: str, to_market: str) -> Optional[List[str]]:
         """
@@ -441,22 +656,15 @@ class MarketNetwork:
             return [from_market]
         
         # Use breadth-first search to find shortest path
-        queue = [(from_market, [from_market])]
+        queue = deque([(from_market, [from_market])])
         visited = {from_market}
         
         while queue:
-            current_market, path = queue.pop(0)
+            current_market, path = queue.popleft()
             
             # Check all connections from current market
-            for connection in self.connections:
-                next_market = None
-                
-                if connection.from_market == current_market and connection.is_active:
-                    next_market = connection.to_market
-                elif connection.to_market == current_market and connection.is_active:
-                    next_market = connection.from_market
-                
-                if next_market and next_market not in visited:
+            for next_market, connection in self.adjacency.get(current_market, {}).items():
+                if connection.is_active and next_market not in visited:
                     new_path = path + [next_market]
                     
                     if next_market == to_market:
@@ -475,13 +683,13 @@ class MarketNetwork:
             Dictionary with network statistics
         """
         total_markets = len(self.markets)
-        total_connections = len([conn for conn in self.connections if conn.is_active])
+        total_connections = len([conn for conn in self._connections.values() if conn.is_active])
         active_events = len(self.active_events)
         
         # Calculate average connection strength
-        if self.connections:
+        if self._connections:
             avg_connection_strength = sum(
-                conn.connection_strength for conn in self.connections if conn.is_active
+                conn.connection_strength for conn in self._connections.values() if conn.is_active
             ) / max(1, total_connections)
         else:
             avg_connection_strength = 0.0
@@ -515,17 +723,15 @@ class MarketNetwork:
         if market_id not in self.markets:
             return {}
         
+        active_connections = [
+            conn for conn in self.adjacency.get(market_id, {}).values() if conn.is_active
+        ]
+        
         # Count direct connections
-        direct_connections = sum(
-            1 for conn in self.connections
-            if (conn.from_market == market_id or conn.to_market == market_id) and conn.is_active
-        )
+        direct_connections = len(active_connections)
         
         # Calculate total connection strength
-        total_strength = sum(
-            conn.connection_strength for conn in self.connections
-            if (conn.from_market == market_id or conn.to_market == market_id) and conn.is_active
-        )
+        total_strength = sum(conn.connection_strength for conn in active_connections)
         
         # Count reachable markets
         reachable_markets = set()
@@ -5,10 +5,48 @@ This module implements the MarketSimulator class that handles price adjustments
 based on supply and demand, transaction processing, and time-based market evolution.
 """
 
-import time
+import math
 import random
-from typing import Dict, List, Tuple, Any
-from src.classes.market_data import StationMarket
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
+from src.classes.market_data import MarketData, StationMarket
+from src.helpers import rnd_poisson
+
+if TYPE_CHECKING:
+    from src.classes.market_columns import MarketColumns
+
+
+@dataclass
+class MarketOrder:
+    """A single buy or sell order for MarketSimulator.process_orders."""
+    
+    item_id: str
+    quantity: float
+    is_buy: bool  # True if buying from market, False if selling to market
+
+
+class _MarketColumn:
+    """
+    A simulator attribute that moves into the MarketColumns the simulator is
+    bound to, so MarketColumns.tick can read it for every market at once.
+    """
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attribute = "_" + name
+    
+    def __get__(self, simulator: Optional["MarketSimulator"], owner: Optional[type] = None) -> Any:
+        if simulator is None:
+            return self
+        if simulator.columns is None:
+            return getattr(simulator, self.attribute)
+        return float(getattr(simulator.columns, self.name)[simulator.column_index])
+    
+    def __set__(self, simulator: "MarketSimulator", value: float) -> None:
+        if simulator.columns is None:
+            setattr(simulator, self.attribute, value)
+        else:
+            getattr(simulator.columns, self.name)[simulator.column_index] = value
 
 
 class MarketSimulator:
@@ -17,28 +55,60 @@ class MarketSimulator:
     
     Handles price adjustments based on transactions, supply/demand changes,
     and time-based market evolution to create realistic economic behavior.
+    
+    A MarketNetwork binds its simulators to its MarketColumns, after which
+    their clocks, evolution parameters and items live there and time
+    evolution is vectorized over the market's items.
     """
     
-    def __init__(self, market: StationMarket):
+    base_decay_rate = _MarketColumn()
+    time_evolution_factor = _MarketColumn()
+    npc_trade_frequency = _MarketColumn()
+    events_per_hour = _MarketColumn()
+    last_simulation_time = _MarketColumn()
+    
+    # How much of a long gap advance_time simulates step by step; the rest is
+    # applied in closed form. About the time a price deviation takes to fade
+    # to a third, so the simulated tail still shapes the prices it leaves behind
+    CATCH_UP_MEMORY = 6 * 3600.0
+    
+    def __init__(self, market: StationMarket, current_time: float = 0.0):
         """
         Initialize the market simulator.
         
         Args:
             market: StationMarket instance to simulate
+            current_time: Game time (global_time) the market's state is as of
         """
         self.market = market
+        self.columns: Optional["MarketColumns"] = None
+        self.column_index = -1
         self.base_decay_rate = 0.01  # How quickly prices return to base
         self.transaction_impact_factor = 0.1  # How much transactions affect prices
         self.time_evolution_factor = 0.005  # How much time affects prices
         self.volatility_damping = 0.95  # Reduces extreme price swings
         
         # NPC trading simulation parameters
-        self.npc_trade_frequency = 0.1  # Chance of NPC trade per update
+        self.npc_trade_frequency = 0.1  # Trade opportunities per second, and chance each is taken
         self.npc_trade_volume_range = (1, 50)  # Range of NPC trade volumes
         
         # Market event parameters
-        self.event_chance = 0.01  # Chance of market event per update
-        self.last_simulation_time = time.time()
+        self.events_per_hour = 0.01  # Expected market events per hour of game time
+        
+        # Game time the market has been simulated up to; prices change with
+        # it, and are stamped with it, rather than with the wall clock
+        self.last_simulation_time = current_time
+        self.market.last_market_update = current_time
+    
+    def bind_columns(self, columns: "MarketColumns") -> None:
+        """
+        Move this simulator's market into columns, e.g. when it joins a network.
+        
+        Args:
+            columns: MarketColumns to keep the market's state in
+        """
+        self.column_index = columns.add_market(self)
+        self.columns = columns
     
     def update_prices(self, time_elapsed: float) -> None:
         """
@@ -47,7 +117,7 @@ class MarketSimulator:
         Args:
             time_elapsed: Time elapsed since last update in seconds
         """
-        current_time = time.time()
+        self.last_simulation_time += time_elapsed
         
         # Simulate NPC trading activity
         self._simulate_npc_trading(time_elapsed)
@@ -56,11 +126,97 @@ class MarketSimulator:
         self._apply_time_evolution(time_elapsed)
         
         # Check for random market events
-        self._check_market_events()
+        self._check_market_events(time_elapsed)
         
         # Update market timestamp
-        self.market.last_market_update = current_time
-        self.last_simulation_time = current_time
+        self.market.last_market_update = self.last_simulation_time
+    
+    def advance_time(self, time_elapsed: float, step: float = 3600.0) -> None:
+        """
+        Catch the market up on a long stretch of time without simulating every second.
+        
+        Prices and supply/demand relax towards their base levels exponentially,
+        so the trading noise of all but the most recent hours has faded by the
+        end of a long gap. Everything before the last CATCH_UP_MEMORY seconds
+        is applied in closed form by _relax, and only those last seconds are
+        simulated, in update_prices steps of step seconds. Market events are
+        rare and move prices further than the noise, so those of the relaxed
+        stretch are still triggered, each at its own time.
+        
+        Args:
+            time_elapsed: Time elapsed since last update in seconds
+            step: Length of each simulated update in seconds
+        """
+        if time_elapsed <= 0:
+            return
+        
+        simulated = min(time_elapsed, self.CATCH_UP_MEMORY)
+        relaxed = time_elapsed - simulated
+        event_count = rnd_poisson(self.events_per_hour * relaxed / 3600)
+        relaxed_to = 0.0
+        for event_offset in sorted(random.uniform(0, relaxed) for _ in range(event_count)):
+            self.last_simulation_time += event_offset - relaxed_to
+            self._relax(event_offset - relaxed_to)
+            self._trigger_market_event()
+            relaxed_to = event_offset
+        self.last_simulation_time += relaxed - relaxed_to
+        self._relax(relaxed - relaxed_to)
+        
+        while simulated > 0:
+            current_step = min(step, simulated)
+            self.update_prices(current_step)
+            simulated -= current_step
+    
+    def advance_to(self, current_time: float) -> None:
+        """
+        Bring the market up to game time current_time, if it is behind.
+        
+        Markets only need to be current when someone looks at them, so a
+        market nobody visits can be left alone and caught up with
+        advance_time when it is docked at or its prices are queried.
+        
+        Args:
+            current_time: Game time (global_time) to bring the market up to
+        """
+        self.advance_time(current_time - self.last_simulation_time)
+    
+    def _relax(self, time_elapsed: float) -> None:
+        """
+        Apply time_elapsed seconds of _apply_time_evolution's drift in closed form.
+        
+        Per second, the deviation from the base price shrinks by
+        base_decay_rate * time_evolution_factor and supply/demand move towards
+        0.5 by 0.01 * time_evolution_factor of their distance to it, so over t
+        seconds both decay by exp(-rate * t). The random fluctuations average
+        out over such a stretch and are left out. A market bound to
+        MarketColumns is relaxed there, as arrays.
+        
+        Args:
+            time_elapsed: Time to relax over in seconds
+        """
+        if time_elapsed <= 0:
+            return
+        
+        if self.columns is not None:
+            self.columns.relax_market(self.column_index, time_elapsed, self.last_simulation_time)
+            return
+        
+        price_retention = math.exp(
+            -self.base_decay_rate * self.time_evolution_factor * time_elapsed
+        )
+        level_retention = math.exp(-0.01 * self.time_evolution_factor * time_elapsed)
+        
+        for market_data in self.market.market_items.values():
+            price_deviation = market_data.current_price - market_data.base_price
+            new_price = max(
+                market_data.base_price * 0.1,
+                market_data.base_price + price_deviation * price_retention,
+            )
+            if abs(new_price - market_data.current_price) > 0.01:
+                market_data.update_price(new_price, self.last_simulation_time)
+            
+            market_data.supply_level = 0.5 + (market_data.supply_level - 0.5) * level_retention
+            market_data.demand_level = 0.5 + (market_data.demand_level - 0.5) * level_retention
     
     def process_transaction(self, item_id: str, quantity: float, is_buy: bool) -> float:
         """
@@ -78,34 +234,100 @@ class MarketSimulator:
         if not market_data:
             return 0.0
         
-        # Calculate transaction price (may vary during large transactions)
-        total_price = 0.0
-        remaining_quantity = quantity
-        current_price = market_data.current_price
+        total_price, final_price = self._price_trade(market_data, quantity, is_buy)
+        
+        # Update market data with final price and transaction effects
+        self._apply_transaction_effects(item_id, quantity, is_buy, final_price)
+        
+        return total_price
+    
+    def process_orders(self, orders: List[MarketOrder]) -> List[float]:
+        """
+        Price and apply a basket of orders, e.g. selling an entire cargo hold.
         
-        # Process transaction in chunks to simulate price impact
-        chunk_size = max(1, quantity / 10)  # Process in 10% chunks
+        Orders for the same item are applied in the order given, each moving
+        the price and supply/demand the next one sees, exactly as a series of
+        process_transaction calls would. Orders for different items do not
+        affect each other, so each item's MarketData is looked up once and all
+        of its orders are settled together.
         
-        while remaining_quantity > 0:
-            current_chunk = min(chunk_size, remaining_quantity)
+        Args:
+            orders: Orders to execute
             
-            # Calculate price for this chunk
-            chunk_price = current_price * current_chunk
-            total_price += chunk_price
+        Returns:
+            Total price of each order, in the order given (0.0 for unknown items)
+        """
+        totals = [0.0] * len(orders)
+        
+        orders_by_item: Dict[str, List[int]] = {}
+        for index, order in enumerate(orders):
+            orders_by_item.setdefault(order.item_id, []).append(index)
+        
+        for item_id, indices in orders_by_item.items():
+            market_data = self.market.get_market_data(item_id)
+            if not market_data:
+                continue
             
-            # Apply price impact based on transaction size and market size
-            price_impact = self._calculate_price_impact(
-                item_id, current_chunk, is_buy
-            )
+            for index in indices:
+                order = orders[index]
+                totals[index], final_price = self._price_trade(
+                    market_data, order.quantity, order.is_buy
+                )
+                self._apply_transaction_effects(
+                    item_id, order.quantity, order.is_buy, final_price
+                )
+        
+        return totals
+    
+    def _price_trade(
+        self, market_data: MarketData, quantity: float, is_buy: bool
+    ) -> Tuple[float, float]:
+        """
+        Price a trade that is filled in chunks, each moving the price for the next.
+        
+        Trades are filled in ten chunks of a tenth of the quantity, or in
+        single units below ten, plus whatever fraction is left over. Every
+        full chunk has the same price impact r, since supply and demand do not
+        change until the trade settles, so the chunk prices form a geometric
+        series with ratio (1 + r) and are summed in closed form.
+        
+        Args:
+            market_data: Market data of the item being traded
+            quantity: Amount being bought or sold
+            is_buy: True if buying from market, False if selling to market
             
-            # Update price for next chunk
-            current_price *= (1 + price_impact)
-            remaining_quantity -= current_chunk
+        Returns:
+            Tuple of (total price, price after the trade)
+        """
+        price = market_data.current_price
+        if quantity <= 0:
+            return 0.0, price
         
-        # Update market data with final price and transaction effects
-        self._apply_transaction_effects(item_id, quantity, is_buy, current_price)
+        if quantity >= 10:
+            chunk_size = quantity / 10
+            full_chunks = 10
+        else:
+            chunk_size = 1.0
+            full_chunks = int(quantity)
+        remainder = quantity - chunk_size * full_chunks
         
-        return total_price
+        total_price = 0.0
+        if full_chunks:
+            growth = 1 + self._impact_for(market_data, chunk_size, is_buy)
+            if growth == 1:
+                total_price = price * chunk_size * full_chunks
+            else:
+                total_price = (
+                    price * chunk_size * (growth ** full_chunks - 1) / (growth - 1)
+                )
+            price *= growth ** full_chunks
+        
+        # Rounding in quantity / 10 can leave a sliver too small to matter
+        if remainder > 1e-9 * quantity:
+            total_price += price * remainder
+            price *= 1 + self._impact_for(market_data, remainder, is_buy)
+        
+        return total_price, price
     
     def _calculate_price_impact(self, item_id: str, quantity: float, is_buy: bool) -> float:
         """
@@ -123,6 +345,10 @@ class MarketSimulator:
         if not market_data:
             return 0.0
         
+        return self._impact_for(market_data, quantity, is_buy)
+    
+    def _impact_for(self, market_data: MarketData, quantity: float, is_buy: bool) -> float:
+        """Price impact of trading quantity of the item described by market_data."""
         # Base impact based on quantity and market size
         base_impact = (quantity / (self.market.market_size * 100)) * self.transaction_impact_factor
         
@@ -161,7 +387,7 @@ class MarketSimulator:
             return
         
         # Update current price
-        market_data.update_price(final_price)
+        market_data.update_price(final_price, self.last_simulation_time)
         
         # Update transaction volume
         market_data.transaction_volume += quantity
@@ -187,12 +413,13 @@ class MarketSimulator:
         Args:
             time_elapsed: Time elapsed since last simulation
         """
-        # Calculate number of potential NPC trades based on time elapsed
-        trade_opportunities = int(time_elapsed * self.npc_trade_frequency)
-        
-        for _ in range(trade_opportunities):
-            if random.random() < self.npc_trade_frequency:
-                self._execute_npc_trade()
+        # NPC trades arrive at a steady rate: time_elapsed * npc_trade_frequency
+        # opportunities, each taken with npc_trade_frequency chance. Drawing
+        # the count from a Poisson distribution keeps the expected number of
+        # trades proportional to time_elapsed however it is split into updates
+        expected_trades = time_elapsed * self.npc_trade_frequency * self.npc_trade_frequency
+        for _ in range(rnd_poisson(expected_trades)):
+            self._execute_npc_trade()
     
     def _execute_npc_trade(self) -> None:
         """Execute a single NPC trade."""
@@ -220,41 +447,83 @@ class MarketSimulator:
         """
         Apply time-based evolution to market prices.
         
+        The result should not depend on how time is split into updates, so
+        the decay towards the base levels is the exact exponential one that
+        _relax uses, and the random fluctuation is a random walk whose spread
+        grows with the square root of time_elapsed: one 3600 second update
+        varies prices as much as 3600 one second updates, and one second
+        updates behave as they always have.
+        
+        A market bound to MarketColumns is evolved there, as arrays. For the
+        others, the supply/demand clamping of
+        StationMarket.update_supply_demand is done inline and
+        random.uniform(-0.02, 0.02) is drawn as -0.02 + 0.04 * random().
+        
         Args:
             time_elapsed: Time elapsed since last update
         """
-        evolution_factor = time_elapsed * self.time_evolution_factor
+        if self.columns is not None:
+            self.columns.evolve_market(
+                self.column_index, time_elapsed, self.last_simulation_time
+            )
+            return
+        
+        price_decay = -math.expm1(
+            -self.base_decay_rate * self.time_evolution_factor * time_elapsed
+        )
+        level_decay = -math.expm1(-0.01 * self.time_evolution_factor * time_elapsed)
+        noise_scale = self.time_evolution_factor * math.sqrt(time_elapsed)
+        current_time = self.last_simulation_time
+        draw = random.random
         
-        for item_id, market_data in self.market.market_items.items():
+        for market_data in self.market.market_items.values():
+            current_price = market_data.current_price
+            base_price = market_data.base_price
+            
             # Prices gradually return to base price
-            price_deviation = market_data.current_price - market_data.base_price
-            decay_amount = price_deviation * self.base_decay_rate * evolution_factor
+            decay_amount = (current_price - base_price) * price_decay
             
             # Apply random market fluctuations
-            random_factor = random.uniform(-0.02, 0.02) * evolution_factor
+            random_factor = (-0.02 + 0.04 * draw()) * noise_scale
             
-            # Calculate new price
-            new_price = market_data.current_price - decay_amount + (market_data.base_price * random_factor)
+            # Calculate new price, no lower than a tenth of the base price
+            new_price = current_price - decay_amount + (base_price * random_factor)
+            min_price = base_price * 0.1
+            if new_price < min_price:
+                new_price = min_price
             
-            # Ensure price doesn't go below a minimum threshold
-            min_price = market_data.base_price * 0.1
-            new_price = max(min_price, new_price)
+            # Record the price once it has moved significantly since it was
+            # last recorded, or from the base price if it never has been.
+            # Smaller moves still apply, so short updates add up to the same
+            # drift as long ones
+            recorded_price = market_data.price_history.price_back(1)
+            if recorded_price is None:
+                recorded_price = base_price
+            if abs(new_price - recorded_price) > 0.01:
+                market_data.update_price(new_price, current_time)
+            else:
+                market_data.current_price = new_price
             
-            # Update price if it changed significantly
-            if abs(new_price - market_data.current_price) > 0.01:
-                market_data.update_price(new_price)
-            
-            # Gradually normalize supply and demand levels
-            supply_normalization = (0.5 - market_data.supply_level) * 0.01 * evolution_factor
-            demand_normalization = (0.5 - market_data.demand_level) * 0.01 * evolution_factor
-            
-            self.market.update_supply_demand(
-                item_id, supply_normalization, demand_normalization
-            )
+            # Gradually normalize supply and demand levels (clamped to 0.0-1.0)
+            supply_level = market_data.supply_level
+            supply_level += (0.5 - supply_level) * level_decay
+            market_data.supply_level = 0.0 if supply_level < 0.0 else 1.0 if supply_level > 1.0 else supply_level
+            demand_level = market_data.demand_level
+            demand_level += (0.5 - demand_level) * level_decay
+            market_data.demand_level = 0.0 if demand_level < 0.0 else 1.0 if demand_level > 1.0 else demand_level
     
-    def _check_market_events(self) -> None:
-        """Check for and potentially trigger random market events."""
-        if random.random() < self.event_chance:
+    def _check_market_events(self, time_elapsed: float) -> None:
+        """
+        Check for and potentially trigger random market events.
+        
+        Events happen at events_per_hour on average, so the number of them
+        is drawn from a Poisson distribution over time_elapsed, whatever the
+        length of the update.
+        
+        Args:
+            time_elapsed: Time elapsed since last update in seconds
+        """
+        for _ in range(rnd_poisson(self.events_per_hour * time_elapsed / 3600)):
             self._trigger_market_event()
     
     def _trigger_market_event(self) -> None:
@@ -285,31 +554,31 @@ class MarketSimulator:
                 # Reduce supply, increase price
                 self.market.update_supply_demand(item_id, -0.3, 0.1)
                 new_price = market_data.current_price * random.uniform(1.1, 1.3)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, self.last_simulation_time)
                 
             elif event_type == "demand_surge":
                 # Increase demand, increase price
                 self.market.update_supply_demand(item_id, -0.1, 0.3)
                 new_price = market_data.current_price * random.uniform(1.05, 1.2)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, self.last_simulation_time)
                 
             elif event_type == "price_crash":
                 # Sudden price drop
                 new_price = market_data.current_price * random.uniform(0.6, 0.8)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, self.last_simulation_time)
                 self.market.update_supply_demand(item_id, 0.2, -0.2)
                 
             elif event_type == "market_boom":
                 # General price increase
                 new_price = market_data.current_price * random.uniform(1.1, 1.25)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, self.last_simulation_time)
                 self.market.update_supply_demand(item_id, -0.1, 0.1)
                 
             elif event_type == "trade_disruption":
                 # Increased volatility
                 price_change = random.uniform(-0.15, 0.15)
                 new_price = market_data.current_price * (1 + price_change)
-                market_data.update_price(new_price)
+                market_data.update_price(new_price, self.last_simulation_time)
     
     def get_price_data(self, item_id: str) -> Dict[str, Any]:
         """
@@ -375,15 +644,23 @@ class MarketSimulator:
         extreme_prices = 0
         stable_prices = 0
         
-        for market_data in self.market.market_items.values():
-            volatility = market_data.calculate_price_volatility()
-            total_volatility += volatility
-            
-            price_ratio = market_data.current_price / market_data.base_price
-            if price_ratio < 0.5 or price_ratio > 2.0:
-                extreme_prices += 1
-            elif 0.8 <= price_ratio <= 1.2:
-                stable_prices += 1
+        if self.columns is not None:
+            # The figures of a bound market are read as arrays
+            rows = self.columns.market_rows[self.column_index]
+            total_volatility = float(self.columns.market_volatility(self.column_index).sum())
+            price_ratios = self.columns.current_price[rows] / self.columns.base_price[rows]
+            extreme_prices = int(((price_ratios < 0.5) | (price_ratios > 2.0)).sum())
+            stable_prices = int(((price_ratios >= 0.8) & (price_ratios <= 1.2)).sum())
+        else:
+            for market_data in self.market.market_items.values():
+                volatility = market_data.calculate_price_volatility()
+                total_volatility += volatility
+                
+                price_ratio = market_data.current_price / market_data.base_price
+                if price_ratio < 0.5 or price_ratio > 2.0:
+                    extreme_prices += 1
+                elif 0.8 <= price_ratio <= 1.2:
+                    stable_prices += 1
         
         avg_volatility = total_volatility / len(self.market.market_items)
         stability_ratio = stable_prices / len(self.market.market_items)
@@ -101,6 +101,13 @@ class Ore(Resource):
             refining_difficulty=self.refining_difficulty,
         )
 
+    def __reduce_ex__(self, protocol):
+        # Ores from the ORES table are shared instances, so pickle them by ID to
+        # keep that identity (and avoid copying them) across processes
+        if ORES.get(self.commodity.commodity_id) is self:
+            return (_registered_ore, (self.commodity.commodity_id,))
+        return super().__reduce_ex__(protocol)
+
     def __hash__(self):
         # Use the ID and purity for hashing since they together form a unique identifier
         return hash((self.commodity.commodity_id, self.purity))
@@ -363,6 +370,11 @@ ORES = {
 }
 
 
+def _registered_ore(ore_id: int) -> Ore:
+    """Unpickling hook returning the shared ORES instance for ore_id."""
+    return ORES[ore_id]
+
+
 def get_ore_by_name(name: str) -> Ore | None:
     for ore in ORES.values():
         if ore.commodity.name.lower() == name.lower():
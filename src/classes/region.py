@@ -1,29 +1,305 @@
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 import math
 import random
 
+from src.classes.asteroid import AsteroidField
+from src.classes.celestial_body import CelestialBody
 from src.classes.solar_system import SolarSystem
 from src.data import (
     STELLAR_SYSTEM_NAMES,
     select_system_template,
     generate_system_from_template,
 )
+from src.helpers import derive_rng, derive_seed, get_rng
+
+
+# Object IDs of the system at index i start at (i + 1) * SYSTEM_ID_STRIDE, so
+# they are unique across the region; IDs below SYSTEM_ID_STRIDE are left to
+# objects created outside system generation
+SYSTEM_ID_STRIDE = 100_000
+
+
+def build_solar_system(
+    params: Dict[str, Any], seed: int, system_index: int = 0
+) -> SolarSystem:
+    """
+    Generate a solar system from its own seed.
+
+    All randomness comes from streams derived from the seed. The object ID
+    counters start from the system's own block of SYSTEM_ID_STRIDE IDs for
+    the duration of the build and are restored afterwards, so the generated
+    content only depends on the system's parameters, seed and index, never on
+    how many systems were generated before it, and IDs never repeat between
+    systems.
+    """
+    id_base = (system_index + 1) * SYSTEM_ID_STRIDE
+    saved_counters = (
+        CelestialBody.star_counter,
+        CelestialBody.planet_counter,
+        CelestialBody.moon_counter,
+        CelestialBody.belt_counter,
+        AsteroidField.belt_counter,
+    )
+    CelestialBody.star_counter = id_base
+    CelestialBody.planet_counter = id_base
+    CelestialBody.moon_counter = id_base
+    CelestialBody.belt_counter = id_base
+    AsteroidField.belt_counter = id_base
+    try:
+        return SolarSystem(**params, seed=seed)
+    finally:
+        (
+            CelestialBody.star_counter,
+            CelestialBody.planet_counter,
+            CelestialBody.moon_counter,
+            CelestialBody.belt_counter,
+            AsteroidField.belt_counter,
+        ) = saved_counters
+
+
+REGION_BOUNDS: Tuple[float, float] = (-100.0, 100.0)  # Light years, both axes
+UNIFORM_PLACEMENT_ATTEMPTS = 30  # Random darts per system before filling gaps
+GAP_FILL_ATTEMPTS = 30  # Candidates tried around an active system (Bridson's k)
+MIN_PLACEMENT_DISTANCE = 0.01
+
+
+class _PlacementGrid:
+    """
+    Spatial hash of placed system positions used for minimum distance checks.
+
+    Cells are min_distance / sqrt(2) wide, so each cell holds at most one system
+    and only the surrounding 5x5 block of cells (minus its corners) can contain
+    a system that is too close.
+    """
+
+    NEIGHBOUR_OFFSETS = [
+        (i, j)
+        for i in range(-2, 3)
+        for j in range(-2, 3)
+        if abs(i) + abs(j) < 4
+    ]
+
+    def __init__(self, min_distance: float):
+        self.min_distance = min_distance
+        self.min_distance_sq = min_distance * min_distance
+        self.cell_size = min_distance / math.sqrt(2)
+        self.cells: Dict[Tuple[int, int], Tuple[float, float]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def fits(self, x: float, y: float) -> bool:
+        """Check that (x, y) is at least min_distance away from every placed system."""
+        cx, cy = self._cell(x, y)
+        cells = self.cells
+        for i, j in self.NEIGHBOUR_OFFSETS:
+            other = cells.get((cx + i, cy + j))
+            if other is not None:
+                dx = x - other[0]
+                dy = y - other[1]
+                if dx * dx + dy * dy < self.min_distance_sq:
+                    return False
+        return True
+
+    def add(self, x: float, y: float) -> None:
+        self.cells[self._cell(x, y)] = (x, y)
+
+
+def _in_bounds(x: float, y: float) -> bool:
+    return REGION_BOUNDS[0] <= x <= REGION_BOUNDS[1] and REGION_BOUNDS[0] <= y <= REGION_BOUNDS[1]
+
+
+def place_systems(
+    num_systems: int, min_distance: float, rng: Optional[random.Random] = None
+) -> List[Tuple[float, float]]:
+    """
+    Pick positions for num_systems systems that are at least min_distance apart.
+
+    Systems are first placed by uniform random darts, so sparse regions stay
+    evenly spread over the whole sector. When darts stop landing, the remaining
+    systems are packed Bridson-style into the annulus [r, 2r] around systems that
+    still have free space next to them. All distance checks go through a spatial
+    hash, so placement runs in near-linear time. If the sector is saturated at
+    the current distance, the minimum distance is halved and placement continues.
+
+    Coordinates are rounded to two decimals before being checked, so the
+    guarantee holds for the stored positions.
+    """
+    rng = get_rng(rng)
+    low, high = REGION_BOUNDS
+    positions: List[Tuple[float, float]] = []
+    grid = _PlacementGrid(min_distance)
+    active: List[Tuple[float, float]] = []
+    # Once darts start missing the sector is dense, so skip them until it is rebuilt
+    filling_gaps = False
+
+    while len(positions) < num_systems:
+        placed = False
+        if not filling_gaps:
+            for _ in range(UNIFORM_PLACEMENT_ATTEMPTS):
+                x = round(rng.uniform(low, high), 2)
+                y = round(rng.uniform(low, high), 2)
+                if grid.fits(x, y):
+                    placed = True
+                    break
+            filling_gaps = not placed
+
+        while not placed and active:
+            index = rng.randrange(len(active))
+            origin_x, origin_y = active[index]
+            for _ in range(GAP_FILL_ATTEMPTS):
+                angle = rng.uniform(0, 2 * math.pi)
+                distance = rng.uniform(grid.min_distance, 2 * grid.min_distance)
+                x = round(origin_x + distance * math.cos(angle), 2)
+                y = round(origin_y + distance * math.sin(angle), 2)
+                if _in_bounds(x, y) and grid.fits(x, y):
+                    placed = True
+                    break
+            if not placed:
+                # No room left around this system, stop sampling from it
+                active[index] = active[-1]
+                active.pop()
+
+        if not placed:
+            if grid.min_distance <= MIN_PLACEMENT_DISTANCE:
+                raise ValueError(
+                    f"Cannot place {num_systems} systems in the region, "
+                    f"placed {len(positions)}."
+                )
+            reduced_distance = max(MIN_PLACEMENT_DISTANCE, grid.min_distance * 0.5)
+            print(
+                f"Warning: Could not place system {len(positions) + 1} with min_distance={grid.min_distance}. "
+                f"Reducing constraints to min_distance={reduced_distance}."
+            )
+            grid = _PlacementGrid(reduced_distance)
+            for pos_x, pos_y in positions:
+                grid.add(pos_x, pos_y)
+            active = list(positions)
+            filling_gaps = False
+            continue
+
+        grid.add(x, y)
+        positions.append((x, y))
+        active.append((x, y))
+
+    return positions
+
+
+class SolarSystemStub:
+    """
+    Lightweight placeholder for a solar system that has not been generated yet.
+    Holds only what is needed to list the system, measure distances to it and
+    generate it on demand.
+    """
+
+    __slots__ = ("name", "x", "y", "params", "seed", "index")
+
+    def __init__(self, params: Dict[str, Any], seed: int, index: int = 0):
+        self.name: str = params["name"]
+        self.x: float = params["x"]
+        self.y: float = params["y"]
+        self.params = params
+        self.seed = seed
+        self.index = index  # Position in the region, which picks the system's ID block
+
+    def get_position(self):
+        """Return the (x, y) position of the system in the region."""
+        return (self.x, self.y)
+
+    def materialize(self) -> SolarSystem:
+        """Generate the full solar system described by this stub."""
+        return build_solar_system(self.params, self.seed, self.index)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "x": self.x,
+            "y": self.y,
+            "stub": True,
+            "seed": self.seed,
+            "index": self.index,
+            "params": self.params,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, index: int = 0) -> "SolarSystemStub":
+        return cls(data["params"], data["seed"], data.get("index", index))
+
+
+RegionSystem = Union[SolarSystem, SolarSystemStub]
+
+
+def system_from_dict(data: dict, index: int = 0) -> RegionSystem:
+    """Load either a generated solar system or a not-yet-generated stub at index in its region."""
+    if data.get("stub"):
+        return SolarSystemStub.from_dict(data, index)
+    return SolarSystem.from_dict(data)
+
+
+def _materialize_stub(stub: SolarSystemStub) -> SolarSystem:
+    return stub.materialize()
+
+
+def materialize_stubs(
+    stubs: List[SolarSystemStub], workers: int = 1
+) -> List[SolarSystem]:
+    """
+    Generate the systems for a list of stubs, in order.
+
+    With more than one worker the systems are generated on a process pool and
+    sent back pickled. Every system only depends on its own stub, so the result
+    is identical to generating them one by one.
+    """
+    if workers <= 1 or len(stubs) <= 1:
+        return [stub.materialize() for stub in stubs]
+
+    chunksize = max(1, len(stubs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_materialize_stub, stubs, chunksize=chunksize))
+
+
+def materialize_system(systems: List[RegionSystem], index: int) -> SolarSystem:
+    """Return systems[index], replacing a stub in the list with its generated system."""
+    system = systems[index]
+    if isinstance(system, SolarSystemStub):
+        system = system.materialize()
+        systems[index] = system
+    return system
 
 
 class Region:
     """
     Represents a sector of the galaxy containing multiple solar systems.
     Coordinates are in light years, from (-100, -100) to (100, 100).
+
+    In a lazily generated region, systems are kept as SolarSystemStub entries
+    until get_system() is first called for them.
     """
 
     def __init__(self, name: str):
         self.name = name
-        self.solar_systems: List[SolarSystem] = []
+        self.solar_systems: List[RegionSystem] = []
 
-    def add_system(self, system: SolarSystem) -> None:
+    def add_system(self, system: RegionSystem) -> None:
         self.solar_systems.append(system)
 
-    def get_system_by_name(self, name: str) -> Optional[SolarSystem]:
+    def get_system(self, index: int) -> SolarSystem:
+        """Return the system at index, generating it first if it is still a stub."""
+        return materialize_system(self.solar_systems, index)
+
+    def materialize_all(self, workers: int = 1) -> None:
+        """Generate every system that is still a stub, in place."""
+        pending = [
+            index
+            for index, system in enumerate(self.solar_systems)
+            if isinstance(system, SolarSystemStub)
+        ]
+        stubs = [self.solar_systems[index] for index in pending]
+        for index, system in zip(pending, materialize_stubs(stubs, workers)):  # type: ignore[arg-type]
+            self.solar_systems[index] = system
+
+    def get_system_by_name(self, name: str) -> Optional[RegionSystem]:
         for system in self.solar_systems:
             if system.name == name:
                 return system
@@ -54,38 +330,48 @@ class Region:
         
         # Load solar systems if they exist in the data
         if "solar_systems" in data:
-            for system_data in data["solar_systems"]:
-                system = SolarSystem.from_dict(system_data)
-                region.add_system(system)
+            for index, system_data in enumerate(data["solar_systems"]):
+                region.add_system(system_from_dict(system_data, index))
         
         return region
 
     @staticmethod
     def generate_random_region(
-        name: str, num_systems: int = 50, min_distance: float = 2.0
+        name: str,
+        num_systems: int = 50,
+        min_distance: float = 2.0,
+        lazy: bool = False,
+        seed: Optional[int] = None,
+        workers: int = 1,
     ) -> "Region":
         """
         Generate a random region with the specified number of solar systems using templates.
         Templates provide variety in system characteristics including economy, security, and resources.
 
+        The layout is drawn from a stream derived from the seed and the region
+        name, and each system gets its own seed derived from the region path
+        and its name. A system's content is therefore the same whether it is
+        generated here, later on demand, or on its own.
+
         Args:
             name: Name of the region
             num_systems: Number of solar systems to generate (default: 50 for better variety)
             min_distance: Minimum distance between any two systems (in light years)
+            lazy: Keep systems as stubs and only generate them when first accessed
+            seed: Generation seed (drawn from the global random state if not given)
+            workers: Number of processes used to generate the systems when not lazy
 
         Returns:
             A new Region object containing the generated solar systems with diverse characteristics
         """
-        from src.classes.solar_system import SolarSystem
-
         region = Region(name)
-        used_positions: List[
-            tuple[float, float]
-        ] = []  # Store positions as (x, y) tuples
+        if seed is None:
+            seed = get_rng().getrandbits(64)
+        rng = derive_rng(seed, "region", name)
 
         # Create a shuffled copy of stellar names to ensure uniqueness
         available_names = STELLAR_SYSTEM_NAMES.copy()
-        random.shuffle(available_names)
+        rng.shuffle(available_names)
 
         # If we need more systems than we have names, we'll need to generate additional names
         if num_systems > len(available_names):
@@ -96,90 +382,22 @@ class Region:
                 available_names.append(
                     f"{base_name} {(i // len(base_names)) + 2}")
 
-        max_placement_attempts = 5000  # Prevent infinite loops
-
-        for i in range(num_systems):
-            attempt_count = 0
-            valid_position = False
-            x, y = 0.0, 0.0  # Initialize x and y here
-
-            while not valid_position and attempt_count < max_placement_attempts:
-                # Generate random coordinates
-                x = round(random.uniform(-100, 100), 2)
-                y = round(random.uniform(-100, 100), 2)
-
-                # Check if this position is far enough from existing systems
-                valid_position = True
-                for pos_x, pos_y in used_positions:
-                    distance = math.sqrt((x - pos_x) ** 2 + (y - pos_y) ** 2)
-                    if distance < min_distance:
-                        valid_position = False
-                        break
+        positions = place_systems(num_systems, min_distance, rng)
 
-                attempt_count += 1
-
-            # If we couldn\'t find a valid position after max attempts, try with reduced constraints
-            if not valid_position:  # Check if still not valid after initial attempts
-                print(
-                    f"Warning: Could not place system {i + 1} with min_distance={min_distance} after {max_placement_attempts} attempts. Reducing constraints."
-                )
-                local_min_distance = min_distance
-                fallback_attempts = 0
-                max_fallback_attempts = 10  # Limit attempts with reduced constraints
-
-                while (
-                    not valid_position
-                    and fallback_attempts < max_fallback_attempts
-                    and local_min_distance > 0.01
-                ):  # Ensure local_min_distance is positive
-                    local_min_distance *= 0.5
-                    if local_min_distance < 0.01:  # Prevent extremely small distances
-                        local_min_distance = 0.01
-
-                    # Try to find a position with the new local_min_distance
-                    for _ in range(
-                        max_placement_attempts // 5
-                    ):  # Fewer attempts for fallback
-                        x_candidate = round(random.uniform(-100, 100), 2)
-                        y_candidate = round(random.uniform(-100, 100), 2)
-
-                        candidate_ok = True
-                        for pos_x, pos_y in used_positions:
-                            distance = math.sqrt(
-                                (x_candidate - pos_x) ** 2 +
-                                (y_candidate - pos_y) ** 2
-                            )
-                            if distance < local_min_distance:
-                                candidate_ok = False
-                                break
-                        if candidate_ok:
-                            x, y = x_candidate, y_candidate
-                            valid_position = True
-                            break
-                    fallback_attempts += 1
-
-                if not valid_position:
-                    print(
-                        f"Critical: Failed to place system {i + 1} even with reduced constraints. Placing at a default offset to avoid (0,0)."
-                    )
-                    # Fallback to a slightly offset position to avoid stacking all at (0,0)
-                    # This is a last resort and indicates a potential issue with density or region size.
-                    x = round(random.uniform(0.1, 1.0) * (i + 1), 2)
-                    y = round(random.uniform(0.1, 1.0) * (i + 1), 2)
-                    # Ensure it's still within bounds, though this is less critical than avoiding (0,0)
-                    x = max(-100, min(100, x))
-                    # Add the position to our used positions list
-                    y = max(-100, min(100, y))
+        for i, (x, y) in enumerate(positions):
             # Use a unique name from our available names list
-            used_positions.append((x, y))
             system_name = available_names[i]
 
             # Select a system template and generate parameters
-            template = select_system_template()
+            template = select_system_template(rng)
             system_params = generate_system_from_template(
-                system_name, x, y, template)
+                system_name, x, y, template, rng)
+
+            system_seed = derive_seed(seed, "region", name, "system", system_name)
+
+            region.add_system(SolarSystemStub(system_params, system_seed, i))
 
-            # Create the solar system using template parameters
-            system = SolarSystem(**system_params)
-            region.add_system(system)
+        # Create the solar systems using template parameters
+        if not lazy:
+            region.materialize_all(workers)
         return region
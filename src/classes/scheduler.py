@@ -0,0 +1,129 @@
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Tuple
+
+# Called with the game time of the (last) occurrence being run and how many
+# occurrences of the event that call stands for
+EventCallback = Callable[[float, int], None]
+
+
+@dataclass(eq=False)
+class ScheduledEvent:
+    """
+    A callback due at a point in game time, optionally repeating every interval.
+
+    A periodic event that coalesces runs once for all of its occurrences that
+    fell due in a single advance of the clock, with the count passed to the
+    callback, so that skipping a year costs one call and not 365 of them.
+    """
+
+    name: str
+    callback: EventCallback
+    due_time: float
+    interval: Optional[float] = None
+    coalesce: bool = True
+    cancelled: bool = field(default=False, init=False)
+
+    @property
+    def is_periodic(self) -> bool:
+        return self.interval is not None
+
+
+class GameScheduler:
+    """Priority queue of ScheduledEvents keyed by game time (global_time)."""
+
+    def __init__(self) -> None:
+        # (due_time, insertion order, event); the counter keeps events that
+        # are due at the same time in the order they were scheduled
+        self._queue: List[Tuple[float, int, ScheduledEvent]] = []
+        self._counter = itertools.count()
+        self._events_by_name: dict[str, ScheduledEvent] = {}
+
+    def __len__(self) -> int:
+        return len(self._events_by_name)
+
+    def schedule(self, name: str, due_time: float, callback: EventCallback) -> ScheduledEvent:
+        """Run callback once, the first time the clock reaches due_time."""
+        return self._push(ScheduledEvent(name, callback, due_time))
+
+    def schedule_periodic(
+        self,
+        name: str,
+        first_time: float,
+        interval: float,
+        callback: EventCallback,
+        coalesce: bool = True,
+    ) -> ScheduledEvent:
+        """Run callback at first_time and every interval after it."""
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        return self._push(
+            ScheduledEvent(name, callback, first_time, interval, coalesce)
+        )
+
+    def cancel(self, name: str) -> bool:
+        """Cancel the event registered under name. Returns False if there was none."""
+        event = self._events_by_name.pop(name, None)
+        if event is None:
+            return False
+        event.cancelled = True  # Dropped when it reaches the front of the queue
+        return True
+
+    def get_event(self, name: str) -> Optional[ScheduledEvent]:
+        return self._events_by_name.get(name)
+
+    def next_due_time(self) -> Optional[float]:
+        self._drop_cancelled()
+        return self._queue[0][0] if self._queue else None
+
+    def run_until(self, current_time: float) -> int:
+        """
+        Run every event due at or before current_time, earliest first.
+
+        Events scheduled by a callback for a time that has already passed
+        run in the same call. If a callback raises, its event is put back
+        as it was, so the occurrences it stood for run again on the next
+        call, and the exception propagates. Returns the number of callbacks
+        made.
+        """
+        calls = 0
+        while True:
+            self._drop_cancelled()
+            if not self._queue or self._queue[0][0] > current_time:
+                return calls
+            first_due_time, _, event = heapq.heappop(self._queue)
+
+            due_time = first_due_time
+            occurrences = 1
+            if event.is_periodic and event.coalesce:
+                occurrences += int((current_time - due_time) // event.interval)  # type: ignore[operator]
+                due_time += (occurrences - 1) * event.interval  # type: ignore[operator]
+
+            if not event.is_periodic:
+                self._events_by_name.pop(event.name, None)
+
+            try:
+                event.callback(due_time, occurrences)
+            except Exception:
+                # Unless the callback cancelled or replaced it
+                if not event.cancelled and self._events_by_name.get(event.name, event) is event:
+                    self._events_by_name[event.name] = event
+                    heapq.heappush(self._queue, (first_due_time, next(self._counter), event))
+                raise
+            calls += 1
+
+            # A callback that cancels or reschedules its own event cancels this one
+            if event.is_periodic and not event.cancelled:
+                event.due_time = due_time + event.interval  # type: ignore[operator]
+                heapq.heappush(self._queue, (event.due_time, next(self._counter), event))
+
+    def _push(self, event: ScheduledEvent) -> ScheduledEvent:
+        self.cancel(event.name)
+        self._events_by_name[event.name] = event
+        heapq.heappush(self._queue, (event.due_time, next(self._counter), event))
+        return event
+
+    def _drop_cancelled(self) -> None:
+        while self._queue and self._queue[0][2].cancelled:
+            heapq.heappop(self._queue)
@@ -1,7 +1,5 @@
 from typing import Optional, Tuple, List, Dict, Union, Any
 
-from pygame import Vector2
-
 from src.classes.asteroid import Asteroid, AsteroidField
 from src.classes.engine import Engine, EngineType
 from src.classes.station import Station
@@ -19,7 +17,7 @@ from src.data import (
     ENGINES,
     SHIP_TEMPLATES,
 )
-from src.helpers import euclidean_distance, vector_to_string, format_seconds
+from src.helpers import Vector2, euclidean_distance, vector_to_string, format_seconds, rnd_binomial
 
 
 class Ship:
@@ -177,6 +175,19 @@ class Ship:
         """
         return self.cargo_hold.remove_item(item_id, quantity)
     
+    def remove_cargo_many(self, removals: List[Tuple[str, int]]) -> CargoResult[List[CargoItem]]:
+        """
+        Remove several items from ship's cargo at once.
+        
+        Args:
+            removals: Pairs of item ID and number of items to remove
+            
+        Returns:
+            Result[List[CargoItem], CargoErrorDetails]: Removed items or error details;
+            on error nothing is removed
+        """
+        return self.cargo_hold.remove_many(removals)
+    
     def get_cargo_item(self, item_id: str) -> CargoResult[CargoItem]:
         """
         Get specific cargo item by ID.
@@ -189,6 +200,18 @@ class Ship:
         """
         return self.cargo_hold.get_item(item_id)
     
+    def get_cargo_items(self, item_ids: List[str]) -> CargoResult[List[CargoItem]]:
+        """
+        Get cargo items for several IDs at once.
+        
+        Args:
+            item_ids: IDs of the items to retrieve
+            
+        Returns:
+            Result[List[CargoItem], CargoErrorDetails]: Found items or error details
+        """
+        return self.cargo_hold.get_many(item_ids)
+    
     def get_all_cargo(self) -> List[CargoItem]:
         """Get all cargo items."""
         return self.cargo_hold.get_all_items()
@@ -197,6 +220,10 @@ class Ship:
         """Get cargo items of specific type."""
         return self.cargo_hold.get_items_by_type(item_type)
     
+    def get_cargo_by_name(self, name: str) -> List[CargoItem]:
+        """Get cargo items whose name matches, ignoring case."""
+        return self.cargo_hold.get_items_by_name(name)
+    
     def get_cargo_space_used(self) -> float:
         """Get total cargo space used."""
         return self.cargo_hold.get_occupied_space()
@@ -317,17 +344,14 @@ class Ship:
         )  # Store current position before moving
         self.consume_fuel(fuel_consumed)
         self.space_object.position = destination
-        game_state.global_time += travel_time
+        game_state.advance_time(travel_time)
         print(f"The ship has arrived at {vector_to_string(destination)}")
 
     def status_to_string(self) -> list[str]:
-        ore_items = self.cargo_hold.get_items_by_type(Ore)
-        mineral_items = self.cargo_hold.get_items_by_type(Mineral)
-        
-        ore_units = sum(cargo.quantity for cargo in ore_items)
-        mineral_units = sum(cargo.quantity for cargo in mineral_items)
-        ore_volume = sum(cargo.total_volume for cargo in ore_items)
-        mineral_volume = sum(cargo.total_volume for cargo in mineral_items)
+        ore_units = self.cargo_hold.get_type_units(Ore)
+        mineral_units = self.cargo_hold.get_type_units(Mineral)
+        ore_volume = self.cargo_hold.get_type_volume(Ore)
+        mineral_volume = self.cargo_hold.get_type_volume(Mineral)
         total_cargo_occupied = self.cargo_hold.get_occupied_space()
         
         docked_at_name = "Not docked" if self.docked_at is None else self.docked_at.name
@@ -417,43 +441,33 @@ class Ship:
             )
 
         # Initialize mining variables
-        asteroid_being_mined: Asteroid | None = None
-        ores_mined: list[OreCargo] = []
-        mined_volume: float = 0
+        asteroids = asteroid_field.asteroids
+        selected_ore_ids = (
+            asteroid_field.get_ore_ids(ores_selected_list)
+            if ores_selected_list is not None
+            else None
+        )
+        asteroid_index = -1
+        ores_mined: Dict[int, OreCargo] = {}
         time_spent = 0
         lost_ore_count = 0
 
-        # Begin mining loop
-        while (not mine_until_full and int(time_spent) < int(time_to_mine)) or (
+        # Begin mining loop. Each pass works one asteroid in a single batch: the
+        # units taken are bounded by what is left in the asteroid, the time left
+        # and the units that fit in the hold, which is where a unit-by-unit loop
+        # would have stopped as well.
+        while (not mine_until_full and time_spent < int(time_to_mine)) or (
             mine_until_full and not self.is_cargo_full()
         ):
-            # Find a new asteroid to mine if needed
-            if asteroid_being_mined is None or asteroid_being_mined.volume <= 0:
-                asteroid_being_mined = next(
-                    (
-                        asteroid
-                        for asteroid in asteroid_field.asteroids
-                        if asteroid.volume > 0
-                    ),
-                    None,
-                )
-                if asteroid_being_mined is None:
+            # Find a new asteroid of the selected ores if needed
+            if asteroid_index < 0 or asteroids.volumes[asteroid_index] <= 0:
+                asteroid_index = asteroids.next_minable(selected_ore_ids)
+                if asteroid_index < 0:
                     print("No more asteroids available to mine.")
-                    continue
+                    break
 
             # Access the ore in the asteroid
-            ore = asteroid_being_mined.ore
-
-            # If specific ores are selected, validate they match the current asteroid's ore
-            if ores_selected_list is not None:
-                if ore.name.lower() not in (
-                    ore_name.lower() for ore_name in ores_selected_list
-                ):
-                    print(
-                        f"Skipping {ore.name}, as it is not in the selected ores list."
-                    )
-                    asteroid_being_mined = None
-                    continue
+            ore = asteroids.get_ore(asteroid_index)
 
             # Check if the ore fits in the remaining cargo capacity
             if not self.can_fit_cargo(ore, 1):
@@ -462,37 +476,50 @@ class Ship:
                 )
                 break  # Stop mining if no further ores can be added safely
 
-            # Apply forgetful trait - chance to lose ore
-            import random
-
-            if forgetful_chance > 0 and random.random() < forgetful_chance:
-                # Ore is mined but "lost"
-                lost_ore_count += 1
-                asteroid_being_mined.volume -= ore.volume
-                time_spent += 1
-                continue  # Skip adding to cargo
+            attempts_left = asteroids.units_remaining(asteroid_index)
+            if not mine_until_full:
+                attempts_left = min(attempts_left, int(time_to_mine) - time_spent)
+            cargo_room = self.cargo_hold.count_fitting_units(ore, attempts_left)
+
+            # Every attempt takes a second and a unit out of the asteroid, but a
+            # forgetful miner loses some. Draw the losses for as many attempts as
+            # can't overflow the hold, then retry with the room they left free.
+            attempts = 0
+            mined = 0
+            while attempts < attempts_left and mined < cargo_room:
+                batch = min(attempts_left - attempts, cargo_room - mined)
+                attempts += batch
+                mined += batch - rnd_binomial(batch, forgetful_chance)
+
+            asteroids.extract(asteroid_index, attempts)
+            time_spent += attempts
+            lost_ore_count += attempts - mined
+            if mined == 0:
+                continue
+
+            # Add the ore to the ship's cargo; count_fitting_units made room
+            # for it, so a failure here is an error rather than a full hold
+            price = ore.commodity.base_price
+            cargo_result = self.add_cargo(ore, mined, price, price)
+            if cargo_result.is_err():
+                print(
+                    f"Failed to store mined {ore.name}: {cargo_result.unwrap_err().message}"
+                )
+                break
 
             # Add the ore to mined cargo
-            ore_cargo = next(
-                (cargo for cargo in ores_mined if cargo.ore.commodity.commodity_id == ore.commodity.commodity_id), None
-            )
+            ore_cargo = ores_mined.get(ore.commodity.commodity_id)
             if ore_cargo:
-                ore_cargo.quantity += 1
+                ore_cargo.quantity += mined
             else:
-                ores_mined.append(
-                    OreCargo(ore, 1, ore.commodity.base_price, ore.commodity.base_price))
-
-            # Decrease the asteroid's volume and add to ship's cargo
-            asteroid_being_mined.volume -= ore.commodity.volume_per_unit
-            self.add_cargo(ore, 1, ore.commodity.base_price, ore.commodity.base_price)
-            mined_volume += effective_mining_speed
-            time_spent += 1
+                ores_mined[ore.commodity.commodity_id] = OreCargo(
+                    ore, mined, ore.commodity.base_price, ore.commodity.base_price)
 
         # Summarize mined results
         total_volume = sum(
-            cargo.quantity * cargo.ore.commodity.volume_per_unit for cargo in ores_mined)
-        total_quantity = sum(cargo.quantity for cargo in ores_mined)
-        ore_names = {cargo.ore.commodity.name for cargo in ores_mined}
+            cargo.quantity * cargo.ore.commodity.volume_per_unit for cargo in ores_mined.values())
+        total_quantity = sum(cargo.quantity for cargo in ores_mined.values())
+        ore_names = {cargo.ore.commodity.name for cargo in ores_mined.values()}
 
         # Note: Ores are already added to cargo during mining loop above
 
@@ -509,7 +536,7 @@ class Ship:
                 "No ores were mined."
             )
         print(f"Time spent mining: {time_spent} seconds.")
-        game_state.global_time += time_spent
+        game_state.advance_time(time_spent)
 
 
 
@@ -518,7 +545,10 @@ class Ship:
     # Note: get_remaining_cargo_space method is already defined above in the new cargo interface
 
     def check_field_presence(self, game_state) -> Tuple[bool, Optional[AsteroidField]]:
-        for field in game_state.get_current_solar_system().get_all_asteroid_fields():
+        position = self.space_object.position
+        for field in game_state.get_current_solar_system().get_fields_near(
+            position, self.interaction_radius
+        ):
             if self.interaction_radius > euclidean_distance(
                 self.space_object.position, field.space_object.position
             ):
@@ -1292,7 +1322,7 @@ class Ship:
             )  # Adjust based on ship's FTL efficiency
             days_to_travel = distance / (1e-10 * ftl_speed_modifier)
             ftl_travel_time = days_to_travel * 86400  # Convert days to seconds
-            game_state.global_time += ftl_travel_time
+            game_state.advance_time(ftl_travel_time)
 
             # Apply some wear to containment from the jump
             self.containment_integrity = max(
@@ -2,9 +2,7 @@ from datetime import timedelta
 from typing import Tuple, Dict, Any, TYPE_CHECKING
 
 import random
-from pygame import Vector2
-
-from src.helpers import format_seconds
+from src.helpers import Vector2, format_seconds
 from src.events.ftl_events import get_random_ftl_event
 
 # Use TYPE_CHECKING to avoid circular imports
@@ -1,25 +1,137 @@
+import heapq
 import random
 import math
-from typing import Union, List, Optional
-
-from pygame import Vector2
+from array import array
+from typing import Dict, List, Optional, Tuple, Union
 
 from src import data
 from src.data import SolarSystemZone
 from src.classes.asteroid import AsteroidField
 from src.classes.station import Station
 from src.classes.celestial_body import Star, Planet, Moon, AsteroidBelt, CelestialBody
+from src.classes.spatial_index import SystemSpatialIndex
 from src.helpers import (
+    derive_rng,
     euclidean_distance,
+    get_rng,
     rnd_float,
     rnd_int,
+    Vector2,
 )
 
+# Cell size (AU) of the per-system spatial index
+SPATIAL_INDEX_CELL_SIZE = 1.0
+
+# Objects returned by scan_next_objects() when no amount is given and there
+# is no earlier batch to match
+DEFAULT_SCAN_BATCH_SIZE = 10
+
 # Extended HasSpaceObjectType to include new celestial bodies
 HasSpaceObjectType = Union[AsteroidField,
                            Station, Star, Planet, Moon, AsteroidBelt]
 
 
+class SystemCatalogue:
+    """
+    Typed views over the objects of a solar system, built in one pass over its
+    celestial bodies. SolarSystem keeps one and rebuilds it only after bodies
+    or stations were added or removed.
+    """
+
+    def __init__(self, celestial_bodies: List[CelestialBody]) -> None:
+        self.bodies: List[CelestialBody] = list(celestial_bodies)
+        self.stations: List[Station] = []
+        self.fields: List[AsteroidField] = []
+        # Scan targets: stars, planets, moons, belts (as a whole) and stations.
+        # Asteroid fields are accessed through their parent belts.
+        self.space_objects: List[HasSpaceObjectType] = []
+        self.by_id: Dict[Tuple[str, int], HasSpaceObjectType] = {}
+        self.by_type: Dict[type, List[HasSpaceObjectType]] = {}
+        # Coordinates and scan weights of space_objects, index for index
+        self.xs = array("d")
+        self.ys = array("d")
+        self.scan_weights = array("d")
+
+        for body in self.bodies:
+            if isinstance(body, (Star, Planet, Moon, AsteroidBelt)):
+                self._add_space_object(body)
+            if isinstance(body, AsteroidBelt):
+                for field in body.asteroid_fields:
+                    self.fields.append(field)
+                    self._register(field)
+            for station in getattr(body, "stations", ()):
+                self.stations.append(station)
+                self._add_space_object(station)
+
+    def _register(self, obj: HasSpaceObjectType) -> bool:
+        # Type and ID together identify an object, IDs are only unique per type
+        key = (type(obj).__name__, obj.space_object.id)
+        if key in self.by_id:
+            return False
+        self.by_id[key] = obj
+        self.by_type.setdefault(type(obj), []).append(obj)
+        return True
+
+    def _add_space_object(self, obj: HasSpaceObjectType) -> None:
+        if self._register(obj):
+            self.space_objects.append(obj)
+            self.xs.append(obj.space_object.position.x)
+            self.ys.append(obj.space_object.position.y)
+            self.scan_weights.append(scan_weight(obj))
+
+
+def scan_weight(obj: HasSpaceObjectType) -> float:
+    """Multiplier applied to an object's distance when ranking scan results."""
+    if isinstance(obj, Star):
+        return 0.1  # Stars are always visible
+    elif isinstance(obj, Planet):
+        return 0.3  # Planets are highly visible
+    elif isinstance(obj, AsteroidBelt):
+        return 0.7  # Belts are moderately visible
+    elif isinstance(obj, Moon):
+        return 0.8  # Moons are less visible
+    # Standard visibility (stations, asteroid fields)
+    return 1.0
+
+
+class ScanCursor:
+    """
+    The scan targets of a system in scan priority order, as seen from one
+    position. Priorities are computed once into a heap, and each call to
+    next() pops only the objects it returns, so paging through a scan never
+    sorts the whole system.
+    """
+
+    def __init__(self, catalogue: SystemCatalogue, position: Vector2) -> None:
+        self.catalogue = catalogue
+        self.position = position.copy()
+        self.batch_size = 0
+        self.returned = 0
+        px, py = position.x, position.y
+        # Same rounding as euclidean_distance, ties keep catalogue order
+        self._heap = [
+            (round(math.sqrt((px - x) ** 2 + (py - y) ** 2), 2) * weight, index)
+            for index, (x, y, weight) in enumerate(
+                zip(catalogue.xs, catalogue.ys, catalogue.scan_weights)
+            )
+        ]
+        heapq.heapify(self._heap)
+
+    def next(self, amount: int) -> List[HasSpaceObjectType]:
+        """Return the next amount objects, closest (by priority) first."""
+        self.batch_size = amount
+        heap = self._heap
+        objects = self.catalogue.space_objects
+        found = [
+            objects[heapq.heappop(heap)[1]] for _ in range(max(0, min(amount, len(heap))))
+        ]
+        self.returned += len(found)
+        return found
+
+    def remaining(self) -> int:
+        return len(self._heap)
+
+
 class SolarSystem:
     def __init__(
         self,
@@ -36,6 +148,7 @@ class SolarSystem:
         population: Optional[int] = None,
         tech_level: Optional[int] = None,
         anomalies: Optional[List[str]] = None,  # Added anomalies
+        seed: Optional[int] = None,
     ):
         self.x = x  # X position in region (LY)
         self.y = y  # Y position in region (LY)
@@ -61,6 +174,16 @@ class SolarSystem:
         self.tech_level = tech_level
         self.anomalies = anomalies if anomalies is not None else []
 
+        # Seed of this system's generation streams; derived from the global
+        # random state when the system isn't created from a region seed
+        self.seed: int = seed if seed is not None else get_rng().getrandbits(64)
+
+        # Built on first use, see get_catalogue() and get_spatial_index()
+        self._catalogue: Optional[SystemCatalogue] = None
+        self._spatial_index: Optional[SystemSpatialIndex] = None
+        # Position and progress of the last scan, see scan_next_objects()
+        self._scan_cursor: Optional[ScanCursor] = None
+
         # Generate celestial bodies (frost line will be set after star generation)
         self.generate_celestial_bodies()
 
@@ -111,36 +234,45 @@ class SolarSystem:
         else:
             return SolarSystemZone.OUTER_COLD
 
-    def _random_position_within_radius(self) -> Vector2:
+    def _random_position_within_radius(self, rng: random.Random) -> Vector2:
         """
         Generate a random position within a circle of radius self.size (AU).
         Returns a Vector2.
         """
-        angle = random.uniform(0, 2 * 3.141592653589793)
-        radius = random.uniform(0, self.size)
+        angle = rng.uniform(0, 2 * 3.141592653589793)
+        radius = rng.uniform(0, self.size)
         x = radius * math.cos(angle)
         y = radius * math.sin(angle)
         return Vector2(round(x, 2), round(y, 2))
 
     def generate_celestial_bodies(self) -> None:
-        """Generates all celestial bodies for the solar system."""
+        """
+        Generates all celestial bodies for the solar system.
+
+        The layout (star, planets, moons, belt and station placement) is drawn
+        from the system's own stream, while each belt and station fills its
+        contents from a stream derived from its own path, so the result only
+        depends on self.seed.
+        """
+        rng = derive_rng(self.seed, "layout")
         self.celestial_bodies = []  # Clear previous bodies
         self.planets = []  # Clear planets list
         self.asteroid_belts = []  # Clear asteroid belts list
-        self._generate_star()  # Central star
-        self._generate_planets()  # Planets and their moons
-        self._generate_asteroid_belts()  # Asteroid Belts and their fields
-        self._generate_orbital_stations()  # Stations around various bodies
+        self._generate_star(rng)  # Central star
+        self._generate_planets(rng)  # Planets and their moons
+        self._generate_asteroid_belts(rng)  # Asteroid Belts and their fields
+        self._generate_orbital_stations(rng)  # Stations around various bodies
         # Independent stations are handled by _generate_orbital_stations
+        self.invalidate_catalogue()
 
-    def _generate_star(self) -> None:
+    def _generate_star(self, rng: random.Random) -> None:
         """Generate the central star at (0, 0)"""
         star_name = f"{self.name} Primary"
-        self.star = Star(star_name, Vector2(0, 0))
+        self.star = Star(star_name, Vector2(0, 0), rng)
         # Add star to celestial_bodies
         self.celestial_bodies.append(self.star)
 
-    def _generate_planets(self) -> None:
+    def _generate_planets(self, rng: random.Random) -> None:
         """Generates planets orbiting the central star."""
         if not any(isinstance(cb, Star) for cb in self.celestial_bodies):
             print("No star found to orbit. Skipping planet generation.")
@@ -148,34 +280,37 @@ class SolarSystem:
 
         star = next(cb for cb in self.celestial_bodies if isinstance(cb, Star))
         num_planets = rnd_int(
-            data.PLANET_MIN_MAX_NUM[0], data.PLANET_MIN_MAX_NUM[1])
+            data.PLANET_MIN_MAX_NUM[0], data.PLANET_MIN_MAX_NUM[1], rng)
         used_orbital_distances: List[float] = []
 
         for i in range(num_planets):
             planet_name = f"{self.name} {self._get_planet_designation(i)}"
             orbital_distance = self._select_orbital_distance(
-                used_orbital_distances)
+                used_orbital_distances, rng)
             if orbital_distance is None:  # Should not happen with fallback
                 print(
                     f"Could not find orbital distance for planet {i + 1}, skipping.")
                 continue
             used_orbital_distances.append(orbital_distance)
-            position = self._calculate_orbital_position(orbital_distance)
+            position = self._calculate_orbital_position(orbital_distance, rng=rng)
             # Planet constructor only takes name, position, and orbital_distance parameters
             # Other properties are calculated internally based on orbital_distance
             planet = Planet(
-                name=planet_name, position=position, orbital_distance=orbital_distance
+                name=planet_name,
+                position=position,
+                orbital_distance=orbital_distance,
+                rng=rng,
             )
             star.add_child(planet)  # Star is the parent
             self.celestial_bodies.append(planet)
             # Add to planets list for easier access
             self.planets.append(planet)
-            self._generate_moons(planet)  # Generate moons for this planet
+            self._generate_moons(planet, rng)  # Generate moons for this planet
 
-    def _generate_asteroid_belts(self) -> None:
+    def _generate_asteroid_belts(self, rng: random.Random) -> None:
         """Generates asteroid belts in the solar system."""
         num_belts = rnd_int(
-            data.ASTEROID_BELT_MIN_MAX_NUM[0], data.ASTEROID_BELT_MIN_MAX_NUM[1]
+            data.ASTEROID_BELT_MIN_MAX_NUM[0], data.ASTEROID_BELT_MIN_MAX_NUM[1], rng
         )
         if not num_belts:
             return
@@ -221,7 +356,7 @@ class SolarSystem:
             attempts = 0
             belt_middle_dist = None
             while attempts < 10:
-                temp_middle = rnd_float(min_belt_zone_start, max_belt_zone_end)
+                temp_middle = rnd_float(min_belt_zone_start, max_belt_zone_end, rng)
                 # Check if too close to other belts (simplified check)
                 if not any(
                     abs(temp_middle - ub_middle)
@@ -235,12 +370,12 @@ class SolarSystem:
             if belt_middle_dist is None:
                 # Fallback: just pick a random spot, might overlap
                 belt_middle_dist = rnd_float(
-                    min_belt_zone_start, max_belt_zone_end)
+                    min_belt_zone_start, max_belt_zone_end, rng)
 
             used_belt_middles.append(belt_middle_dist)
 
             belt_width = rnd_float(
-                data.ASTEROID_BELT_WIDTH_MIN_MAX[0], data.ASTEROID_BELT_WIDTH_MIN_MAX[1]
+                data.ASTEROID_BELT_WIDTH_MIN_MAX[0], data.ASTEROID_BELT_WIDTH_MIN_MAX[1], rng
             )
             inner_radius = belt_middle_dist - belt_width / 2
             outer_radius = belt_middle_dist + belt_width / 2
@@ -254,11 +389,12 @@ class SolarSystem:
             num_fields = rnd_int(
                 data.ASTEROID_BELT_FIELDS_MIN_MAX[0],
                 data.ASTEROID_BELT_FIELDS_MIN_MAX[1],
+                rng,
             )
 
             # Calculate belt position based on its middle orbital distance
             # This gives the belt a representative position for scanning/display purposes
-            belt_position = self._calculate_orbital_position(belt_middle_dist)
+            belt_position = self._calculate_orbital_position(belt_middle_dist, rng=rng)
 
             belt = AsteroidBelt(
                 name=belt_name,
@@ -267,6 +403,7 @@ class SolarSystem:
                 outer_radius=outer_radius,
                 num_fields=num_fields,
                 parent_system=self,  # Pass reference to this solar system
+                rng=derive_rng(self.seed, "belt", belt_name),
             )
 
             # Set the orbital distance for proper celestial body behavior
@@ -276,18 +413,18 @@ class SolarSystem:
             # Keep a specific list of belts too
             self.asteroid_belts.append(belt)
 
-    def _generate_moons(self, planet: Planet) -> None:
+    def _generate_moons(self, planet: Planet, rng: random.Random) -> None:
         """Generate moons for planets"""
         # Larger planets more likely to have moons
         moon_chance = min(0.8, planet.radius * 10)  # Up to 80% chance
 
-        if random.random() < moon_chance:
-            num_moons = random.randint(1, 3)
+        if rng.random() < moon_chance:
+            num_moons = rng.randint(1, 3)
             for i in range(num_moons):
                 # Position moon around planet
-                moon_distance = random.uniform(
+                moon_distance = rng.uniform(
                     0.1, 0.5)  # Distance from planet
-                angle = random.uniform(0, 2 * math.pi)
+                angle = rng.uniform(0, 2 * math.pi)
 
                 moon_x = planet.space_object.position.x + moon_distance * math.cos(
                     angle
@@ -303,30 +440,30 @@ class SolarSystem:
                 # Add moon to celestial_bodies list
                 self.celestial_bodies.append(moon)
 
-    def _generate_orbital_stations(self) -> None:
+    def _generate_orbital_stations(self, rng: random.Random) -> None:
         """Generate orbital stations around celestial bodies"""
         # Generate stations around star
-        if self.star and random.random() < 0.3:  # 30% chance
-            self._create_orbital_station(self.star, "Solar Station")
+        if self.star and rng.random() < 0.3:  # 30% chance
+            self._create_orbital_station(self.star, "Solar Station", rng)
 
         # Generate stations around planets
         for planet in self.planets:
-            if random.random() < 0.4:  # 40% chance per planet
-                self._create_orbital_station(planet, "Orbital Station")
+            if rng.random() < 0.4:  # 40% chance per planet
+                self._create_orbital_station(planet, "Orbital Station", rng)
 
         # Generate independent stations (directly attached to star)
         station_count = self._count_all_stations()
         remaining_stations = max(0, self.station_quantity - station_count)
         for i in range(remaining_stations):
-            self._create_independent_station(i)
+            self._create_independent_station(i, rng)
 
     def _create_orbital_station(
-        self, celestial_body: CelestialBody, station_type: str
+        self, celestial_body: CelestialBody, station_type: str, rng: random.Random
     ) -> None:
         """Create a station orbiting a celestial body"""
         # Position station in orbit around the celestial body
-        orbital_distance = celestial_body.radius + random.uniform(0.05, 0.2)
-        angle = random.uniform(0, 2 * math.pi)
+        orbital_distance = celestial_body.radius + rng.uniform(0.05, 0.2)
+        angle = rng.uniform(0, 2 * math.pi)
 
         station_x = (
             celestial_body.space_object.position.x +
@@ -338,18 +475,22 @@ class SolarSystem:
         )
         station_position = Vector2(round(station_x, 2), round(station_y, 2))
 
-        station_name = f"{data.generate_random_name(rnd_int(2, 4))} {station_type}"
-        station_id = len(self.get_all_stations())
+        station_name = f"{data.generate_random_name(rnd_int(2, 4, rng), rng)} {station_type}"
+        station_id = self._count_all_stations()
 
         station = Station(
-            station_name, station_id, station_position, orbital_parent=celestial_body
+            station_name,
+            station_id,
+            station_position,
+            orbital_parent=celestial_body,
+            rng=derive_rng(self.seed, "station", station_id),
         )
         celestial_body.add_station(station)
 
-    def _create_independent_station(self, station_index: int) -> None:
+    def _create_independent_station(self, station_index: int, rng: random.Random) -> None:
         """Create an independent station in free space (attached to star for structure)"""
         for attempt in range(20):
-            position = self._random_position_within_radius()
+            position = self._random_position_within_radius(rng)
             # Avoid overlap with asteroid belts, fields and planets
             overlapping = False
 
@@ -380,21 +521,26 @@ class SolarSystem:
             )
             return
 
-        rnd_name = data.generate_random_name(rnd_int(2, 4))
+        rnd_name = data.generate_random_name(rnd_int(2, 4, rng), rng)
         station_name = f"Station {rnd_name}"
         station_id = (
             self._count_all_stations()
             # Create the station and attach it to the star (as a parent) for hierarchy
         )
+        station_rng = derive_rng(self.seed, "station", station_id)
         if self.star:
             station = Station(
-                station_name, station_id, position, orbital_parent=self.star
+                station_name,
+                station_id,
+                position,
+                orbital_parent=self.star,
+                rng=station_rng,
             )
             self.star.add_station(station)
         else:
             # Fallback if no star exists (should not happen)
             print("Warning: Creating truly independent station because no star exists")
-            station = Station(station_name, station_id, position)
+            station = Station(station_name, station_id, position, rng=station_rng)
             # Since we don't have legacy collections anymore, this station will be truly independent
             # It won't be attached to any celestial body
 
@@ -407,17 +553,22 @@ class SolarSystem:
         return count
 
     def _calculate_orbital_position(
-        self, orbital_distance: float, angle: Optional[float] = None
+        self,
+        orbital_distance: float,
+        angle: Optional[float] = None,
+        rng: Optional[random.Random] = None,
     ) -> Vector2:
         """Calculate position based on orbital distance and angle"""
         if angle is None:
-            angle = random.uniform(0, 2 * math.pi)
+            angle = get_rng(rng).uniform(0, 2 * math.pi)
 
         x = orbital_distance * math.cos(angle)
         y = orbital_distance * math.sin(angle)
         return Vector2(round(x, 2), round(y, 2))
 
-    def _select_orbital_distance(self, used_distances: List[float]) -> float:
+    def _select_orbital_distance(
+        self, used_distances: List[float], rng: random.Random
+    ) -> float:
         """Select an orbital distance avoiding conflicts"""
         zones = [
             (0.3, 1.5),  # Inner rocky planets
@@ -428,7 +579,7 @@ class SolarSystem:
 
         for zone_inner, zone_outer in zones:
             for _ in range(20):  # Max attempts
-                distance = random.uniform(zone_inner, zone_outer)
+                distance = rng.uniform(zone_inner, zone_outer)
                 if all(abs(distance - used) > 0.8 for used in used_distances):
                     return distance
 
@@ -451,78 +602,114 @@ class SolarSystem:
                 return distance
         return 30.0 + len(used_distances)  # Emergency fallback
 
+    def get_catalogue(self) -> "SystemCatalogue":
+        """Return the catalogue of this system's objects, building it on first use."""
+        if self._catalogue is None:
+            self._catalogue = SystemCatalogue(self.celestial_bodies)
+        return self._catalogue
+
+    def invalidate_catalogue(self) -> None:
+        """
+        Drop the cached catalogue and spatial index. Call after adding or
+        removing bodies, stations or fields other than through the methods below.
+        """
+        self._catalogue = None
+        self._scan_cursor = None
+        self.invalidate_spatial_index()
+
+    def add_celestial_body(self, body: CelestialBody) -> None:
+        self.celestial_bodies.append(body)
+        self.invalidate_catalogue()
+
+    def remove_celestial_body(self, body: CelestialBody) -> None:
+        self.celestial_bodies.remove(body)
+        self.invalidate_catalogue()
+
+    def add_station(self, parent: CelestialBody, station: Station) -> None:
+        parent.add_station(station)
+        self.invalidate_catalogue()
+
+    def remove_station(self, station: Station) -> None:
+        for body in self.celestial_bodies:
+            if station in body.stations:
+                body.stations.remove(station)
+                break
+        self.invalidate_catalogue()
+
     def get_all_asteroid_fields(self) -> list[AsteroidField]:
         """Returns all asteroid fields in the system, gathered from AsteroidBelts."""
-        fields = []
-        for body in self.celestial_bodies:
-            if isinstance(body, AsteroidBelt):
-                fields.extend(body.asteroid_fields)
-        return fields
+        return list(self.get_catalogue().fields)
 
     def get_all_stations(self) -> list[Station]:
         """Returns all stations in the system."""
-        all_stations = []
-        for body in self.celestial_bodies:
-            if hasattr(body, "stations"):
-                all_stations.extend(body.stations)
-        return all_stations
+        return list(self.get_catalogue().stations)
 
     def get_all_space_objects(self) -> List[HasSpaceObjectType]:
         """Returns a list of all major space objects in the system for scanning etc."""
-        # This should include Stars, Planets, Moons, AsteroidBelt (as a whole),
-        # and Stations. Asteroid fields are accessed through their parent belts.
+        return list(self.get_catalogue().space_objects)
 
-        scan_list: List[HasSpaceObjectType] = []
+    def get_object_by_id(self, type_name: str, object_id: int) -> Optional[HasSpaceObjectType]:
+        """Look up a body, station or field by its type name and ID, e.g. ("Station", 3)."""
+        return self.get_catalogue().by_id.get((type_name, object_id))
 
-        # Add all celestial bodies
-        for body in self.celestial_bodies:
-            # Only append bodies that are explicitly part of HasSpaceObjectType
-            if isinstance(body, (Star, Planet, Moon, AsteroidBelt)):
-                scan_list.append(body)
+    def get_objects_by_type(self, object_type: type) -> List[HasSpaceObjectType]:
+        """All catalogued objects of exactly the given type (Star, Planet, Station, ...)."""
+        return list(self.get_catalogue().by_type.get(object_type, ()))
 
-            # Add all stations from this celestial body
-            if hasattr(body, "stations") and body.stations:
-                scan_list.extend(body.stations)
-
-        # NOTE: Asteroid fields are NOT added as separate scan targets
-        # They are accessible through their parent asteroid belts
-
-        # Remove duplicates if any were introduced
-        final_scan_list = []
-        seen_ids = set()
-        for obj in scan_list:
-            if hasattr(obj, "space_object") and hasattr(obj.space_object, "id"):
-                # Use a tuple of type and ID to ensure uniqueness across different object types with same ID
-                obj_unique_id = (type(obj).__name__, obj.space_object.id)
-                if obj_unique_id not in seen_ids:
-                    final_scan_list.append(obj)
-                    seen_ids.add(obj_unique_id)
-            else:
-                # If no space_object.id, add it directly (less robust for uniqueness)
-                if obj not in final_scan_list:
-                    final_scan_list.append(obj)
+    def get_spatial_index(self) -> SystemSpatialIndex:
+        """
+        Return the spatial index over this system's stations, fields and scan
+        targets, building it on first use.
+        """
+        if self._spatial_index is None:
+            catalogue = self.get_catalogue()
+            self._spatial_index = SystemSpatialIndex.build(
+                catalogue.stations,
+                catalogue.fields,
+                catalogue.space_objects,
+                cell_size=SPATIAL_INDEX_CELL_SIZE,
+            )
+        return self._spatial_index
 
-        return final_scan_list
+    def invalidate_spatial_index(self) -> None:
+        """Drop the spatial index after bodies, stations or fields were added or removed."""
+        self._spatial_index = None
+
+    def get_fields_near(self, position: Vector2, radius: float) -> List[AsteroidField]:
+        """Fields that may lie within radius of position; callers apply the exact test."""
+        return self.get_spatial_index().fields_near(position, radius)
+
+    def get_stations_near(self, position: Vector2, radius: float) -> List[Station]:
+        """Stations that may lie within radius of position; callers apply the exact test."""
+        return self.get_spatial_index().stations_near(position, radius)
+
+    def get_nearest_fields(self, position: Vector2, k: int = 1) -> List[AsteroidField]:
+        """The k fields closest to position, nearest first."""
+        return self.get_spatial_index().nearest_fields(position, k)
+
+    def get_nearest_stations(self, position: Vector2, k: int = 1) -> List[Station]:
+        """The k stations closest to position, nearest first."""
+        return self.get_spatial_index().nearest_stations(position, k)
 
     def is_object_at_position(self, position: Vector2) -> bool:
         # Check if the coordinates are occupied by an asteroid field or station
-        for space_object in self.get_all_space_objects():
+        for space_object in self.get_spatial_index().objects_at(position):
             if space_object.space_object.get_position() == position:
                 return True
 
         return False
 
     def is_object_within_an_asteroid_field_radius(self, object_position):
-        # Check against all fields from all belts
-        for field in self.get_all_asteroid_fields():
+        # Only fields registered in the cell of the position can contain it
+        for field in self.get_spatial_index().fields_at(object_position):
             distance = object_position.distance_to(field.space_object.position)
             if distance <= field.radius:
                 return True
         return False
 
     def get_field_by_position(self, position):
-        # Check against all fields from all belts
-        for field in self.get_all_asteroid_fields():
+        # Only fields registered in the cell of the position can contain it
+        for field in self.get_spatial_index().fields_at(position):
             if (
                 euclidean_distance(position, field.space_object.position)
                 <= field.radius
@@ -582,32 +769,54 @@ class SolarSystem:
         return sorted_objects
 
     def scan_system_objects(self, player_position, amount) -> List[HasSpaceObjectType]:
-        """Enhanced scanning that respects celestial hierarchy"""
-        all_objects = self.get_all_space_objects()
-
-        # Sort by distance and significance
-        def scan_priority(obj):
-            distance = euclidean_distance(
-                player_position, obj.space_object.position)
-
-            # Priority multipliers based on object type
-            if isinstance(obj, Star):
-                return distance * 0.1  # Stars are always visible
-            elif isinstance(obj, Planet):
-                return distance * 0.3  # Planets are highly visible
-            elif isinstance(obj, AsteroidBelt):
-                return distance * 0.7  # Belts are moderately visible
-            elif isinstance(obj, Moon):
-                return distance * 0.8  # Moons are less visible
-            else:
-                # Standard visibility (stations, asteroid fields)
-                return distance
+        """
+        Enhanced scanning that respects celestial hierarchy: the amount objects
+        with the lowest distance times visibility weight (see scan_weight).
+        Starts a new scan that scan_next_objects() continues.
+        """
+        self._scan_cursor = ScanCursor(self.get_catalogue(), player_position)
+        return self._scan_cursor.next(amount)
 
-        sorted_objects = sorted(all_objects, key=scan_priority)
-        return sorted_objects[: min(amount, len(sorted_objects))]
+    def scan_next_objects(
+        self, player_position, amount: Optional[int] = None
+    ) -> List[HasSpaceObjectType]:
+        """
+        Continue the last scan with the next amount objects (by default as many
+        as the previous batch, or DEFAULT_SCAN_BATCH_SIZE). Starts over if there
+        was no scan yet from this position.
+        """
+        cursor = self._scan_cursor
+        if (
+            cursor is None
+            or cursor.catalogue is not self._catalogue
+            or cursor.position != player_position
+        ):
+            return self.scan_system_objects(
+                player_position, amount if amount is not None else DEFAULT_SCAN_BATCH_SIZE
+            )
+        if amount is None:
+            amount = cursor.batch_size or DEFAULT_SCAN_BATCH_SIZE
+        return cursor.next(amount)
+
+    def get_last_scan(self) -> Optional[ScanCursor]:
+        return self._scan_cursor
+
+    def get_space_objects_by_distance(self, position: Vector2) -> List[HasSpaceObjectType]:
+        """All scan targets ordered by their exact distance to position."""
+        catalogue = self.get_catalogue()
+        px, py = position.x, position.y
+        order = sorted(
+            range(len(catalogue.space_objects)),
+            key=lambda index: math.sqrt(
+                (catalogue.xs[index] - px) ** 2 + (catalogue.ys[index] - py) ** 2
+            ),
+        )
+        return [catalogue.space_objects[index] for index in order]
 
     def is_object_within_interaction_radius(self, player_ship):
-        for station in self.get_all_stations():
+        for station in self.get_stations_near(
+            player_ship.space_object.get_position(), player_ship.interaction_radius
+        ):
             if (
                 euclidean_distance(
                     player_ship.space_object.get_position(),
@@ -619,7 +828,9 @@ class SolarSystem:
         return False
 
     def get_object_within_interaction_radius(self, player_ship):
-        for station in self.get_all_stations():
+        for station in self.get_stations_near(
+            player_ship.space_object.get_position(), player_ship.interaction_radius
+        ):
             if (
                 euclidean_distance(
                     player_ship.space_object.get_position(),
@@ -706,6 +917,7 @@ class SolarSystem:
                 solar_system.star = star
                 solar_system.celestial_bodies.append(star)
 
+        solar_system.invalidate_catalogue()
         return solar_system
         # Migration methods removed as they are no longer needed
 
@@ -1,4 +1,4 @@
-from pygame import Vector2
+from src.helpers import Vector2
 
 
 class IsSpaceObject:
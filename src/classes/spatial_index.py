@@ -0,0 +1,167 @@
+"""
+Uniform-grid spatial index used for position queries inside a solar system.
+
+Objects are bucketed into square cells. An object with an extent (e.g. an
+asteroid field's radius) is registered in every cell its extent overlaps, so
+point-in-radius lookups only have to look at the cell containing the point.
+Queries return candidates in insertion order; callers apply their own exact
+distance test, which keeps "first match" semantics identical to a linear scan.
+"""
+
+import heapq
+import math
+from typing import Dict, Generic, Iterable, List, Tuple, TypeVar
+
+from src.helpers import Vector2
+
+T = TypeVar("T")
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid(Generic[T]):
+    def __init__(self, cell_size: float = 1.0) -> None:
+        self.cell_size = cell_size
+        self.items: List[Tuple[T, float, float]] = []
+        self.cells: Dict[Cell, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _cell(self, x: float, y: float) -> Cell:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, item: T, position: Vector2, extent: float = 0.0) -> None:
+        """Add item at position, reachable from every cell within extent of it."""
+        order = len(self.items)
+        x, y = position.x, position.y
+        self.items.append((item, x, y))
+        min_cx, min_cy = self._cell(x - extent, y - extent)
+        max_cx, max_cy = self._cell(x + extent, y + extent)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                self.cells.setdefault((cx, cy), []).append(order)
+
+    def _items(self, orders: Iterable[int]) -> List[T]:
+        return [self.items[order][0] for order in sorted(set(orders))]
+
+    def candidates_at(self, position: Vector2) -> List[T]:
+        """Items whose extent may contain position, in insertion order."""
+        return self._items(self.cells.get(self._cell(position.x, position.y), ()))
+
+    def candidates_near(self, position: Vector2, radius: float) -> List[T]:
+        """Items that may lie within radius of position, in insertion order."""
+        min_cx, min_cy = self._cell(position.x - radius, position.y - radius)
+        max_cx, max_cy = self._cell(position.x + radius, position.y + radius)
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.cells):
+            # The query box covers more cells than are occupied, check those instead
+            orders = [
+                order
+                for (cx, cy), bucket in self.cells.items()
+                if min_cx <= cx <= max_cx and min_cy <= cy <= max_cy
+                for order in bucket
+            ]
+        else:
+            orders = [
+                order
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+                for order in self.cells.get((cx, cy), ())
+            ]
+        return self._items(orders)
+
+    def nearest(self, position: Vector2, k: int = 1) -> List[T]:
+        """
+        The k items closest to position, nearest first.
+
+        Ties are broken by insertion order, as a stable sort would. Searches
+        rings of cells outwards from position and stops once no unvisited cell
+        can hold anything closer; on sparse grids where the rings would cover
+        more cells than are occupied it ranks all items directly.
+        """
+        if k <= 0 or not self.items:
+            return []
+        k = min(k, len(self.items))
+        x, y = position.x, position.y
+        cx, cy = self._cell(x, y)
+
+        def key(order: int) -> Tuple[float, int]:
+            _, item_x, item_y = self.items[order]
+            dx = item_x - x
+            dy = item_y - y
+            return (math.sqrt(dx * dx + dy * dy), order)
+
+        seen: set = set()
+        ring = 0
+        while (2 * ring + 1) ** 2 <= len(self.cells):
+            for ring_cell in self._ring(cx, cy, ring):
+                seen.update(self.cells.get(ring_cell, ()))
+            # Anything outside the searched rings is at least this far away
+            reach = ring * self.cell_size
+            if len(seen) >= k:
+                best = heapq.nsmallest(k, seen, key=key)
+                if key(best[-1])[0] <= reach:
+                    return [self.items[order][0] for order in best]
+            ring += 1
+        best = heapq.nsmallest(k, range(len(self.items)), key=key)
+        return [self.items[order][0] for order in best]
+
+    @staticmethod
+    def _ring(cx: int, cy: int, ring: int) -> Iterable[Cell]:
+        if ring == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-ring, ring + 1):
+            yield (cx + dx, cy - ring)
+            yield (cx + dx, cy + ring)
+        for dy in range(-ring + 1, ring):
+            yield (cx - ring, cy + dy)
+            yield (cx + ring, cy + dy)
+
+
+class SystemSpatialIndex:
+    """Spatial grids over the stations, asteroid fields and scan targets of a system."""
+
+    def __init__(self, cell_size: float, margin: float) -> None:
+        self.margin = margin
+        self.stations: SpatialGrid = SpatialGrid(cell_size)
+        self.fields: SpatialGrid = SpatialGrid(cell_size)
+        self.objects: SpatialGrid = SpatialGrid(cell_size)
+
+    @classmethod
+    def build(
+        cls, stations: Iterable, fields: Iterable, objects: Iterable,
+        cell_size: float = 1.0, margin: float = 0.01,
+    ) -> "SystemSpatialIndex":
+        """
+        Index the given objects by their space_object position. Fields are
+        registered with their radius plus margin, so that tests against rounded
+        distances still find them.
+        """
+        index = cls(cell_size, margin)
+        for station in stations:
+            index.stations.insert(station, station.space_object.position)
+        for field in fields:
+            index.fields.insert(field, field.space_object.position, field.radius + margin)
+        for obj in objects:
+            index.objects.insert(obj, obj.space_object.position)
+        return index
+
+    def stations_near(self, position: Vector2, radius: float) -> List:
+        return self.stations.candidates_near(position, radius + self.margin)
+
+    def fields_at(self, position: Vector2) -> List:
+        return self.fields.candidates_at(position)
+
+    def fields_near(self, position: Vector2, radius: float) -> List:
+        return self.fields.candidates_near(position, radius + self.margin)
+
+    def objects_at(self, position: Vector2) -> List:
+        return self.objects.candidates_at(position)
+
+    def nearest_stations(self, position: Vector2, k: int = 1) -> List:
+        return self.stations.nearest(position, k)
+
+    def nearest_fields(self, position: Vector2, k: int = 1) -> List:
+        return self.fields.nearest(position, k)
+
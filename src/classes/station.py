@@ -1,8 +1,9 @@
+import random
 from typing import Optional, TYPE_CHECKING
 from src import helpers
 from src.classes.ore import Ore
 from src.data import OreCargo
-from src.helpers import take_input, rnd_float, rnd_int
+from src.helpers import get_rng, take_input, rnd_float, rnd_int
 
 if TYPE_CHECKING:
     from src.classes.celestial_body import CelestialBody
@@ -15,19 +16,20 @@ class Station:
         station_id,
         position,
         orbital_parent: Optional["CelestialBody"] = None,
+        rng: Optional[random.Random] = None,
     ) -> None:
         from src.classes.ship import IsSpaceObject
 
         self.name: str = name
         self.space_object = IsSpaceObject(position, station_id)
         self.orbital_parent: Optional["CelestialBody"] = orbital_parent
-        self.fuel_tank_capacity: float = helpers.rnd_float(5_000, 20_000)
-        self.fuel_tank: float = self.fuel_tank_capacity / helpers.rnd_int(1, 4)
-        self.fuel_price: float = helpers.rnd_float(8, 20)
+        self.fuel_tank_capacity: float = helpers.rnd_float(5_000, 20_000, rng)
+        self.fuel_tank: float = self.fuel_tank_capacity / helpers.rnd_int(1, 4, rng)
+        self.fuel_price: float = helpers.rnd_float(8, 20, rng)
         self.ores_available: list[Ore] = []
         self.ore_cargo: list[OreCargo] = []
         self.ore_cargo_volume: float = 0.0
-        self.ore_capacity: float = helpers.rnd_float(25_000, 75_000)
+        self.ore_capacity: float = helpers.rnd_float(25_000, 75_000, rng)
         self.visited: bool = False
 
         # For serialization - store celestial body parent info
@@ -41,8 +43,8 @@ class Station:
             self.orbital_parent_name = orbital_parent.name
 
         self.generate_ores_availability()
-        self.generate_ore_cargo_instances()
-        self.generate_ore_cargo()
+        self.generate_ore_cargo_instances(rng)
+        self.generate_ore_cargo(rng)
 
     @property
     def position(self):
@@ -71,29 +73,27 @@ class Station:
 
         self.ores_available = list(ORES.values())
 
-    def generate_ore_cargo_instances(self) -> None:
+    def generate_ore_cargo_instances(self, rng: Optional[random.Random] = None) -> None:
         # Create OreCargo instances for all available ores, with randomized prices
-        from src.helpers import rnd_float
-
         self.ore_cargo = []
         for ore in self.ores_available:
             ore_quantity: int = 0  # Will be set in generate_ore_cargo
             ore_buy_price: float = round(
-                ore.base_value * rnd_float(0.75, 1.25), 2)
+                ore.base_value * rnd_float(0.75, 1.25, rng), 2)
             ore_sell_price: float = round(
-                ore_buy_price * rnd_float(0.5, 1.0), 2)
+                ore_buy_price * rnd_float(0.5, 1.0, rng), 2)
             ore_cargo = OreCargo(
                 ore, ore_quantity, ore_buy_price, ore_sell_price)
             self.ore_cargo.append(ore_cargo)
 
-    def generate_ore_cargo(self):
+    def generate_ore_cargo(self, rng: Optional[random.Random] = None):
         # Assign a random quantity to each ore type, respecting ore capacity
         # All stations will have all products but with varied quantities
-        import random
+        rng = get_rng(rng)
 
         self.ore_cargo_volume = 0.0
         # More generous allocation        # First pass - ensure every ore has at least some quantity
-        max_total_volume = self.ore_capacity / rnd_int(1, 3)
+        max_total_volume = self.ore_capacity / rnd_int(1, 3, rng)
         min_qty_per_ore = 5  # Minimum quantity of each ore type
 
         for ore_cargo in self.ore_cargo:
@@ -121,9 +121,9 @@ class Station:
 
             # Generate a random quantity, but avoid using all remaining volume on one ore
             max_for_this_ore = min(
-                max_quantity, 1000, int(max_quantity * random.random() * 0.8)
+                max_quantity, 1000, int(max_quantity * rng.random() * 0.8)
             )
-            additional_quantity = random.randint(0, max_for_this_ore)
+            additional_quantity = rng.randint(0, max_for_this_ore)
             # Update quantity and remaining volume
             ore_cargo.quantity += additional_quantity
             remaining_volume -= ore_cargo.ore.volume * additional_quantity
@@ -257,7 +257,7 @@ class Station:
     @classmethod
     def from_dict(cls, data):
         from src.classes.ship import IsSpaceObject  # Local import
-        from pygame import Vector2
+        from src.helpers import Vector2
         from src.data import OreCargo  # Ensure OreCargo is imported for from_dict
 
         station = cls(
@@ -43,6 +43,7 @@ from .character import display_character_sheet
 from .appearance import color_command, reset_command
 from .sound import toggle_sound_command
 from .banking import banking_menu_command
+from .wait import wait_command
 
 # Export the global command registry
 commands = command_registry
@@ -94,4 +95,5 @@ __all__ = [
     "compare_prices_command",
     "find_best_trade_routes",
     "game_reset_command",
+    "wait_command",
 ]
@@ -4,6 +4,7 @@ from datetime import datetime
 
 from colorama import Fore, Style
 from src.classes.game import Game
+from src.classes.interest import InterestAccrual
 from src.helpers import is_valid_float
 
 from .base import register_command
@@ -12,13 +13,20 @@ from .base import register_command
 class BankingTransaction:
     """Class to track banking transactions"""
 
-    def __init__(self, transaction_type: str, amount: float, description: str = ""):
+    def __init__(
+        self,
+        transaction_type: str,
+        amount: float,
+        description: str = "",
+        accrual: Optional[InterestAccrual] = None,
+    ):
         self.timestamp = datetime.now()
         self.transaction_type = (
             transaction_type  # "deposit", "withdraw", "loan", "repayment", "interest"
         )
         self.amount = amount
         self.description = description
+        self.accrual = accrual  # The compounding behind an "interest" transaction
 
     def to_string(self) -> str:
         """Format the transaction as a string"""
@@ -406,11 +414,41 @@ def view_transaction_history(game_state: Game, character) -> None:
             else:
                 game_state.ui.info_message(transaction_str)
 
+            if getattr(transaction, "accrual", None) is not None:
+                display_interest_statements(game_state, transaction.accrual)
+
+    debt_accruals = getattr(character, "debt_interest_accruals", [])
+    if debt_accruals:
+        game_state.ui.info_message(
+            f"\n{Fore.CYAN}Debt Interest Charges:{Style.RESET_ALL}")
+        for accrual in reversed(debt_accruals):
+            game_state.ui.warn_message(
+                f"{accrual.total_interest:.2f} credits over {accrual.periods} day(s) "
+                f"at {accrual.rate:.2%}/day"
+            )
+            display_interest_statements(game_state, accrual)
+
     input(Fore.YELLOW + "\nPress Enter to return to banking menu..." + Style.RESET_ALL)
 
 
 # Helper functions
 
+# Number of per-period statements listed under each interest entry
+STATEMENT_PERIODS_SHOWN = 3
+
+
+def display_interest_statements(game_state: Game, accrual: InterestAccrual) -> None:
+    """List the last few compounding periods of an accrual, newest first."""
+    first = max(1, accrual.periods - STATEMENT_PERIODS_SHOWN + 1)
+    statements = list(accrual.statements(first))
+    for statement in reversed(statements):
+        game_state.ui.info_message(
+            f"    period {statement.period:>6} | {statement.opening_balance:10.2f} "
+            f"+ {statement.interest:8.2f} = {statement.closing_balance:10.2f}"
+        )
+    if first > 1:
+        game_state.ui.info_message(f"    ... {first - 1} earlier period(s)")
+
 
 def repay_debt(game_state: Game, character, amount: float) -> None:
     """Process debt repayment."""
@@ -743,39 +781,39 @@ def get_valid_amount(
 
 
 def calculate_savings_interest(
-    game_state: Game, character
+    game_state: Game, character, current_time: int
 ) -> Optional[tuple[float, float]]:
-    """Calculate and apply interest to savings account."""
-    if not hasattr(character, "last_savings_interest_time"):
-        character.last_savings_interest_time = game_state.global_time
-        return None
+    """Calculate and apply interest to savings account.
 
+    current_time is in hours, like Character.calculate_debt_interest.
+    """
     # Define a week as 168 hours (7 days * 24 hours)
     WEEK_LENGTH = 168
 
     # Check if a week has passed since last interest calculation
     weeks_passed = (
-        game_state.global_time - character.last_savings_interest_time
+        current_time - character.last_savings_interest_time
     ) // WEEK_LENGTH
 
     if weeks_passed >= 1:
-        # Apply interest for each week passed
-        total_interest = 0.0
-        current_savings = character.savings
-
-        for _ in range(weeks_passed):
-            interest = current_savings * character.savings_interest_rate
-            current_savings += interest
-            total_interest += interest
+        accrual = InterestAccrual(
+            principal=character.savings,
+            rate=character.savings_interest_rate,
+            periods=int(weeks_passed),
+            start_time=character.last_savings_interest_time,
+            period_length=WEEK_LENGTH,
+        )
+        current_savings = accrual.final_balance
+        total_interest = accrual.total_interest
 
         # Update savings and last interest time
         character.savings = character.round_credits(current_savings)
-        character.last_savings_interest_time = game_state.global_time
+        character.last_savings_interest_time += weeks_passed * WEEK_LENGTH
 
         # Record the transaction
         if total_interest > 0:
             transaction = BankingTransaction(
-                "interest", total_interest, "Savings interest payment"
+                "interest", total_interest, "Savings interest payment", accrual
             )
             if not hasattr(character, "bank_transactions"):
                 character.bank_transactions = []
@@ -1,7 +1,6 @@
 from src.classes.game import Game
 from src.classes.solar_system import SolarSystem
 from src.classes.station import Station
-from src.helpers import get_closest_station
 from src.events.skill_events import (
     process_skill_xp_from_activity,
     notify_skill_progress,
@@ -24,7 +23,9 @@ def command_dock(game_state: Game) -> None:
         # Check if player is already at a station (i.e., position matches very closely)
     )
     current_station_at_loc = None
-    for station_obj in current_system.get_all_stations():
+    for station_obj in current_system.get_stations_near(
+        player_ship.space_object.position, 0.001
+    ):
         if (
             station_obj.space_object.position.distance_to(
                 player_ship.space_object.position
@@ -37,12 +38,14 @@ def command_dock(game_state: Game) -> None:
     target_station = current_station_at_loc
 
     if target_station is None:  # If not exactly at a station, find the closest one
-        stations = current_system.get_all_stations()
+        stations = current_system.get_nearest_stations(
+            player_ship.space_object.position
+        )
         if not stations:  # Check if there are any stations in the current system
             game_state.ui.error_message(
                 "There are no stations in the current system.")
             return
-        target_station = get_closest_station(stations, player_ship)
+        target_station = stations[0]
 
     if target_station is None:
         game_state.ui.error_message(
@@ -1,4 +1,4 @@
-from pygame import Vector2
+from src.helpers import Vector2
 from colorama import Fore, Style
 from src.classes.game import Game
 from .registry import Argument
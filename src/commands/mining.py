@@ -49,7 +49,7 @@ def mine_command(
         notify_skill_progress(game_state, skill_results)
 
         # Calculate debt interest
-        interest_result = game_state.player_character.calculate_debt_interest(
+        interest_result = game_state.player_character.collect_debt_interest(
             int(
                 game_state.global_time / 3600
             )  # Convert seconds to hours and cast to int
@@ -88,8 +88,8 @@ def refine_command(game_state: Game, amount: Optional[str] = None) -> None:
     if refine_all and target_ore:
         # Find all cargo of the specified ore type that can be refined
         target_cargo = [
-            cargo for cargo in refinable_cargo 
-            if cargo.item.commodity.commodity_id == target_ore.commodity.commodity_id
+            cargo for cargo in player_ship.get_cargo_by_name(target_ore.name)
+            if isinstance(cargo.item, Ore) and cargo.item.can_refine()
         ]
         
         if not target_cargo:
@@ -189,10 +189,8 @@ def refine_command(game_state: Game, amount: Optional[str] = None) -> None:
             return
         
         # Process all refining operations
-        for op in refining_operations:
-            cargo = op['cargo']
-            refine_amount = cast(int, op['amount'])
-            _refine_specific_cargo(game_state, cargo, refine_amount, show_summary=False)
+        if not _refine_all_cargo(game_state, refining_operations):
+            return
         
         game_state.ui.success_message(
             f"Successfully refined all available ore for {total_cost} credits."
@@ -275,6 +273,76 @@ def refine_command(game_state: Game, amount: Optional[str] = None) -> None:
         return
 
 
+def _refine_all_cargo(game_state: Game, refining_operations: list[Dict[str, Any]]) -> bool:
+    """
+    Refine every stack in refining_operations, taking all of the ore out of
+    the hold in one batch.
+
+    Returns:
+        bool: False if the ore could not be removed; nothing is refined then
+    """
+    player_ship = game_state.get_player_ship()
+    player_character = game_state.get_player_character()
+
+    if not player_ship or not player_character:
+        return False
+
+    total_cost = round(sum(op['cost'] for op in refining_operations), 2)
+    player_character.remove_credits(total_cost)
+
+    remove_result = player_ship.remove_cargo_many(
+        [(op['cargo'].item_id, cast(int, op['amount'])) for op in refining_operations]
+    )
+    if remove_result.is_err():
+        error = remove_result.unwrap_err()
+        if error.error_type == CargoError.ITEM_NOT_FOUND:
+            game_state.ui.error_message(f"Ore not found in cargo: {error.message}")
+        elif error.error_type == CargoError.INVALID_QUANTITY:
+            game_state.ui.error_message(f"Invalid quantity for refining: {error.message}")
+            if error.context:
+                game_state.ui.error_message(f"Requested: {error.context.get('requested', 'unknown')}, Available: {error.context.get('available', 'unknown')}")
+        else:
+            game_state.ui.error_message(f"Failed to remove ore from cargo: {error.message}")
+        # Refund the credits since the operation failed
+        player_character.add_credits(total_cost)
+        return False
+
+    for op, removed_cargo in zip(refining_operations, remove_result.unwrap()):
+        ore_item = cast(Ore, removed_cargo.item)
+        refined_ore = cast(Ore, op['refined_ore'])
+        amount = removed_cargo.quantity
+
+        add_result = player_ship.add_cargo(
+            refined_ore,
+            amount,
+            removed_cargo.buy_price,  # Keep original buy price
+            refined_ore.get_value() * 1.1  # Set sell price slightly above market value
+        )
+        if add_result.is_err():
+            error = add_result.unwrap_err()
+            game_state.ui.error_message(
+                f"Failed to add refined {ore_item.name} to cargo: {error.message}"
+            )
+            # Put this stack back and refund its share of the cost
+            restore_result = player_ship.add_cargo(
+                ore_item,
+                amount,
+                removed_cargo.buy_price,
+                removed_cargo.sell_price
+            )
+            if restore_result.is_err():
+                game_state.ui.error_message("Critical error: Failed to restore original ore after refining failure!")
+            player_character.add_credits(op['cost'])
+            continue
+
+        skill_results = process_skill_xp_from_activity(
+            game_state, "Refining & Processing", amount
+        )
+        notify_skill_progress(game_state, skill_results)
+
+    return True
+
+
 def _refine_specific_cargo(game_state: Game, selected_cargo, amount: int, show_summary: bool = True) -> None:
     player_ship = game_state.get_player_ship()
     player_character = game_state.get_player_character()
@@ -631,7 +699,7 @@ def refine_to_minerals_command(game_state: Game, amount: Optional[str] = None) -
             ):  # Check if we already have this mineral in inventory
                 # Check if we already have this mineral using the unified cargo system
                 existing_mineral_cargo = None
-                mineral_items = player_ship.get_cargo_by_type(Mineral)
+                mineral_items = player_ship.cargo_hold.get_items_by_id(str(mineral_id))
                 
                 for cargo_item in mineral_items:
                     # Type guard to ensure we have a Mineral
@@ -36,11 +36,8 @@ def scan_command(game_state: Game, num_objects: str) -> None:
             return
 
         # Sort objects by distance for organized display
-        sorted_objects = sorted(
-            all_objects,
-            key=lambda obj: obj.space_object.position.distance_to(
-                player_ship.space_object.position
-            ),
+        sorted_objects = solar_system.get_space_objects_by_distance(
+            player_ship.space_object.position
         )
 
         game_state.ui.info_message(
@@ -66,13 +63,38 @@ def scan_command(game_state: Game, num_objects: str) -> None:
 
         game_state.ui.info_message("=" * 50)
         objects = sorted_objects  # Use all objects for selection
+    elif num_objects.lower() in ("next", "n"):
+        # Continue the previous scan without re-ranking the whole system
+        solar_system = game_state.get_current_solar_system()
+        last_scan = solar_system.get_last_scan()
+        if last_scan is None or last_scan.position != player_ship.space_object.get_position():
+            game_state.ui.error_message(
+                "No scan to continue from this position. Use 'scan <number>' first."
+            )
+            return
+
+        amount_of_objects = last_scan.batch_size
+        first_index = last_scan.returned
+        objects = solar_system.scan_next_objects(
+            player_ship.space_object.get_position(), amount_of_objects
+        )
+        if not objects:
+            game_state.ui.warn_message("No further objects detected.")
+            return
+
+        game_state.ui.info_message("Sensor detected the following objects:")
+        for i, obj in enumerate(objects):
+            game_state.ui.info_message(
+                f"{i}. {obj.to_string_short(player_ship.space_object.get_position())}"
+                f" (#{first_index + i + 1})"
+            )
     else:
         # Standard scan with limitations
         try:
             amount_of_objects: int = int(num_objects)
         except ValueError:
             game_state.ui.error_message(
-                "Invalid input. Please enter a number or 'all'."
+                "Invalid input. Please enter a number, 'next' or 'all'."
             )
             return
 
@@ -95,7 +117,9 @@ def scan_command(game_state: Game, num_objects: str) -> None:
             game_state.ui.info_message(
                 f"{i}. {objects[i].to_string_short(player_ship.space_object.get_position())}"
             )  # Process skill experience from scanning
-    if game_state.player_character:
+    # Paging through a scan with 'next' is not a new scan, so it earns no XP
+    is_new_scan = num_objects.lower() not in ("next", "n")
+    if game_state.player_character and is_new_scan:
         # Scanning gives education and engineering XP
         # For 'all' scans, use a higher difficulty based on total objects found
         if num_objects.lower() == "all":
@@ -103,7 +127,7 @@ def scan_command(game_state: Game, num_objects: str) -> None:
             difficulty = min(3.0, len(objects) / 10)
         else:
             # Standard scan difficulty
-            difficulty = min(2.0, int(num_objects) / 5)
+            difficulty = min(2.0, amount_of_objects / 5)
 
         skill_results = process_skill_xp_from_activity(
             game_state,
@@ -95,7 +95,7 @@ def display_status(game_state: Game) -> None:
     # --- FINANCIAL STATUS ---
     if game_state.player_character:
         # Check for debt interest first
-        interest_result = game_state.player_character.calculate_debt_interest(
+        interest_result = game_state.player_character.collect_debt_interest(
             int(game_state.global_time / 3600)
         )
         if interest_result:
@@ -358,7 +358,9 @@ def display_help(game_state: Game, command_name: str = "") -> None:
             True,
             "field",
         )
-        write_command("scan/sc", "Scan for objects in the system", True)
+        write_command(
+            "scan/sc <amount|next|all>", "Scan for objects in the system", True
+        )
         write_command(
             "scan_asteroids/scna", "Scan current asteroid field for ores", True, "field"
         )
@@ -460,6 +462,7 @@ def display_help(game_state: Game, command_name: str = "") -> None:
             f"{Fore.CYAN}=== SYSTEM & UI ==={Style.RESET_ALL}")
         write_command("status", "Display ship and game status", True)
         write_command("time", "Display current game time", True)
+        write_command("wait/w <duration>", "Let time pass, e.g. 6h, 3d or 1y", True)
         write_command("clear", "Clear the screen", True)
         write_command("save [filename]", "Save current game state", True)
         write_command("load [filename]", "Load saved game state", True)
@@ -13,7 +13,16 @@ from src.classes.component import Component
 from src.classes.finished_good import FinishedGood
 from src.helpers import take_input
 from .base import register_command
-from .trading import buy_command, sell_command, _calculate_price_modifiers
+from .trading import (
+    buy_command,
+    _apply_charismatic_trait_message,
+    _apply_forgetful_trait,
+    _apply_superstitious_trait,
+    _calculate_price_modifiers,
+    _process_trading_skill_xp,
+    _show_price_adjustment_message,
+    _validate_docking_status,
+)
 from .cargo import cargo_command
 from .market import market_command
 from .price_compare import compare_prices_command, find_best_trade_routes
@@ -913,55 +922,71 @@ def _process_item_sale(game_state: Game, cargo_item) -> None:
 
 def _sell_all_cargo(game_state: Game) -> None:
     """Sell all items in cargo hold."""
-    player_ship = game_state.get_player_ship()
+    docking_result = _validate_docking_status(game_state)
+    if not docking_result:
+        return
+    player_ship, station = docking_result
+
+    player_character = game_state.get_player_character()
+    if player_character is None:
+        game_state.ui.error_message("Player character not found.")
+        return
 
     all_cargo = player_ship.get_all_cargo()
     if not all_cargo:
         game_state.ui.error_message("No cargo to sell.")
         return
 
-    total_estimated_value: float = 0.0
-    for cargo in all_cargo:
-        base_price = _get_item_base_price(cargo.item)
-        estimated_price = _calculate_modified_sell_price(
-            game_state, base_price)
-        total_estimated_value += estimated_price * cargo.quantity
+    # One price modifier for the whole hold, so traits roll once per sale
+    price_modifier = _calculate_price_modifiers(player_character, is_buying=False)
+    price_modifier = _apply_superstitious_trait(
+        game_state, player_character, price_modifier, is_buying=False)
+    _show_price_adjustment_message(game_state, price_modifier, is_buying=False)
+
+    # Priced like sell_command, from each stack's own value
+    total_value = round(sum(
+        (cargo.item.get_value() if hasattr(cargo.item, 'get_value') else cargo.item.base_value)
+        * cargo.quantity
+        for cargo in all_cargo
+    ) * price_modifier, 2)
 
     game_state.ui.info_message(
-        f"\nEstimated total value of all cargo: {total_estimated_value:.2f} credits"
+        f"\nTotal value of all cargo: {total_value:.2f} credits"
     )
     confirm = take_input(
         f"{Fore.YELLOW}Sell all cargo? (y/n): {Style.RESET_ALL}")
 
-    if confirm.lower() == "y":
-        # Sell each item
-        items_sold = 0
-        while player_ship.get_all_cargo() and items_sold < 50:  # Safety limit
-            # Mock inputs for sell command
-            original_take_input = take_input
-            # Always select first item, sell all quantity
-            responses = ["1", "all"]
-            response_iter = iter(responses)
-
-            def mock_input(prompt):
-                try:
-                    return next(response_iter)
-                except StopIteration:
-                    return original_take_input(prompt)
-
-            import src.helpers
-
-            src.helpers.take_input = mock_input
-
-            try:
-                sell_command(game_state)
-                items_sold += 1
-            finally:
-                src.helpers.take_input = original_take_input
-
-        game_state.ui.success_message("All cargo sold successfully!")
-    else:
+    if confirm.lower() != "y":
         game_state.ui.info_message("Sale cancelled.")
+        return
+
+    # Take every stack in one batch; on error the hold is left unchanged
+    remove_result = player_ship.remove_cargo_many(
+        [(cargo.item_id, cargo.quantity) for cargo in all_cargo]
+    )
+    if remove_result.is_err():
+        error = remove_result.unwrap_err()
+        if error.error_type == CargoError.ITEM_NOT_FOUND:
+            game_state.ui.error_message(f"Item not found in cargo: {error.message}")
+        elif error.error_type == CargoError.INVALID_QUANTITY:
+            game_state.ui.error_message(f"Invalid quantity: {error.message}")
+        else:
+            game_state.ui.error_message(f"Failed to sell items: {error.message}")
+        return
+
+    _apply_charismatic_trait_message(
+        game_state, player_character, False, price_modifier, is_buying=False)
+    final_price = _apply_forgetful_trait(game_state, player_character, total_value)
+
+    player_character.add_credits(final_price)
+    _process_trading_skill_xp(game_state, final_price)
+
+    for removed_item in remove_result.unwrap():
+        station.add_item(removed_item.item, removed_item.quantity)
+
+    game_state.ui.success_message(
+        f"Sold {len(all_cargo)} stacks of cargo for {final_price:.2f} credits!"
+    )
 
 
 def _buy_all_affordable(game_state: Game, available_items) -> None:
@@ -1,13 +1,10 @@
-from pygame import Vector2
-
 from src.classes.game import Game  # Ensure this is the updated Game class
 from src.classes.solar_system import (
     SolarSystem,
 )  # Import SolarSystem for type hinting if needed
 from src.helpers import (
-    get_closest_field,
-    get_closest_station,
     format_seconds,
+    Vector2,
 )
 from .registry import Argument
 from .base import register_command
@@ -57,11 +54,11 @@ def travel_command(game_state: Game, **kwargs) -> float:
 
     player_ship.consume_fuel(fuel_consumed)
     player_ship.space_object.position = destination
-    game_state.global_time += round(travel_time)
+    game_state.advance_time(round(travel_time))
 
     # Check for debt interest after time has passed
     if game_state.player_character:
-        interest_result = game_state.player_character.calculate_debt_interest(
+        interest_result = game_state.player_character.collect_debt_interest(
             int(game_state.global_time / 3600)
         )
         if interest_result:
@@ -96,10 +93,11 @@ def closest_travel(game_state: Game, object_type: str) -> None:
     current_system: SolarSystem = game_state.get_current_solar_system()
 
     if object_type.lower() == "field":
-        closest_field = get_closest_field(
-            current_system.get_all_asteroid_fields(), player_ship.space_object.position
+        closest_fields = current_system.get_nearest_fields(
+            player_ship.space_object.position
         )
-        if closest_field:
+        if closest_fields:
+            closest_field = closest_fields[0]
             travel_command(
                 game_state,
                 destination_x=str(closest_field.space_object.position.x),
@@ -109,10 +107,11 @@ def closest_travel(game_state: Game, object_type: str) -> None:
             game_state.ui.error_message("No asteroid fields found.")
 
     elif object_type.lower() == "station":
-        closest_station = get_closest_station(
-            current_system.get_all_stations(), player_ship
+        closest_stations = current_system.get_nearest_stations(
+            player_ship.space_object.position
         )
-        if closest_station:
+        if closest_stations:
+            closest_station = closest_stations[0]
             travel_command(
                 game_state,
                 destination_x=str(closest_station.space_object.position.x),
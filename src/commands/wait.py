@@ -0,0 +1,77 @@
+import re
+from typing import Optional
+
+from src.classes.game import Game
+from src.helpers import format_seconds
+
+from .base import register_command
+from .registry import Argument
+
+# Seconds per unit suffix accepted by wait, e.g. "90m", "3d" or "1y"
+DURATION_UNITS = {
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 7 * 86400,
+    "y": 365 * 86400,
+}
+
+DURATION_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhdwy]?)\s*$", re.IGNORECASE)
+
+
+def parse_duration(text: str) -> Optional[int]:
+    """Parse "<number>[s|m|h|d|w|y]" into whole seconds; a bare number is seconds."""
+    match = DURATION_PATTERN.match(text)
+    if match is None:
+        return None
+    amount, unit = match.groups()
+    return int(float(amount) * DURATION_UNITS[unit.lower() or "s"])
+
+
+def wait_command(game_state: Game, duration: str) -> None:
+    """Let time pass, e.g. 'wait 6h' or 'wait 1y' (units: s, m, h, d, w, y)."""
+    seconds = parse_duration(duration)
+    if seconds is None or seconds <= 0:
+        game_state.ui.error_message(
+            "Invalid duration. Use a number with an optional unit, e.g. 30m, 6h, 3d or 1y."
+        )
+        return
+
+    # Interest and other scheduled effects catch up in advance_time
+    game_state.advance_time(seconds)
+    game_state.ui.info_message(f"You wait for {format_seconds(seconds)}.")
+
+    player_ship = game_state.get_player_ship()
+    if player_ship.antimatter > 0:
+        containment_ok, risk = player_ship.check_containment_status(game_state)
+        if not containment_ok:
+            game_state.ui.error_message(
+                f"Antimatter containment is unstable ({risk:.1f}% failure risk)!"
+            )
+        elif risk >= 10.0:
+            game_state.ui.warn_message(
+                f"Antimatter containment failure risk has risen to {risk:.1f}%."
+            )
+
+    character = game_state.player_character
+    if character:
+        interest_result = character.collect_debt_interest(
+            int(game_state.global_time / 3600)
+        )
+        if interest_result:
+            interest_amount, new_debt = interest_result
+            game_state.ui.warn_message("\n⚠️ DEBT ALERT! ⚠️")
+            game_state.ui.warn_message(
+                f"While you waited, {interest_amount:.2f} credits of interest has accumulated on your debt!"
+            )
+            game_state.ui.warn_message(
+                f"Your current debt is now {new_debt:.2f} credits."
+            )
+
+
+register_command(
+    ["wait", "w"],
+    wait_command,
+    [Argument("duration", str, False)],
+)
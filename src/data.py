@@ -1,10 +1,10 @@
 from dataclasses import dataclass
 import random
-from random import choice
 from enum import Enum, auto
 from typing import Dict, Optional, List, Tuple
 
 from src.classes.ore import Ore, ORES, PurityLevel
+from src.helpers import get_rng
 
 # Import Mineral and MineralQuality at the top level
 from src.classes.mineral import Mineral, MineralQuality
@@ -558,10 +558,13 @@ SYSTEM_TEMPLATES = {
 }
 
 
-def select_system_template() -> SystemTemplate:
+def select_system_template(rng: Optional[random.Random] = None) -> SystemTemplate:
     """
     Select a random system template based on generation weights.
 
+    Args:
+        rng: Random stream to draw from (defaults to the global random module)
+
     Returns:
         A SystemTemplate to use for generating a solar system
     """
@@ -570,7 +573,7 @@ def select_system_template() -> SystemTemplate:
 
     # Use weighted random selection
     total_weight = sum(weights)
-    random_value = random.uniform(0, total_weight)
+    random_value = get_rng(rng).uniform(0, total_weight)
 
     cumulative_weight = 0.0
     for template, weight in zip(templates, weights):
@@ -583,7 +586,11 @@ def select_system_template() -> SystemTemplate:
 
 
 def generate_system_from_template(
-    name: str, x: float, y: float, template: SystemTemplate
+    name: str,
+    x: float,
+    y: float,
+    template: SystemTemplate,
+    rng: Optional[random.Random] = None,
 ) -> dict:
     """
     Generate solar system parameters from a template.
@@ -593,31 +600,32 @@ def generate_system_from_template(
         x: X coordinate in the region
         y: Y coordinate in the region
         template: SystemTemplate to use for generation
+        rng: Random stream to draw from (defaults to the global random module)
 
     Returns:
         Dictionary of parameters for SolarSystem constructor
     """
-    import random
+    rng = get_rng(rng)
 
     # Generate basic system parameters
-    size = round(random.uniform(*template.size_range), 2)
-    field_quantity = random.randint(*template.field_quantity_range)
-    station_quantity = random.randint(*template.station_quantity_range)
+    size = round(rng.uniform(*template.size_range), 2)
+    field_quantity = rng.randint(*template.field_quantity_range)
+    station_quantity = rng.randint(*template.station_quantity_range)
 
     # Select security level and economy type
-    security_level = random.choice(template.security_levels)
-    economy_type = random.choice(template.economy_types)
+    security_level = rng.choice(template.security_levels)
+    economy_type = rng.choice(template.economy_types)
 
     # Generate population and tech level
-    population = random.randint(*template.population_range)
-    tech_level = random.randint(*template.tech_level_range)
+    population = rng.randint(*template.population_range)
+    tech_level = rng.randint(*template.tech_level_range)
 
     # Generate anomalies if applicable
     anomalies = []
-    if template.possible_anomalies and random.random() < template.anomaly_chance:
-        num_anomalies = random.randint(
+    if template.possible_anomalies and rng.random() < template.anomaly_chance:
+        num_anomalies = rng.randint(
             1, min(2, len(template.possible_anomalies)))
-        anomalies = random.sample(template.possible_anomalies, num_anomalies)
+        anomalies = rng.sample(template.possible_anomalies, num_anomalies)
 
     return {
         "name": name,
@@ -821,8 +829,9 @@ name_parts = [
 ]
 
 
-def generate_random_name(parts_num: int) -> str:
-    return ("".join(choice(name_parts) for _ in range(parts_num))).capitalize()
+def generate_random_name(parts_num: int, rng: Optional[random.Random] = None) -> str:
+    rng = get_rng(rng)
+    return ("".join(rng.choice(name_parts) for _ in range(parts_num))).capitalize()
 
 
 @dataclass
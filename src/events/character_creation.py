@@ -1,11 +1,11 @@
 from typing import Dict, cast, Any
 from colorama import init, Fore
-import pygame as pg
 
 from src.classes.game import Game
 from src.classes.contacts import get_contact
 from src.helpers import is_valid_int
 from src.data import SHIP_TEMPLATES, BACKGROUND_BONUSES
+from src.utils import audio
 
 init(autoreset=True)
 
@@ -2589,9 +2589,7 @@ def character_creation_event(
 
     if enable_sound:
         game_state.ui.info_message(Fore.GREEN + "Audio notifications enabled.")
-        # Initialize pygame mixer
-        pg.mixer.init()
-        pg.mixer.music.set_volume(0.5)
+        audio.init_mixer(volume=0.5)
     else:
         game_state.ui.info_message(
             Fore.GREEN + "Audio notifications disabled.")
@@ -2925,7 +2923,7 @@ def quick_start(game_state: "Game"):
         )
     else:
         # No station available, position ship at system center
-        from pygame import Vector2
+        from src.helpers import Vector2
 
         game_state.player_ship.space_object.position = Vector2(0, 0)
         game_state.ui.info_message(
@@ -230,7 +230,7 @@ class AntimatterFluctuation(FTLEvent):
             elif choice == "2":
                 # Take extra time but improve containment
                 time_needed = self.severity * 300  # seconds
-                game_state.global_time += time_needed
+                game_state.advance_time(time_needed)
                 player_ship.containment_integrity += integrity_drop * 0.75
                 player_ship.containment_failure_risk -= risk_increase * 0.75
                 print(
@@ -303,7 +303,7 @@ class SpacetimeDisruption(FTLEvent):
             # Minor - just a delay or time save
             time_effect = random.choice(
                 [-1800, -900, 900, 1800])  # +/- 15-30 minutes
-            game_state.global_time += time_effect
+            game_state.advance_time(time_effect)
 
             if time_effect < 0:
                 print(
@@ -398,7 +398,7 @@ class SpacetimeDisruption(FTLEvent):
                 elif choice == "2":
                     added_time = round(random.uniform(
                         3600, 7200), 2)  # 1-2 hours
-                    game_state.global_time += int(added_time)
+                    game_state.advance_time(int(added_time))
                     print(
                         f"{Fore.YELLOW}You plot a safer course around the disruption.{Style.RESET_ALL}"
                     )
@@ -445,7 +445,7 @@ class SpacetimeDisruption(FTLEvent):
                 elif luck < 0.8:  # Neutral outcome
                     time_effect = int(random.uniform(
                         1800, 3600))  # 30-60 min delay
-                    game_state.global_time += int(time_effect)
+                    game_state.advance_time(int(time_effect))
                     print(
                         f"{Fore.YELLOW}Your ship is buffeted by the disruption but survives intact.{Style.RESET_ALL}"
                     )
@@ -1,9 +1,9 @@
 from src.classes.ore import ORES
+import hashlib
 import math
 import random
-from typing import Union, Optional, TYPE_CHECKING
+from typing import Iterator, Union, Optional, TYPE_CHECKING
 
-from pygame import Vector2
 from src.classes.ore import Ore
 
 if TYPE_CHECKING:
@@ -14,16 +14,194 @@ if TYPE_CHECKING:
     from src.classes.game import Game
 
 
+VECTOR_EPSILON = 1e-6  # pygame.math.Vector2's default epsilon
+
+
+class Vector2:
+    """
+    Minimal 2D vector covering the parts of pygame.Vector2 the game uses, so
+    the simulation doesn't need pygame. Vector2(x, y), Vector2((x, y)),
+    Vector2(other) and Vector2(n) (both components n) are all accepted.
+    """
+
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: Union[float, "Vector2", tuple] = 0.0, y: Optional[float] = None) -> None:
+        if y is None:
+            if isinstance(x, (int, float)):
+                y = x
+            else:
+                x, y = x
+        self.x = float(x)
+        self.y = float(y)
+
+    def __iter__(self) -> Iterator[float]:
+        yield self.x
+        yield self.y
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y)[index]
+
+    def __eq__(self, other: object) -> bool:
+        # Components within VECTOR_EPSILON of each other count as equal, as in pygame
+        try:
+            ox, oy = other  # type: ignore[misc]
+            return (
+                math.isclose(self.x, ox, rel_tol=0.0, abs_tol=VECTOR_EPSILON)
+                and math.isclose(self.y, oy, rel_tol=0.0, abs_tol=VECTOR_EPSILON)
+            )
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like pygame's
+
+    def __bool__(self) -> bool:
+        return self.x != 0.0 or self.y != 0.0
+
+    def __add__(self, other: "Vector2") -> "Vector2":
+        ox, oy = other
+        return Vector2(self.x + ox, self.y + oy)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: "Vector2") -> "Vector2":
+        ox, oy = other
+        return Vector2(self.x - ox, self.y - oy)
+
+    def __rsub__(self, other: "Vector2") -> "Vector2":
+        ox, oy = other
+        return Vector2(ox - self.x, oy - self.y)
+
+    def __mul__(self, scalar: float) -> "Vector2":
+        return Vector2(self.x * scalar, self.y * scalar)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float) -> "Vector2":
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __neg__(self) -> "Vector2":
+        return Vector2(-self.x, -self.y)
+
+    def copy(self) -> "Vector2":
+        return Vector2(self.x, self.y)
+
+    def length(self) -> float:
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def length_squared(self) -> float:
+        return self.x * self.x + self.y * self.y
+
+    def distance_to(self, other: "Vector2") -> float:
+        return math.sqrt(self.distance_squared_to(other))
+
+    def distance_squared_to(self, other: "Vector2") -> float:
+        ox, oy = other
+        dx = self.x - ox
+        dy = self.y - oy
+        return dx * dx + dy * dy
+
+    def __repr__(self) -> str:
+        return f"<Vector2({self.x:g}, {self.y:g})>"
+
+    def __str__(self) -> str:
+        return f"[{self.x:g}, {self.y:g}]"
+
+
 def euclidean_distance(v1: Vector2, v2: Vector2) -> float:
     return round(math.sqrt((v1.x - v2.x) ** 2 + (v1.y - v2.y) ** 2), 2)
 
 
-def rnd_float(min_val: float, max_val: float) -> float:
-    return round(min_val + random.random() * (max_val - min_val), 2)
+# Shared generator for draws that are not given a stream; seeded by seed_rng()
+_GLOBAL_RNG = random.Random()
+
+
+def get_rng(rng: Optional[random.Random] = None) -> random.Random:
+    """Return rng, or the shared global generator if no stream was given."""
+    return rng if rng is not None else _GLOBAL_RNG
+
+
+def seed_rng(seed: int) -> None:
+    """
+    Seed the global randomness: the random module's functions and the shared
+    generator behind get_rng(). The latter gets its own derived seed so the two
+    don't replay the same sequence.
+    """
+    random.seed(seed)
+    _GLOBAL_RNG.seed(derive_seed(seed, "global"))
+
+
+def derive_seed(seed: int, *path: Union[str, int]) -> int:
+    """
+    Derive a 64-bit seed for the generation stream identified by path.
+
+    The same seed and path always give the same result, independent of any other
+    stream, e.g. derive_seed(seed, "region", "Local Sector", "system", "Vega").
+    """
+    key = "/".join([str(seed), *(str(part) for part in path)]).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big")
+
 
+def derive_rng(seed: int, *path: Union[str, int]) -> random.Random:
+    """Create an independent random stream for the given seed and path."""
+    return random.Random(derive_seed(seed, *path))
 
-def rnd_int(min_val: int, max_val: int) -> int:
-    return random.randint(min_val, max_val)
+
+def rnd_float(
+    min_val: float, max_val: float, rng: Optional[random.Random] = None
+) -> float:
+    return round(min_val + get_rng(rng).random() * (max_val - min_val), 2)
+
+
+def rnd_int(min_val: int, max_val: int, rng: Optional[random.Random] = None) -> int:
+    return get_rng(rng).randint(min_val, max_val)
+
+
+def rnd_binomial(trials: int, p: float, rng: Optional[random.Random] = None) -> int:
+    """
+    Number of successes in trials independent draws that each succeed with
+    probability p.
+
+    Jumps from one success to the next over geometrically distributed runs of
+    failures, so it costs O(trials * p) rather than one draw per trial.
+    """
+    if trials <= 0 or p <= 0.0:
+        return 0
+    if p >= 1.0:
+        return trials
+    generator = get_rng(rng)
+    if p > 0.5:
+        return trials - rnd_binomial(trials, 1.0 - p, generator)
+    log_q = math.log1p(-p)
+    successes = 0
+    position = 0
+    while True:
+        position += int(math.log(1.0 - generator.random()) / log_q) + 1
+        if position > trials:
+            return successes
+        successes += 1
+
+
+def rnd_poisson(mean: float, rng: Optional[random.Random] = None) -> int:
+    """
+    Number of events in a stretch of a Poisson process that expects mean
+    events over it.
+
+    Steps from one event to the next over exponentially distributed gaps, so
+    it costs O(mean) draws.
+    """
+    if mean <= 0.0:
+        return 0
+    generator = get_rng(rng)
+    events = 0
+    position = generator.expovariate(1.0)
+    while position < mean:
+        events += 1
+        position += generator.expovariate(1.0)
+    return events
 
 
 def rnd_vector(min_val: float, max_val: float) -> Vector2:
@@ -107,7 +285,9 @@ def get_closest_field(
         )
     else:
         # Handle when we receive a SolarSystem object
-        sorted_fields_result: list[AsteroidField] = solar_system.sort_fields("asc", "distance", position)
+        sorted_fields_result: list[AsteroidField] = solar_system.get_nearest_fields(
+            position, 2 if is_at_field else 1
+        )
         if is_at_field:
             return sorted_fields_result[1]
         return sorted_fields_result[0]
@@ -150,7 +330,9 @@ def get_closest_station(
         )
     else:
         # Handle when we receive a SolarSystem object
-        sorted_stations_result: list[Station] = solar_system.sort_stations("asc", "distance", position)
+        sorted_stations_result: list[Station] = solar_system.get_nearest_stations(
+            position, 2 if is_at_station else 1
+        )
         if is_at_station:
             return sorted_stations_result[1]
         return sorted_stations_result[0]
@@ -30,11 +30,10 @@ from src.commands import (
     Argument,
 )
 from src.command_handlers import process_command
-from pygame import Vector2 
 import src.events
-import pygame as pg
 from colorama import init
-from src.helpers import is_valid_int, is_valid_float, is_valid_bool
+from src.helpers import Vector2, is_valid_int, is_valid_float, is_valid_bool
+from src.utils import audio
 
 init(autoreset=True)
 
@@ -49,7 +48,7 @@ CHARACTER_BACKGROUND = "Belter"
 CHARACTER_STARTING_CREDS = 1000.0
 CHARACTER_STARTING_DEBT = 0.0
 
-SHIP_POSITION = pg.math.Vector2(0, 0)  # Placeholder for actual position
+SHIP_POSITION = Vector2(0, 0)  # Placeholder for actual position
 SHIP_SPEED = 1e-08  # Base speed in AU/s
 SHIP_FUEL_CAPACITY = 100
 SHIP_FUEL_CONSUMPTION = 0.05
@@ -170,6 +169,13 @@ def start_repl(args: argparse.Namespace):
         mute_flag=args.mute if hasattr(args, "mute") else False,
         skip_customization=args.skipc if hasattr(args, "skipc") else False,
         seed=args.seed if hasattr(args, "seed") else None,
+        lazy_generation=args.lazy if hasattr(args, "lazy") else False,
+        workers=args.workers if hasattr(args, "workers") else 1,
+        cache_dir=(
+            None
+            if getattr(args, "no_cache", False)
+            else getattr(args, "cache_dir", None)
+        ),
     )
 
     if game_state.sound_enabled:
@@ -257,7 +263,6 @@ def run_game_loop(game_state):
             process_command(game_state, command_input)
         except ValueError as e:
             print(f"Invalid command: {e}")
-        pg.time.wait(100)
     # Perform necessary cleanup operations here
     print("Performing cleanup operations before exiting the game.")
-    pg.quit()
+    audio.shutdown()
@@ -0,0 +1,51 @@
+"""Audio playback.
+
+pygame is only imported the first time sound is actually used, so a muted or
+scripted game never loads it.
+"""
+
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def _pygame() -> Optional[ModuleType]:
+    try:
+        import pygame
+    except ImportError:
+        return None
+    return pygame
+
+
+def init_mixer(volume: Optional[float] = None) -> bool:
+    """Initialize the mixer, returning False if audio is unavailable."""
+    pg = _pygame()
+    if pg is None:
+        return False
+    try:
+        pg.mixer.init()
+        if volume is not None:
+            pg.mixer.music.set_volume(volume)
+    except pg.error:
+        return False
+    return True
+
+
+def play_music(path: str, loops: int = -1) -> bool:
+    """Start looping the music file at path, returning False if it could not be played."""
+    pg = _pygame()
+    if pg is None or not init_mixer():
+        return False
+    try:
+        pg.mixer.music.load(path)
+        pg.mixer.music.play(loops)
+    except pg.error:
+        return False
+    return True
+
+
+def shutdown() -> None:
+    """Release audio resources, if pygame was ever loaded."""
+    pg = sys.modules.get("pygame")
+    if pg is not None:
+        pg.quit()
@@ -0,0 +1,271 @@
+"""On-disk cache of generated galaxies.
+
+A region is fully determined by its name, seed and size and by the generator
+code, so the result of generating it can be stored once and reused by every
+later start with the same seed.
+
+Each cache file holds a binary snapshot of one region:
+
+    MAGIC | header length (8 bytes, little endian) | header | system blobs
+
+The header is a pickled dict with the generator version, the region name and,
+for every system, the stub it was generated from (params, seed and index) and
+the (offset, length) of its pickled SolarSystem. Files are memory-mapped on
+load and systems are only unpickled when they are first needed, so a lazy
+start reads nothing but the header. Systems that were still stubs when the
+cache was written have no blob and are generated from their stub as usual; a
+lazy start appends each one it generates to the file, so the cache fills up
+as the galaxy is explored.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import mmap
+import os
+import pickle
+import struct
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.classes.region import Region, RegionSystem, SolarSystemStub
+from src.classes.solar_system import SolarSystem
+
+DEFAULT_CACHE_DIR = "cache"
+MAGIC = b"RSMGLXY2"
+_HEADER_LENGTH = struct.Struct("<Q")
+
+# Bump when generation changes in a way the source fingerprint below can't see
+GENERATOR_VERSION = 1
+
+# Modules whose code decides what a generated galaxy looks like
+GENERATOR_MODULES = (
+    "src.classes.region",
+    "src.classes.solar_system",
+    "src.classes.celestial_body",
+    "src.classes.habitability",
+    "src.classes.space_object",
+    "src.classes.asteroid",
+    "src.classes.station",
+    "src.classes.commodity",
+    "src.classes.ore",
+    "src.classes.mineral",
+    "src.data",
+    "src.helpers",
+)
+
+
+@lru_cache(maxsize=None)
+def generator_version() -> str:
+    """
+    Return a fingerprint of the galaxy generator.
+
+    Combines GENERATOR_VERSION with the source of the generator modules, so
+    any change to the generation code invalidates existing cache files.
+    """
+    digest = hashlib.blake2b(str(GENERATOR_VERSION).encode(), digest_size=8)
+    for module in GENERATOR_MODULES:
+        spec = importlib.util.find_spec(module)
+        if spec is None or spec.origin is None:
+            continue
+        with open(spec.origin, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+class CachedSystemStub(SolarSystemStub):
+    """Stub whose system is read from a cache file instead of being generated."""
+
+    __slots__ = ("_snapshot",)
+
+    def __init__(self, params: Dict[str, Any], seed: int, index: int, snapshot: "GalaxySnapshot"):
+        super().__init__(params, seed, index)
+        self._snapshot = snapshot
+
+    @property
+    def is_cached(self) -> bool:
+        """Whether the cache file holds the generated system."""
+        return self._snapshot.has_system(self.index)
+
+    def materialize(self) -> SolarSystem:
+        system = self._snapshot.load_system(self.index)
+        if system is None:
+            system = super().materialize()
+            if self._snapshot.write_back:
+                self._snapshot.add_system(self.index, system)
+        return system
+
+    def __reduce__(self):
+        # The memory map can't cross processes, send a plain stub instead
+        return (SolarSystemStub, (self.params, self.seed, self.index))
+
+
+def _write_cache_file(path: str, header: Dict[str, Any], blobs: Sequence[bytes]) -> None:
+    """Write a cache file atomically, so readers only ever see a complete one."""
+    header_bytes = pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as cache_file:
+        cache_file.write(MAGIC)
+        cache_file.write(_HEADER_LENGTH.pack(len(header_bytes)))
+        cache_file.write(header_bytes)
+        for blob in blobs:
+            cache_file.write(blob)
+    os.replace(temp_path, path)
+
+
+class GalaxySnapshot:
+    """
+    A memory-mapped cache file giving access to its systems by index.
+
+    With write_back set, add_system is called for every system that has to
+    be generated because the file has no blob for it.
+    """
+
+    def __init__(self, path: str, write_back: bool = False):
+        self.path = path
+        self.write_back = write_back
+        self._open()
+
+    def _open(self) -> None:
+        with open(self.path, "rb") as cache_file:
+            self._map = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a galaxy cache file")
+        start = len(MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._map, len(MAGIC))
+        self._data_start = start + header_length
+        self.header: Dict[str, Any] = pickle.loads(self._map[start:self._data_start])
+
+    @property
+    def version(self) -> str:
+        return self.header["version"]
+
+    @property
+    def region_name(self) -> str:
+        return self.header["name"]
+
+    def __len__(self) -> int:
+        return len(self.header["systems"])
+
+    def has_system(self, index: int) -> bool:
+        """Whether system index was cached."""
+        return self.header["systems"][index][4] > 0
+
+    def load_system(self, index: int) -> Optional[SolarSystem]:
+        """Unpickle system index, or return None if it was not cached."""
+        _, _, _, offset, length = self.header["systems"][index]
+        if length == 0:
+            return None
+        start = self._data_start + offset
+        return pickle.loads(self._map[start:start + length])
+
+    def add_system(self, index: int, system: SolarSystem) -> None:
+        """
+        Add the blob of a freshly generated system index to the file.
+
+        The blob is appended after the existing ones, which keep their
+        offsets. The system must not have been played in yet. If the file
+        can't be rewritten the snapshot is left as it was, the system will
+        just be generated again next time.
+        """
+        blob = pickle.dumps(system, protocol=pickle.HIGHEST_PROTOCOL)
+        entries = list(self.header["systems"])
+        params, seed, stub_index, _, _ = entries[index]
+        entries[index] = (params, seed, stub_index, len(self._map) - self._data_start, len(blob))
+        try:
+            _write_cache_file(
+                self.path,
+                dict(self.header, systems=entries),
+                [self._map[self._data_start:], blob],
+            )
+            old_map = self._map
+            self._open()
+        except (OSError, ValueError):
+            return
+        old_map.close()
+
+    def to_region(self) -> Region:
+        """Build a region whose systems are loaded from this snapshot on demand."""
+        region = Region(self.region_name)
+        for params, seed, index, _, _ in self.header["systems"]:
+            region.add_system(CachedSystemStub(params, seed, index, self))
+        return region
+
+
+class GalaxyCache:
+    """Directory of galaxy snapshots keyed by seed, region size and generator version."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _file_prefix(self, seed: int, num_systems: int) -> str:
+        return os.path.join(self.cache_dir, f"galaxy_{seed}_{num_systems}_")
+
+    def path_for(self, seed: int, num_systems: int) -> str:
+        return self._file_prefix(seed, num_systems) + f"{generator_version()}.bin"
+
+    def load(
+        self, name: str, seed: int, num_systems: int, write_back: bool = False
+    ) -> Optional[Region]:
+        """
+        Return the cached region for this seed and size, or None on a miss.
+
+        Unreadable or mismatching files count as a miss. With write_back,
+        systems the file has no blob for are added to it once generated.
+        """
+        path = self.path_for(seed, num_systems)
+        if not os.path.exists(path):
+            return None
+        try:
+            snapshot = GalaxySnapshot(path, write_back)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, struct.error):
+            return None
+        if (
+            snapshot.version != generator_version()
+            or snapshot.region_name != name
+            or len(snapshot) != num_systems
+        ):
+            return None
+        return snapshot.to_region()
+
+    def store(
+        self,
+        name: str,
+        seed: int,
+        stubs: Sequence[SolarSystemStub],
+        systems: Sequence[RegionSystem],
+    ) -> str:
+        """
+        Write a snapshot of a freshly generated region and return its path.
+
+        stubs are the stubs the region was generated from and systems the
+        region's current entries; entries that are still stubs are stored
+        without a blob. Files for the same seed and size written by another
+        generator version are removed.
+        """
+        blobs: List[bytes] = []
+        entries: List[Tuple[Dict[str, Any], int, int, int, int]] = []
+        offset = 0
+        for stub, system in zip(stubs, systems):
+            blob = b""
+            if not isinstance(system, SolarSystemStub):
+                blob = pickle.dumps(system, protocol=pickle.HIGHEST_PROTOCOL)
+            entries.append((stub.params, stub.seed, stub.index, offset, len(blob)))
+            blobs.append(blob)
+            offset += len(blob)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path_for(seed, len(entries))
+        _write_cache_file(
+            path,
+            {"version": generator_version(), "name": name, "systems": entries},
+            blobs,
+        )
+
+        for stale in glob.glob(self._file_prefix(seed, len(entries)) + "*.bin"):
+            if stale != path:
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        return path